@@ -0,0 +1,305 @@
+import queue
+import threading
+
+import cv2
+import numpy as np
+import torch
+from ultralytics.trackers import TrackAggregator, track_result
+from ultralytics.trackers.track import TRACKER_MAP
+from ultralytics.utils import YAML, IterableSimpleNamespace
+from ultralytics.utils.checks import check_yaml
+
+# ================= 热力图工具函数 =================
+def find_heatmap_layer(model):
+    """
+    定位用于生成热力图的目标层
+    :param model: YOLO 模型
+    :return: (目标层模块, 层名称)，未找到时目标层为 None
+    """
+    target_layer = None
+    layer_name = "Unknown"
+
+    # --- Robust Layer Finding (Index Based) ---
+    try:
+        if hasattr(model.model, 'model'):
+            model_layers = model.model.model
+
+            # Check for CBAM model heuristic
+            is_cbam_model = False
+            for m in model_layers:
+                if 'CBAM' in m.__class__.__name__:
+                    is_cbam_model = True
+                    break
+
+            if is_cbam_model:
+                # CBAM Model: Layer 9 is CBAM. We want to hook CBAM layer.
+                if len(model_layers) > 9:
+                    target_layer = model_layers[9]
+                    layer_name = f"Layer 9 ({target_layer.__class__.__name__})"
+                elif len(model_layers) > 10:
+                    # Fallback to SPPF if Layer 9 is somehow not right (unlikely based on yaml)
+                    target_layer = model_layers[10]
+                    layer_name = f"Layer 10 ({target_layer.__class__.__name__})"
+            else:
+                # Baseline Model: Layer 9 is SPPF.
+                if len(model_layers) > 9:
+                    target_layer = model_layers[9]
+                    layer_name = f"Layer 9 ({target_layer.__class__.__name__})"
+
+    except Exception as e:
+        print(f"Error accessing model layers: {e}")
+
+    # Fallback: Search by name
+    if target_layer is None:
+        for m in model.model.modules():
+            if m.__class__.__name__ == 'SPPF':
+                target_layer = m
+                layer_name = "SPPF (Module Search)"
+                break
+
+    # Refine target for CBAM: If it has spatial_attention, hook that for a cleaner heatmap
+    if target_layer and hasattr(target_layer, 'spatial_attention'):
+        target_layer = target_layer.spatial_attention
+        layer_name += " (SpatialAttention)"
+
+    return target_layer, layer_name
+
+# 热力图特征抽头名称，检测结果中通过 result.features[HEATMAP_TAP] 取得
+HEATMAP_TAP = "heatmap"
+
+def reduce_heatmap(x):
+    """在推理设备上将 (N, C, H, W) 特征归约为 (N, 1, H, W)，只保留热力图所需的数据"""
+    # Clamp negative values to 0 (SiLU/ReLU outputs) before averaging over channels
+    return x.clamp(min=0).mean(1, keepdim=True)
+
+def register_heatmap_tap(model):
+    """
+    在模型上注册热力图特征抽头 (只需注册一次，之后每次 predict 都会随 Results 返回)
+    :param model: YOLO 模型
+    :return: 目标层名称，未找到目标层时返回 None
+    """
+    target_layer, layer_name = find_heatmap_layer(model)
+    if target_layer is None:
+        print("DEBUG: No target layer found for heatmap")
+        return None
+    model.add_feature_tap(HEATMAP_TAP, target_layer, reduce=reduce_heatmap)
+    return layer_name
+
+class HeatmapRenderer:
+    """
+    批量热力图渲染器 (全部为张量运算，整批帧一次完成)
+    - 逐帧 min-max 归一化，F.interpolate 双线性缩放到原图尺寸
+    - JET 伪彩色: 由 cv2.COLORMAP_JET 生成的 256 项查找表，通过张量索引 (gather) 上色
+    - 与原图按 alpha 混合，整批只拷回 CPU 一次
+    """
+
+    def __init__(self, alpha=0.5):
+        """
+        :param alpha: 热力图叠加权重
+        """
+        self.alpha = alpha
+        # (256, 3) BGR 查找表，与 cv2.applyColorMap(..., COLORMAP_JET) 逐值一致
+        lut = cv2.applyColorMap(np.arange(256, dtype=np.uint8)[:, None], cv2.COLORMAP_JET)[:, 0]
+        self.lut = torch.from_numpy(lut)
+
+    @torch.inference_mode()
+    def __call__(self, activations, frames):
+        """
+        :param activations: (N, 1, h, w) 热力图或 (N, C, h, w) 特征图 (C > 1 时先截断负值再按通道求均值)
+        :param frames: N 张同尺寸 BGR 原图 (HxWx3 uint8 列表)
+        :return: (N, H, W, 3) uint8 BGR 叠加图；没有正激活的帧保持原图
+        """
+        device = activations.device
+        x = activations.float()
+        if x.shape[1] > 1:
+            x = x.clamp(min=0).mean(1, keepdim=True)
+        n = x.shape[0]
+
+        # 1. 逐帧归一化到 [0, 255] (在小尺寸特征图上完成)
+        flat = x.flatten(1)
+        mn, mx = flat.amin(1).view(n, 1, 1, 1), flat.amax(1).view(n, 1, 1, 1)
+        valid = mx > 0  # 整层无正激活时不叠加
+        x = ((x - mn) * torch.where(mx > mn, 255 / (mx - mn), torch.zeros_like(mx))).floor_()
+
+        # 2. 缩放到原图尺寸并查表上色
+        img = torch.from_numpy(np.stack(frames)).to(device)
+        x = torch.nn.functional.interpolate(x, size=img.shape[1:3], mode="bilinear", align_corners=False)
+        self.lut = self.lut.to(device)
+        heat = self.lut[x[:, 0].round_().clamp_(0, 255).long()]  # (N, H, W, 3)
+
+        # 3. 与原图混合
+        out = img.float().mul_(1 - self.alpha).add_(heat.float().mul_(self.alpha)).round_()
+        out = torch.where(valid, out, img.float()) if not valid.all() else out
+        return out.to(torch.uint8).cpu().numpy()
+
+# ================= 双模型视频对比引擎 =================
+class DualModelComparator:
+    """
+    基线 / 改进模型视频对比引擎
+    - 视频只解码一次，两个模型共享同一批帧
+    - 每个模型每次前向处理 batch_size 帧，检测结果与热力图 (特征抽头) 来自同一次前向
+    - 解码线程、主线程推理、写入线程三段流水线重叠执行
+    - 可选跟踪: 每个模型独立跟踪，同一个坑洼跨帧只计为一条记录 (TrackAggregator)，记录可增量写入 NPZ/Parquet
+    输出为 2x2 网格: 上: 检测框 (基线 | 改进)，下: 热力图 (基线 | 改进)
+    """
+
+    def __init__(self, model_base, model_cbam, batch_size=8, conf=0.25, queue_size=32,
+                 labels=(("Baseline Det", "Baseline Feature"), ("CBAM Det", "CBAM Attention")),
+                 colors=((0, 0, 255), (0, 255, 0)), alpha=0.5, track=False, tracker="bytetrack.yaml"):
+        """
+        :param model_base: 基线模型 (YOLO)
+        :param model_cbam: 改进模型 (YOLO)
+        :param batch_size: 每次前向推理的帧数
+        :param conf: 置信度阈值
+        :param queue_size: 解码 / 写入队列的最大长度 (限制内存占用)
+        :param labels: 每个模型的 (检测标题, 热力图标题)
+        :param colors: 每个模型的标题颜色 (BGR)
+        :param alpha: 热力图叠加权重
+        :param track: 是否跟踪并按目标去重计数 (检测框上显示跟踪 ID)
+        :param tracker: 跟踪器配置文件 (bytetrack.yaml / botsort.yaml)
+        """
+        self.models = (model_base, model_cbam)
+        self.track = track
+        self.tracker_cfg = IterableSimpleNamespace(**YAML.load(check_yaml(tracker))) if track else None
+        self.batch_size = max(int(batch_size), 1)
+        self.conf = conf
+        self.queue_size = queue_size
+        self.labels = labels
+        self.colors = colors
+        self.renderer = HeatmapRenderer(alpha)
+        for m in self.models:
+            if HEATMAP_TAP not in m.feature_taps:
+                register_heatmap_tap(m)
+
+    def _read_frames(self, cap, frames, stop):
+        """解码线程: 逐帧读取视频放入有界队列，结束时放入 None"""
+        try:
+            while not stop.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                frames.put(frame)
+        finally:
+            frames.put(None)
+
+    def _write_frames(self, writer, grids, errors):
+        """写入线程: 从队列取出合成帧并编码写入，遇到 None 结束"""
+        while True:
+            grid = grids.get()
+            if grid is None:
+                break
+            try:
+                writer.write(grid)
+            except Exception as e:
+                errors.append(e)
+
+    def _make_tracker(self, fps):
+        """为一段视频创建新的跟踪器 (不在模型上注册回调，避免影响共享模型的普通预测)"""
+        return TRACKER_MAP[self.tracker_cfg.tracker_type](args=self.tracker_cfg, frame_rate=fps)
+
+    def _infer(self, model, frames):
+        """对一批帧执行一次前向，热力图随 Results.features 返回"""
+        return model.predict(frames, conf=self.conf, batch=len(frames), verbose=False)
+
+    def _render(self, frames, outputs, size, grids):
+        """将一批帧的检测结果与热力图拼接为 2x2 网格并送入写入队列"""
+        width, height = size
+        font = cv2.FONT_HERSHEY_SIMPLEX
+
+        # 每个模型整批渲染热力图 (张量运算，一次拷回 CPU)
+        heats = []
+        for results in outputs:
+            activations = [r.features.get(HEATMAP_TAP) for r in results]
+            if all(a is not None for a in activations):
+                heats.append(self.renderer(torch.stack(activations), frames))
+            else:
+                heats.append(np.stack(frames))  # 无热力图时显示原图
+
+        for i in range(len(frames)):
+            grid = np.empty((height * 2, width * 2, 3), dtype=np.uint8)
+            for j, results in enumerate(outputs):
+                det_title, heat_title = self.labels[j]
+                det, heat = results[i].plot(), heats[j][i]
+                cv2.putText(det, det_title, (30, 50), font, 1.2, self.colors[j], 3, cv2.LINE_AA)
+                cv2.putText(heat, heat_title, (30, 50), font, 1.2, self.colors[j], 3, cv2.LINE_AA)
+                grid[:height, j * width:(j + 1) * width] = det
+                grid[height:, j * width:(j + 1) * width] = heat
+            grids.put(grid)
+
+    def run(self, video_path, output_path, fourcc="mp4v", record_files=(None, None)):
+        """
+        处理整段视频并写出对比网格视频
+        :param video_path: 输入视频路径
+        :param output_path: 输出视频路径
+        :param fourcc: 输出编码
+        :param record_files: 跟踪模式下每个模型的目标记录文件 (.npz / .parquet)，None 表示只计数
+        :return: 统计信息 dict (frames, detections, 跟踪模式下另有 tracks: 每个模型的去重目标数)
+        """
+        cap = cv2.VideoCapture(video_path)
+        fps = int(cap.get(cv2.CAP_PROP_FPS)) or 30
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*fourcc), fps, (width * 2, height * 2))
+
+        frames_q = queue.Queue(maxsize=self.queue_size)
+        grids_q = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        errors = []
+        reader = threading.Thread(target=self._read_frames, args=(cap, frames_q, stop), daemon=True)
+        writer_thread = threading.Thread(target=self._write_frames, args=(writer, grids_q, errors), daemon=True)
+        reader.start()
+        writer_thread.start()
+
+        frame_count = 0
+        detections = [0, 0]
+        trackers, aggregators = [], []
+        if self.track:
+            trackers = [self._make_tracker(fps) for _ in self.models]
+            # 超过 2 秒未再出现的目标视为结束，其记录写出并释放内存
+            aggregators = [TrackAggregator(f, max_age=2 * fps) for f in record_files]
+        try:
+            done = False
+            while not done:
+                # 1. 凑齐一个 batch
+                batch = []
+                while len(batch) < self.batch_size:
+                    frame = frames_q.get()
+                    if frame is None:
+                        done = True
+                        break
+                    batch.append(frame)
+                if not batch:
+                    break
+
+                # 2. 每个模型对整批帧只做一次前向
+                outputs = [self._infer(m, batch) for m in self.models]
+                for j, results in enumerate(outputs):
+                    detections[j] += sum(len(r.boxes) for r in results)
+                if self.track:
+                    outputs = [[track_result(t, r) for r in results] for t, results in zip(trackers, outputs)]
+                    for agg, results in zip(aggregators, outputs):
+                        agg.update(results)
+
+                # 3. 渲染并交给写入线程
+                self._render(batch, outputs, (width, height), grids_q)
+                frame_count += len(batch)
+                print(f"   已处理 {frame_count} 帧...", end="\r")
+        finally:
+            stop.set()
+            # 清空解码队列，避免解码线程阻塞在 put 上
+            while reader.is_alive():
+                try:
+                    frames_q.get_nowait()
+                except queue.Empty:
+                    reader.join(timeout=0.1)
+            grids_q.put(None)
+            writer_thread.join()
+            cap.release()
+            writer.release()
+
+        if errors:
+            raise errors[0]
+        stats = {"frames": frame_count, "detections": tuple(detections)}
+        if self.track:
+            stats["tracks"] = tuple(agg.close() for agg in aggregators)
+        return stats
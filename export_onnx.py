@@ -1,5 +1,12 @@
 from ultralytics import YOLO
+from ultralytics.nn.modules import CBAM
+import argparse
 import os
+import sys
+
+# 修复 Windows 下中文乱码问题
+if sys.platform.startswith('win'):
+    os.system('chcp 65001 >nul')
 
 # 定义模型路径列表
 model_paths = [
@@ -7,19 +14,124 @@ model_paths = [
     r"Pothole_CBAM_Project/exp_cbam/weights/best.pt"           # 改进版本
 ]
 
-for path in model_paths:
-    if os.path.exists(path):
-        print(f"\n正在处理模型: {path}")
+# 导出变体: (名称, 格式, 额外导出参数)
+EXPORT_VARIANTS = {
+    "onnx-fp32": ("onnx", {}),
+    "onnx-fp16": ("onnx", {"half": True}),  # ONNX FP16 需要 GPU 导出
+    "openvino-fp32": ("openvino", {}),
+    "openvino-fp16": ("openvino", {"half": True}),
+    "openvino-int8": ("openvino", {"int8": True}),  # 需要 data 做量化校准
+}
+
+# 融合后的 CBAM 子图中不应出现的算子 (未融合时通道注意力会产生 4 个 1x1 Conv)
+UNFUSED_CHANNEL_OPS = {"Conv", "GlobalAveragePool", "GlobalMaxPool"}
+
+def cbam_layer_indices(model):
+    """返回模型中 CBAM 层的索引列表"""
+    return [i for i, m in enumerate(model.model.model) if isinstance(m, CBAM)]
+
+def check_cbam_subgraph(onnx_path, indices):
+    """
+    检查 ONNX 图中 CBAM 子图是否为融合后的紧凑形式
+    :param onnx_path: ONNX 文件路径
+    :param indices: CBAM 层索引
+    :return: 是否全部通过
+    """
+    try:
+        import onnx
+    except ImportError:
+        print("⚠️ 未安装 onnx，跳过 CBAM 子图检查")
+        return True
+
+    graph = onnx.load(onnx_path).graph
+    ok = True
+    for i in indices:
+        scope = f"/model.{i}/"
+        nodes = [n for n in graph.node if n.name.startswith(scope)]
+        ops = {}
+        for n in nodes:
+            ops[n.op_type] = ops.get(n.op_type, 0) + 1
+        channel_ops = {n.op_type for n in nodes if n.name.startswith(f"{scope}channel_attention/")}
+        fused = not (channel_ops & UNFUSED_CHANNEL_OPS) and ops.get("MatMul", 0) == 2
+        ok &= fused
+        summary = ", ".join(f"{k}x{v}" for k, v in sorted(ops.items()))
+        print(f"   {'✅' if fused else '⚠️'} Layer {i} CBAM: {len(nodes)} 个节点 ({summary})")
+    return ok
+
+def export_variants(path, variants, imgsz=640, opset=12, dynamic=False, data=None):
+    """
+    按变体导出模型
+    :return: {变体名称: 导出文件路径}
+    """
+    model = YOLO(path)
+    indices = cbam_layer_indices(model)
+    exported = {}
+    for name in variants:
+        fmt, extra = EXPORT_VARIANTS[name]
+        args = {"format": fmt, "imgsz": imgsz, "dynamic": dynamic, **extra}
+        if fmt == "onnx":
+            args.update(opset=opset, simplify=True)
+        if extra.get("int8"):
+            if not data:
+                print(f"⚠️ {name} 需要 --data 进行量化校准，已跳过")
+                continue
+            args["data"] = data
         try:
-            model = YOLO(path)
-            model.export(
-                format="onnx",
-                imgsz=640,
-                opset=12,
-                simplify=True
+            f = YOLO(path).export(**args)  # 每个变体使用全新的模型实例，避免 half/int8 状态相互影响
+            exported[name] = f
+            print(f"成功导出 {name}: {f}")
+            if fmt == "onnx" and indices:
+                check_cbam_subgraph(f, indices)
+        except Exception as e:
+            print(f"导出失败 {name}: {e}")
+    return exported
+
+def compare(path, exported, data, imgsz=640, device="cpu"):
+    """
+    在验证集上对比导出模型与原始 .pt 的延迟和精度
+    :return: [(名称, mAP50, mAP50-95, 推理耗时 ms/张)]
+    """
+    rows = []
+    for name, f in {"pytorch": path, **exported}.items():
+        try:
+            metrics = YOLO(f, task="detect").val(
+                data=data, imgsz=imgsz, batch=1, device=device, plots=False, verbose=False
             )
-            print(f"成功导出: {path}")
+            rows.append((name, metrics.box.map50, metrics.box.map, metrics.speed["inference"]))
         except Exception as e:
-            print(f"导出失败 {path}: {e}")
-    else:
-        print(f"文件不存在: {path}")
+            print(f"验证失败 {name}: {e}")
+
+    if rows:
+        base = rows[0] if rows[0][0] == "pytorch" else None
+        print(f"\n{'变体':<16}{'mAP50':>8}{'mAP50-95':>10}{'ms/张':>9}{'ΔmAP50-95':>11}{'加速比':>8}")
+        for name, map50, map5095, t in rows:
+            delta = f"{map5095 - base[2]:+.4f}" if base else "-"
+            speedup = f"{base[3] / t:.2f}x" if base and t > 0 else "-"
+            print(f"{name:<16}{map50:>8.4f}{map5095:>10.4f}{t:>9.1f}{delta:>11}{speedup:>8}")
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="导出 ONNX / OpenVINO 模型并与 .pt 对比延迟和精度")
+    parser.add_argument("--weights", nargs="+", default=model_paths, help="待导出的权重路径")
+    parser.add_argument("--variants", nargs="+", default=["onnx-fp32"], choices=list(EXPORT_VARIANTS),
+                        help="导出变体")
+    parser.add_argument("--imgsz", type=int, default=640, help="导出分辨率")
+    parser.add_argument("--opset", type=int, default=12, help="ONNX opset 版本")
+    parser.add_argument("--dynamic", action="store_true", help="导出动态 batch (及动态分辨率)")
+    parser.add_argument("--data", type=str, default="pothole_config.yaml", help="数据集配置 (INT8 校准与对比验证)")
+    parser.add_argument("--benchmark", action="store_true", help="导出后在验证集上对比延迟和 mAP")
+    parser.add_argument("--device", type=str, default="cpu", help="对比验证使用的设备")
+    args = parser.parse_args()
+
+    data = args.data if os.path.exists(args.data) else None
+    for path in args.weights:
+        if os.path.exists(path):
+            print(f"\n正在处理模型: {path}")
+            exported = export_variants(path, args.variants, args.imgsz, args.opset, args.dynamic, data)
+            if args.benchmark:
+                if data:
+                    compare(path, exported, data, args.imgsz, args.device)
+                else:
+                    print(f"⚠️ 找不到数据集配置 {args.data}，跳过对比验证")
+        else:
+            print(f"文件不存在: {path}")
@@ -0,0 +1,146 @@
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+from ultralytics import YOLO
+
+class ModelRegistry:
+    """
+    模型注册表: 每个权重文件只加载、融合、预热一次，并以小型实例池的形式在多线程间共享
+    - 每个池中的 YOLO 实例拥有独立的 predictor，同一时刻只借给一个请求，避免并发请求互相踩踏 predictor 状态
+    - 权重文件 (如 best.pt) 更新后自动热重载，无需重启服务；正在使用的旧实例归还时直接丢弃
+    - 记录每次加载与预热耗时
+    """
+
+    def __init__(self, pool_size=1, imgsz=640, setup=None, watch=True):
+        """
+        :param pool_size: 每个模型的实例数量 (即同一模型可同时处理的请求数)
+        :param imgsz: 预热推理的输入尺寸
+        :param setup: 可选，实例加载后、预热前调用的函数 setup(model)，如注册特征抽头
+        :param watch: 是否在借出实例时检查权重文件修改时间并自动热重载
+        """
+        self.pool_size = max(int(pool_size), 1)
+        self.imgsz = imgsz
+        self.setup = setup
+        self.watch = watch
+        self.entries = {}
+        self._lock = threading.Lock()
+
+    def _load(self, path):
+        """加载一个实例: 读取权重、融合、预热，返回 (模型, 加载耗时, 预热耗时)"""
+        t0 = time.perf_counter()
+        model = YOLO(path)
+        model.fuse()
+        if self.setup is not None:
+            self.setup(model)
+        t1 = time.perf_counter()
+        model.predict(np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8), verbose=False)  # 建立 predictor 并预热
+        t2 = time.perf_counter()
+        return model, t1 - t0, t2 - t1
+
+    def _fill(self, name, path):
+        """加载 pool_size 个实例放入池中，并更新代号与耗时统计"""
+        mtime = os.path.getmtime(path)  # 加载前读取，加载期间再次写入的权重会在下次检查时重载
+        models, load_time, warmup_time = [], 0.0, 0.0
+        for _ in range(self.pool_size):
+            model, t_load, t_warmup = self._load(path)
+            models.append(model)
+            load_time += t_load
+            warmup_time += t_warmup
+
+        with self._lock:
+            entry = self.entries[name]
+            entry["generation"] += 1
+            entry["path"] = path
+            entry["mtime"] = mtime
+            entry["load_time"] = load_time
+            entry["warmup_time"] = warmup_time
+            entry["loaded_at"] = time.time()
+            entry["reloading"] = False
+            for model in models:
+                entry["pool"].put((entry["generation"], model))
+        print(f"✅ [{name}] 已加载 {path} x{self.pool_size}: 加载 {load_time:.2f}s, 预热 {warmup_time:.2f}s")
+
+    def register(self, name, path):
+        """
+        注册并加载一个模型
+        :param name: 模型名称
+        :param path: 权重路径
+        """
+        with self._lock:
+            self.entries[name] = {"pool": queue.Queue(), "generation": 0, "reloading": True}
+        self._fill(name, path)
+
+    def reload(self, name, path=None):
+        """
+        热重载模型 (可指定新的权重路径)，新实例就绪后才替换旧实例，期间请求照常使用旧实例
+        :param name: 模型名称
+        :param path: 新权重路径，默认重新加载原路径
+        """
+        entry = self.entries[name]
+        path = path or entry["path"]
+        with self._lock:
+            entry["reloading"] = True
+        try:
+            self._fill(name, path)
+        except Exception as e:
+            with self._lock:
+                entry["reloading"] = False
+                try:
+                    entry["failed_mtime"] = os.path.getmtime(path)  # 同一版本不再重试，直到文件再次更新
+                except OSError:
+                    pass
+            print(f"❌ [{name}] 重载失败，继续使用旧模型: {e}")
+            raise
+
+    def _check_update(self, name):
+        """权重文件有更新时在后台线程中热重载"""
+        entry = self.entries[name]
+        try:
+            mtime = os.path.getmtime(entry["path"])
+        except OSError:
+            return
+        with self._lock:
+            if entry["reloading"] or mtime in (entry["mtime"], entry.get("failed_mtime")):
+                return
+            entry["reloading"] = True
+        print(f"🔄 [{name}] 检测到权重更新，后台重载中...")
+        threading.Thread(target=self._reload_quietly, args=(name,), daemon=True).start()
+
+    def _reload_quietly(self, name):
+        """后台重载，失败时保留旧模型"""
+        try:
+            self.reload(name)
+        except Exception:
+            pass
+
+    @contextmanager
+    def acquire(self, name):
+        """
+        借出一个模型实例，with 块结束后自动归还
+        :param name: 模型名称
+        """
+        if self.watch:
+            self._check_update(name)
+        entry = self.entries[name]
+        while True:
+            generation, model = entry["pool"].get()
+            if generation == entry["generation"]:
+                break  # 跳过热重载前的旧实例
+        try:
+            yield model
+        finally:
+            if generation == entry["generation"]:
+                entry["pool"].put((generation, model))
+
+    def status(self):
+        """返回各模型的加载信息文本"""
+        lines = []
+        for name, e in self.entries.items():
+            loaded = time.strftime("%H:%M:%S", time.localtime(e.get("loaded_at", 0)))
+            lines.append(f"{name}: {e.get('path')} (v{e['generation']}, x{self.pool_size}, 加载于 {loaded}, "
+                         f"加载 {e.get('load_time', 0):.2f}s, 预热 {e.get('warmup_time', 0):.2f}s)")
+        return "\n".join(lines)
@@ -1,6 +1,8 @@
 import cv2
 import sys
 import os
+import queue
+import threading
 from ultralytics import YOLO
 import time
 
@@ -8,12 +10,13 @@ import time
 if sys.platform.startswith('win'):
     os.system('chcp 65001 >nul')
 
-def process_video(source=0, weights="Pothole_CBAM_Project/exp_cbam/weights/best.pt", conf=0.25):
+def process_video(source=0, weights="Pothole_CBAM_Project/exp_cbam/weights/best.pt", conf=0.25, tiles=0):
     """
     实时视频预测
     :param source: 视频源，0 表示摄像头，或者传入视频文件路径
     :param weights: 模型权重路径
     :param conf: 置信度阈值
+    :param tiles: 切片推理的最大切片数 (0 为不切片)，高分辨率帧中远处的小坑洼检测效果更好
     """
     print(f"⏳ 正在加载模型: {weights} ...")
     try:
@@ -46,13 +49,12 @@ def process_video(source=0, weights="Pothole_CBAM_Project/exp_cbam/weights/best.
             print("视频结束或无法读取帧")
             break
 
-        # 执行推理
-        # stream=True 让推理更流畅，不积压内存
-        results = model.predict(frame, conf=conf, verbose=False)
+        # 执行推理 (单帧输入，结果列表只含一个 Results)
+        results = model.predict(frame, conf=conf, tiles=tiles, verbose=False)
         result = results[0]
 
         # 绘制结果
-        annotated_frame = result.plot()
+        annotated_frame = result.plot(inplace=True)  # 直接在原帧上绘制，省去整帧拷贝
 
         # 计算并显示 FPS
         curr_time = time.time()
@@ -72,6 +74,209 @@ def process_video(source=0, weights="Pothole_CBAM_Project/exp_cbam/weights/best.
     cap.release()
     cv2.destroyAllWindows()
 
+# ================= 流水线模式 =================
+def is_live_source(source):
+    """摄像头编号或网络流视为实时源，其余视为视频文件"""
+    return isinstance(source, int) or str(source).lower().startswith(("rtsp://", "rtmp://", "http://", "https://"))
+
+def put_latest(q, item):
+    """最新帧优先: 队列满时丢弃最旧的一项再放入，返回丢弃的数量"""
+    dropped = 0
+    while True:
+        try:
+            q.put_nowait(item)
+            return dropped
+        except queue.Full:
+            try:
+                q.get_nowait()
+                dropped += 1
+            except queue.Empty:
+                pass
+
+class VideoPipeline:
+    """
+    采集 / 推理 / 渲染三段式流水线
+    - 采集线程: cap.read() 放入采集队列
+    - 推理线程: model.predict() 放入渲染队列
+    - 渲染线程 (主线程，cv2.imshow 需在主线程调用): result.plot()、显示、写入文件
+    丢帧策略:
+    - latest:   队列满时丢弃旧帧，始终处理最新帧，延迟不会随时间累积 (适合实时摄像头)
+    - lossless: 队列满时阻塞上游，保证每帧按顺序处理 (适合视频文件)
+    """
+
+    def __init__(self, model, conf=0.25, policy="auto", queue_size=4, tiles=0):
+        """
+        :param model: YOLO 模型
+        :param conf: 置信度阈值
+        :param policy: 丢帧策略 'auto' | 'latest' | 'lossless'，auto 时实时源用 latest、文件用 lossless
+        :param queue_size: 各级队列长度 (latest 策略下固定为 1)
+        :param tiles: 切片推理的最大切片数 (0 为不切片)
+        """
+        self.model = model
+        self.conf = conf
+        self.tiles = tiles
+        self.policy = policy
+        self.queue_size = queue_size
+        self.latest = False
+        self.stop = threading.Event()
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def _put(self, q, item):
+        """按当前策略放入队列"""
+        if self.latest:
+            dropped = put_latest(q, item)
+            if dropped:
+                with self._lock:
+                    self.dropped += dropped
+        else:
+            while not self.stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+    def _get(self, q):
+        """从队列取出一项，停止时返回 None"""
+        while not self.stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return None
+
+    def _capture(self, cap, out_q):
+        """采集线程"""
+        try:
+            while not self.stop.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                self._put(out_q, (time.time(), frame))
+        finally:
+            # 结束标记必须送达，不参与丢帧
+            while not self.stop.is_set():
+                try:
+                    out_q.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    def _infer(self, in_q, out_q):
+        """推理线程"""
+        try:
+            while True:
+                item = self._get(in_q)
+                if item is None:
+                    break
+                t_capture, frame = item
+                result = self.model.predict(frame, conf=self.conf, tiles=self.tiles, verbose=False)[0]
+                self._put(out_q, (t_capture, result))
+        finally:
+            while not self.stop.is_set():
+                try:
+                    out_q.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    def run(self, source, save_path=None, show=True):
+        """
+        运行流水线直到视频结束或按下 'q'
+        :param source: 视频源 (摄像头编号 / 文件路径 / 网络流)
+        :param save_path: 可选，保存标注后视频的路径
+        :param show: 是否显示预览窗口
+        :return: 处理帧数
+        """
+        cap = cv2.VideoCapture(source)
+        if not cap.isOpened():
+            print(f"❌ 无法打开视频源: {source}")
+            return 0
+
+        policy = self.policy if self.policy != "auto" else ("latest" if is_live_source(source) else "lossless")
+        self.latest = policy == "latest"
+        size = 1 if self.latest else self.queue_size
+        capture_q, render_q = queue.Queue(maxsize=size), queue.Queue(maxsize=size)
+        print(f"🧵 流水线模式: 丢帧策略 = {policy}")
+
+        writer = None
+        if save_path:
+            fps = cap.get(cv2.CAP_PROP_FPS) or 30
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            writer = cv2.VideoWriter(save_path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+
+        self.stop.clear()
+        self.dropped = 0
+        threads = [
+            threading.Thread(target=self._capture, args=(cap, capture_q), daemon=True),
+            threading.Thread(target=self._infer, args=(capture_q, render_q), daemon=True),
+        ]
+        for t in threads:
+            t.start()
+
+        frames = 0
+        prev_time = 0
+        try:
+            while True:
+                item = self._get(render_q)
+                if item is None:
+                    break
+                t_capture, result = item
+                annotated_frame = result.plot(inplace=True)  # 直接在原帧上绘制，省去整帧拷贝
+
+                curr_time = time.time()
+                fps_curr = 1 / (curr_time - prev_time) if prev_time > 0 else 0
+                prev_time = curr_time
+                latency = (curr_time - t_capture) * 1000
+                cv2.putText(annotated_frame, f"FPS: {fps_curr:.1f}  Latency: {latency:.0f}ms", (10, 30),
+                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+
+                if writer is not None:
+                    writer.write(annotated_frame)
+                frames += 1
+
+                if show:
+                    cv2.imshow("Pothole Detection (Press 'q' to exit)", annotated_frame)
+                    if cv2.waitKey(1) & 0xFF == ord('q'):
+                        break
+        finally:
+            self.stop.set()
+            for t in threads:
+                t.join()
+            cap.release()
+            if writer is not None:
+                writer.release()
+            if show:
+                cv2.destroyAllWindows()
+
+        print(f"✅ 共处理 {frames} 帧，丢弃 {self.dropped} 帧")
+        return frames
+
+def process_video_pipelined(source=0, weights="Pothole_CBAM_Project/exp_cbam/weights/best.pt", conf=0.25,
+                            policy="auto", save_path=None, show=True, tiles=0):
+    """
+    流水线方式的实时视频预测 (采集、推理、渲染分别在不同线程)
+    :param source: 视频源，0 表示摄像头，或者传入视频文件路径
+    :param weights: 模型权重路径
+    :param conf: 置信度阈值
+    :param policy: 丢帧策略 'auto' | 'latest' | 'lossless'
+    :param save_path: 可选，保存标注后视频的路径
+    :param show: 是否显示预览窗口
+    :param tiles: 切片推理的最大切片数 (0 为不切片)
+    """
+    print(f"⏳ 正在加载模型: {weights} ...")
+    try:
+        model = YOLO(weights)
+        print("✅ 模型加载成功！")
+    except Exception as e:
+        print(f"❌ 模型加载失败: {e}")
+        return
+
+    print("👉 按 'q' 键退出预览")
+    VideoPipeline(model, conf=conf, policy=policy, tiles=tiles).run(source, save_path=save_path, show=show)
+
 if __name__ == "__main__":
     import argparse
     
@@ -79,6 +284,13 @@ if __name__ == "__main__":
     parser.add_argument("--source", type=str, default="0", help="视频源: '0' 代表摄像头，或输入视频文件路径")
     parser.add_argument("--weights", type=str, default="Pothole_CBAM_Project/exp_cbam/weights/best.pt", help="模型权重路径")
     parser.add_argument("--conf", type=float, default=0.25, help="置信度阈值")
+    parser.add_argument("--pipeline", action="store_true", help="使用采集/推理/渲染多线程流水线模式")
+    parser.add_argument("--policy", type=str, default="auto", choices=["auto", "latest", "lossless"],
+                        help="流水线丢帧策略: auto (摄像头 latest，文件 lossless) | latest | lossless")
+    parser.add_argument("--save", type=str, default=None, help="流水线模式下保存标注视频的路径")
+    parser.add_argument("--no-show", action="store_true", help="流水线模式下不显示预览窗口")
+    parser.add_argument("--tiles", type=int, default=0,
+                        help="切片推理的最大切片数 (另加一次整帧推理，全部同批前向)，如 1080p 用 6、4K 用 12；0 为不切片")
     
     args = parser.parse_args()
     
@@ -87,4 +299,8 @@ if __name__ == "__main__":
     if source.isdigit():
         source = int(source)
         
-    process_video(source, args.weights, args.conf)
+    if args.pipeline:
+        process_video_pipelined(source, args.weights, args.conf, policy=args.policy, save_path=args.save,
+                                show=not args.no_show, tiles=args.tiles)
+    else:
+        process_video(source, args.weights, args.conf, tiles=args.tiles)
@@ -136,6 +136,22 @@ def test_predict_visualize(model):
     YOLO(WEIGHTS_DIR / model)(SOURCE, imgsz=32, visualize=True)
 
 
+def test_predict_tiles():
+    """Test tiled inference returns one merged result per image with boxes in original image coordinates."""
+    model = YOLO(MODEL)
+    results = model.predict([SOURCE, SOURCE], imgsz=160, tiles=4, tile_overlap=0.25)
+    assert len(results) == 2
+    h, w = results[0].orig_shape
+    boxes = results[0].boxes.xyxy
+    assert len(boxes) and (boxes[:, [0, 2]] <= w).all() and (boxes[:, [1, 3]] <= h).all()
+    windows = model.predictor.get_tile_windows((h, w))
+    assert 1 < len(windows) <= 4 and max(x[2] for x in windows) == w and max(x[3] for x in windows) == h
+    model.add_feature_tap("p5", 9, reduce="mean")
+    results = model.predict(SOURCE, imgsz=160, tiles=4)  # taps keep the full-frame activation only
+    assert results[0].features["p5"].shape[0] == 1
+    model.remove_feature_tap()
+
+
 def test_predict_gray_and_4ch(tmp_path):
     """Test YOLO prediction on SOURCE converted to grayscale and 4-channel images with various filenames."""
     im = Image.open(SOURCE)
@@ -194,6 +210,72 @@ def test_track_stream(model, tmp_path):
         model.track(video_url, imgsz=160, tracker=custom_yaml)
 
 
+def test_track_aggregator(tmp_path):
+    """Test collapsing tracked detections into one record per track and reading the written records back."""
+    from ultralytics.trackers import TrackAggregator, register_aggregator
+
+    model = YOLO(MODEL)
+    aggregator = TrackAggregator(tmp_path / "records.npz", crop_size=16)
+    register_aggregator(model, aggregator)
+    results = model.track([SOURCE, SOURCE, SOURCE], imgsz=160, persist=True)
+    ids = {int(i) for r in results if r.boxes.is_track for i in r.boxes.id}
+    assert aggregator.close() == len(ids)
+    records = TrackAggregator.load(tmp_path / "records.npz")
+    assert len(records["track_id"]) == len(ids) and records["crop"].shape[1:] == (16, 16, 3)
+    assert (records["n_frames"] <= 3).all() and (records["area_min"] <= records["area_max"]).all()
+
+
+def test_track_store():
+    """Test batched Kalman updates on store-backed tracks match per-track updates and dropped tracks free their rows."""
+    from ultralytics.trackers.basetrack import TrackStore
+    from ultralytics.trackers.byte_tracker import STrack
+    from ultralytics.trackers.utils.kalman_filter import KalmanFilterXYAH
+
+    kf, store = KalmanFilterXYAH(), TrackStore(capacity=2)
+    boxes = np.array([[50, 60, 20, 30, i] for i in range(5)], dtype=np.float32)
+    tracks, reference = [STrack(b, 0.9, 0) for b in boxes], [STrack(b, 0.9, 0) for b in boxes]
+    for t, ref in zip(tracks, reference):
+        t.activate(kf, 1)
+        ref.activate(kf, 1)
+        store.add(t)  # grows past the initial capacity
+    assert len(store) == 5 and all(t.mean is not None for t in tracks)
+
+    STrack.multi_predict(tracks)
+    STrack.multi_gmc(tracks, np.array([[1.0, 0.0, 2.0], [0.0, 1.0, -3.0]]))
+    dets = [STrack(b + [2, 1, 0, 0, 0], 0.9, 0) for b in boxes]
+    STrack.multi_update(tracks, dets)
+    for ref, det in zip(reference, dets):
+        ref.predict()
+        ref.mean[:2] += [2.0, -3.0]
+        ref.update(det, 2)
+    assert np.allclose(STrack.get_states(tracks)[0], STrack.get_states(reference)[0])
+    assert np.allclose(STrack.get_states(tracks)[1], STrack.get_states(reference)[1])
+
+    store.retain(tracks[:2])
+    assert len(store) == 2 and tracks[4].store is None and np.allclose(tracks[4].mean, reference[4].mean)
+
+
+@pytest.mark.parametrize("multi_label", [False, True])
+def test_nms_batched(multi_label):
+    """Test that whole-batch NMS matches the per-image loop and that Fast-NMS keeps boxes of other images apart."""
+    from ultralytics.utils.nms import non_max_suppression
+
+    torch.manual_seed(0)
+    pred = torch.rand(4, 4 + 3, 400)
+    pred[:, :2] *= 320  # xy
+    pred[:, 2:4] = pred[:, 2:4] * 60 + 4  # wh
+    pred[1, 4:] = 0  # no detections in the second image
+    kwargs = dict(conf_thres=0.5, iou_thres=0.45, max_det=30, multi_label=multi_label, return_idxs=True)
+    out, idxs = non_max_suppression(pred.clone(), **kwargs)
+    ref, ref_idxs = non_max_suppression(pred.clone(), labels=[torch.zeros((0, 5))] * 4, **kwargs)  # loop path
+    for x, y, i, j in zip(out, ref, idxs, ref_idxs):
+        assert torch.equal(x, y) and torch.equal(i.view(-1), j.view(-1))
+    assert idxs[1].shape == ref_idxs[1].shape == (0, 1)
+    fast = non_max_suppression(pred[:2].clone(), use_fast_nms=True, **kwargs)[0]
+    single = [non_max_suppression(p[None].clone(), use_fast_nms=True, **kwargs)[0][0] for p in pred[:2]]
+    assert all(torch.equal(x, y) for x, y in zip(fast, single))
+
+
 @pytest.mark.parametrize("task,weight,data", TASK_MODEL_DATA)
 def test_val(task: str, weight: str, data: str) -> None:
     """Test the validation mode of the YOLO model."""
@@ -297,6 +379,27 @@ def test_results(model: str, tmp_path):
         print(r, len(r), r.path)  # print after methods
 
 
+def test_results_lite():
+    """Test that lite results share one detection tensor per batch, cache derived boxes and release their frames."""
+    from ultralytics.engine.results import Results
+
+    model = YOLO(MODEL)
+    results = model([SOURCE, SOURCE], imgsz=160, batch=2, lite_results=True)
+    storages = {r.boxes.data.untyped_storage().data_ptr() for r in results}
+    assert len(storages) == 1 and results[0].boxes.data.device.type == "cpu"
+    boxes = results[0].boxes
+    assert boxes.xywh is boxes.xywh and np.shares_memory(boxes.numpy().data, boxes.data.numpy())  # cached, no copy
+    assert results[0].orig_img is not None and results[0].plot() is not None
+    model.predictor.batch = None  # drop the last reference to the frames
+    assert results[0].orig_img is None and results[0][:1].orig_shape == boxes.orig_shape
+
+    im = np.zeros((32, 32, 3), dtype=np.uint8)
+    tracked = Results(im, path="a.jpg", names={0: "a"}, boxes=torch.tensor([[1.0, 2, 8, 9, 1, 0.9, 0]]))
+    untracked = Results(im, path="b.jpg", names={0: "a"}, boxes=torch.tensor([[1.0, 2, 8, 9, 0.9, 0]]))
+    packed = Results.pack([tracked, untracked])  # mixed column counts are left unpacked
+    assert packed[0].boxes.is_track and packed[0].boxes.data.shape == (1, 7) and packed[1].boxes.data.shape == (1, 6)
+
+
 def test_labels_and_crops():
     """Test output from prediction args for saving YOLO detection labels and crops."""
     imgs = [SOURCE, ASSETS / "zidane.jpg"]
@@ -366,6 +469,243 @@ def test_data_annotator(tmp_path):
     )
 
 
+def test_data_label_store(tmp_path):
+    """Test the memory-mapped LabelStore round trip, views, class filtering and pickling by path."""
+    import pickle
+
+    from ultralytics.data.cache import LabelStore
+
+    square = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=np.float32)
+    labels = [
+        {
+            "im_file": f"{i}.jpg",
+            "shape": (100 + i, 200),
+            "cls": np.array([[i % 2], [1]], dtype=np.float32)[: i % 3],
+            "bboxes": np.full((i % 3, 4), 0.5, dtype=np.float32),
+            "segments": [square * (j + 1) for j in range(i % 3)],
+            "keypoints": None,
+        }
+        for i in range(5)
+    ]  # 0, 1, 2, 0 and 1 instances
+    LabelStore.from_labels(labels, {"hash": "abc"}).save(tmp_path / "labels.cache")
+    store = LabelStore.load(tmp_path / "labels.cache")
+    assert len(store) == 5 and store.meta["hash"] == "abc" and store.num_segments() == 4
+    for lb, ref in zip(store, labels):
+        assert lb["shape"] == ref["shape"] and np.array_equal(lb["cls"], ref["cls"])
+        assert len(lb["segments"]) == len(ref["segments"]) and all(map(np.array_equal, lb["segments"], ref["segments"]))
+    lb = store[2]
+    lb["bboxes"] += 1  # labels own their arrays
+    assert store[2]["bboxes"].max() == 0.5
+
+    view = store[np.array([4, 2, 0])]
+    assert view.files == ["4.jpg", "2.jpg", "0.jpg"] and view.columns["bboxes"] is store.columns["bboxes"]
+    filtered = view.filter_classes([1], single_cls=True)
+    assert filtered.counts.tolist() == [0, 1, 0] and filtered[1]["cls"].tolist() == [[0.0]]
+    assert len(filtered[1]["segments"]) == 1 and np.array_equal(filtered[1]["segments"][0], square * 2)
+    restored = pickle.loads(pickle.dumps(view))
+    assert isinstance(restored.columns["cls"], np.memmap) and restored.files == view.files
+
+    for h in "def", "ghi":  # second save replaces the existing file
+        view.save(tmp_path / "view.cache", meta={"hash": h})
+    assert LabelStore.load(tmp_path / "view.cache").meta["hash"] == "ghi" and not any(tmp_path.glob("*.tmp"))
+
+
+def test_data_image_cache(tmp_path):
+    """Test that the memory-mapped image cache round-trips images and is reused and re-mapped after pickling."""
+    import pickle
+
+    from ultralytics.data.cache import ImageCache
+
+    ims = [np.random.randint(0, 255, (h, 32, 3), dtype=np.uint8) for h in (16, 24, 32)]
+    file = tmp_path / "train.images"
+    cache = ImageCache.build(file, lambda i: (ims[i], (2 * ims[i].shape[0], 64), ims[i].shape[:2]), len(ims))
+    assert ImageCache.load(file, n=4) is None and cache.nbytes == sum(im.nbytes for im in ims)
+    for cached in (cache, ImageCache.load(file, n=3), pickle.loads(pickle.dumps(cache))):
+        for i, im in enumerate(ims):
+            view, hw0, hw = cached[i]
+            assert np.array_equal(view, im) and not view.flags.writeable
+            assert hw0 == (2 * im.shape[0], 64) and hw == im.shape[:2]
+
+
+def test_mosaic_mmap_cache():
+    """Test Mosaic on an augmented dataset that builds and then reuses the shared memory-mapped image cache."""
+    from ultralytics.cfg import get_cfg
+    from ultralytics.data.build import build_yolo_dataset
+
+    data = check_det_dataset("coco8.yaml")
+    cfg = get_cfg(overrides={"imgsz": 32, "cache": "mmap", "mosaic": 1.0})
+    for _ in range(2):  # first build the cache, then load it with an empty mosaic buffer
+        dataset = build_yolo_dataset(cfg, data["train"], 2, data, mode="train")
+        assert all(dataset[i]["img"].shape == (3, 32, 32) for i in range(len(dataset)))
+
+
+@pytest.mark.parametrize("fmt", ["png", "jpg", "raw"])
+def test_data_shard_cache(tmp_path, fmt):
+    """Test that packed shards split at the shard size, decode images back and prefetch across a pickle."""
+    import pickle
+
+    from ultralytics.data.cache import ShardCache
+
+    ims = [np.full((h, 32, 3), 10 * h, dtype=np.uint8) for h in (16, 24, 32, 8)]
+    path = tmp_path / "train.shards"
+    shards = ShardCache.build(path, lambda i: (ims[i], (2 * len(ims[i]), 64), ims[i].shape[:2]), 4, fmt, shard_size=1)
+    assert ShardCache.is_shards(path) and ShardCache.load(path, n=5) is None and len(shards) == 4
+    assert len(list(path.glob("shard-*.bin"))) == 4  # every image overflows the 1-byte shard size
+    for cached in (shards, ShardCache.load(path, n=4), pickle.loads(pickle.dumps(shards))):
+        cached.prefetch([3, 1])
+        for i, im in enumerate(ims):
+            decoded, hw0, hw = cached[i]
+            assert hw0 == (2 * im.shape[0], 64) and hw == im.shape[:2] and decoded.shape == im.shape
+            assert np.abs(decoded.astype(int) - im).max() <= (0 if fmt != "jpg" else 2)
+
+
+def test_shard_dataset():
+    """Test Mosaic on a shard directory used as the dataset path, keeping classes excluded when it was built."""
+    from ultralytics.cfg import get_cfg
+    from ultralytics.data.build import build_yolo_dataset
+
+    data = check_det_dataset("coco8.yaml")
+    cfg = get_cfg(overrides={"imgsz": 32, "cache": "shards-png", "mosaic": 1.0, "classes": [0]})
+    dataset = build_yolo_dataset(cfg, data["train"], 2, data, mode="train")
+    assert all((lb["cls"] == 0).all() for lb in dataset.labels)
+    cfg = get_cfg(overrides={"imgsz": 32, "mosaic": 1.0})
+    shards = build_yolo_dataset(cfg, str(dataset.ims.path), 2, data, mode="train")
+    assert any((lb["cls"] != 0).any() for lb in shards.labels)  # all classes saved with the shards
+    assert all(shards[i]["img"].shape == (3, 32, 32) for i in range(len(shards)))
+
+
+def test_mosaic_vectorized_labels():
+    """Test that vectorized mosaic labels and segment boxes match the per-tile and per-segment results."""
+    from copy import deepcopy
+    from types import SimpleNamespace
+
+    from ultralytics.data.augment import Mosaic, RandomPerspective
+    from ultralytics.utils.instance import Instances
+    from ultralytics.utils.ops import segment2box
+
+    rng = np.random.default_rng(0)
+    tiles = []
+    for h, w in ((32, 48), (40, 40), (24, 64), (48, 16)):
+        n = int(rng.integers(0, 4))
+        xy = rng.uniform(0.2, 0.8, (n, 2)).astype(np.float32)
+        boxes = np.concatenate((xy, rng.uniform(0.05, 0.2, (n, 2)).astype(np.float32)), 1)
+        instances = Instances(boxes, rng.uniform(0, 1, (n, 8, 2)).astype(np.float32), rng.uniform(0, 1, (n, 5, 3)))
+        tiles.append({"img": np.zeros((h, w, 3), np.uint8), "cls": np.zeros((n, 1)), "instances": instances})
+    tiles[0].update(im_file="a.jpg", ori_shape=(32, 48))
+    pads = [(-20, 5), (30, -10), (10, 40), (50, 50)]
+    mosaic = Mosaic(SimpleNamespace(cache=None), imgsz=32, reuse_canvas=True)
+    fast = mosaic._cat_labels(deepcopy(tiles), pads)["instances"]
+    slow = mosaic._cat_labels([Mosaic._update_labels(t, *pad) for t, pad in zip(deepcopy(tiles), pads)])["instances"]
+    for a, b in zip((fast.bboxes, fast.segments, fast.keypoints), (slow.bboxes, slow.segments, slow.keypoints)):
+        assert np.allclose(a, b)
+    assert mosaic._canvas(8, 8, 3) is mosaic._canvas(8, 8, 3)  # reused per worker
+
+    segments = rng.uniform(-40, 80, (16, 20, 2)).astype(np.float32)
+    boxes = np.stack([segment2box(s, 64, 48) for s in segments])
+    assert np.allclose(RandomPerspective.segments2boxes(segments, 64, 48), boxes)
+
+
+def test_batch_augment():
+    """Test batched flips, HSV round trip and affine warps of collated detection batches."""
+    from ultralytics.cfg import get_cfg
+    from ultralytics.data.augment import BatchAugment
+
+    img = torch.rand(4, 3, 32, 48)
+    bboxes = torch.tensor([[0.25, 0.5, 0.2, 0.4], [0.5, 0.5, 0.5, 0.5], [0.7, 0.3, 0.2, 0.2]])
+    labels = {"cls": torch.zeros(3, 1), "batch_idx": torch.tensor([0, 1, 3.0])}
+    batch = {"img": img.clone(), "bboxes": bboxes.clone(), **labels}
+    batch = BatchAugment(hsv_h=0, hsv_s=0, hsv_v=0, translate=0, scale=0, fliplr=1.0)(batch)
+    assert torch.allclose(batch["img"], img.flip(3)) and torch.allclose(batch["bboxes"][:, 0], 1 - bboxes[:, 0])
+    assert torch.allclose(BatchAugment(hsv_h=0, hsv_s=0, hsv_v=0).hsv_jitter(img), img, atol=1e-5)
+
+    batch = {"img": img.clone(), "bboxes": bboxes.clone(), **labels}
+    batch = BatchAugment(degrees=10, shear=5, perspective=1e-4)(batch)
+    assert batch["img"].shape == img.shape and 0 <= batch["img"].min() <= batch["img"].max() <= 1
+    assert len(batch["bboxes"]) == len(batch["cls"]) == len(batch["batch_idx"]) <= 3
+    assert ((batch["bboxes"] >= 0) & (batch["bboxes"] <= 1)).all()
+
+    hyp = get_cfg(overrides={"scale": 0.5, "mosaic": 1.0})
+    assert BatchAugment.from_hyp(hyp).scale == 0.0  # warps stay per image while mosaic is on
+    hyp.mosaic = 0.0
+    assert BatchAugment.from_hyp(hyp).scale == 0.5
+
+
+def test_confusion_matrix_process_batch():
+    """Test one-to-one detection matching and matrix cells of the vectorized confusion matrix update."""
+    from ultralytics.utils.metrics import ConfusionMatrix
+
+    gt = {"bboxes": torch.tensor([[0, 0, 10, 10], [20, 20, 30, 30], [40, 0, 50, 10.0]]), "cls": torch.tensor([0, 1, 0])}
+    det = {
+        "bboxes": torch.tensor([[0, 0, 10, 10], [20, 20, 30, 31], [0, 0, 10, 11], [60, 60, 70, 70], [40, 0, 50, 10.0]]),
+        "conf": torch.tensor([0.9, 0.8, 0.7, 0.6, 0.1]),
+        "cls": torch.tensor([0, 0, 0, 1, 0]),
+    }
+    cm = ConfusionMatrix(names={0: "a", 1: "b"}, save_matches=True)
+    cm.process_batch(det, gt, conf=0.25)
+    expected = np.zeros((3, 3))
+    expected[0, 0] = expected[0, 1] = expected[0, 2] = expected[1, 2] = expected[2, 0] = 1
+    assert np.array_equal(cm.matrix, expected)
+    assert [len(cm.matches[k]["cls"]) for k in ("TP", "FP", "FN", "GT")] == [1, 3, 2, 3]
+
+
+def test_detection_validator_batch_stats():
+    """Test that batched on-device matching reproduces the per-image validation statistics."""
+    from ultralytics.models.yolo.detect import DetectionValidator
+
+    torch.manual_seed(0)
+    validator = DetectionValidator()
+    n_gt, n_det = [3, 0, 5, 2], [6, 2, 0, 4]
+    xy, wh = torch.rand(sum(n_gt), 2) * 0.6 + 0.2, torch.rand(sum(n_gt), 2) * 0.2 + 0.05
+    batch = {
+        "img": torch.zeros(4, 3, 64, 96),
+        "batch_idx": torch.cat([torch.full((n,), float(i)) for i, n in enumerate(n_gt)]),
+        "cls": torch.randint(0, 3, (sum(n_gt), 1)).float(),
+        "bboxes": torch.cat([xy, wh], 1),
+        "ori_shape": [(64, 96)] * 4,
+        "ratio_pad": [None] * 4,
+        "im_file": [f"{i}.jpg" for i in range(4)],
+    }
+    preds = []
+    for si, n in enumerate(n_det):
+        gt = validator._prepare_batch(si, batch)["bboxes"]
+        bboxes = torch.rand(n, 4) * 40
+        bboxes[:, 2:] += bboxes[:, :2]
+        if len(gt):  # detections jittered around the labels, with duplicates
+            bboxes[: n // 2] = gt[torch.randint(0, len(gt), (n // 2,))] + torch.randn(n // 2, 4)
+        preds.append({"bboxes": bboxes, "conf": torch.rand(n), "cls": torch.randint(0, 3, (n,)).float()})
+
+    stats = validator._batch_stats(preds, batch)
+    tp = [validator._process_batch(p, validator._prepare_batch(si, batch))["tp"] for si, p in enumerate(preds)]
+    assert np.array_equal(stats["tp"].numpy(), np.concatenate(tp))
+    assert stats["target_img"].numel() == sum(len(batch["cls"][batch["batch_idx"] == i].unique()) for i in range(4))
+
+
+def test_det_metrics_histogram():
+    """Test that streaming histogram mAP equals exact mAP when every detection falls into its own confidence bin."""
+    from ultralytics.utils.metrics import DetMetrics
+
+    rng = np.random.default_rng(0)
+    names = {0: "a", 1: "b", 2: "c"}
+    exact, hist = DetMetrics(names), DetMetrics(names, bins=1000)
+    conf = (rng.permutation(1000)[:300] + 0.5) / 1000  # distinct bin centers
+    for i in range(0, 300, 30):
+        target_cls = rng.integers(0, 3, 20).astype(float)
+        stat = {
+            "tp": rng.random((30, 10)) < 0.5,
+            "conf": conf[i : i + 30],
+            "pred_cls": rng.integers(0, 3, 30).astype(float),
+            "target_cls": target_cls,
+            "target_img": np.unique(target_cls),
+        }
+        exact.update_stats(stat)
+        hist.update_stats(stat)
+    exact.process()
+    hist.process()
+    assert np.allclose(exact.box.all_ap, hist.box.all_ap)
+    assert np.allclose(exact.mean_results(), hist.mean_results())
+    assert np.array_equal(exact.nt_per_image, hist.nt_per_image)
+
+
 def test_events():
     """Test event sending functionality."""
     from ultralytics.utils.events import Events
@@ -495,6 +835,20 @@ def test_utils_ops():
     torch.allclose(boxes, xyxyxyxy2xywhr(xywhr2xyxyxyxy(boxes)), rtol=1e-3)
 
 
+def test_utils_plotting_box_labels():
+    """Test batched box drawing with cached label bitmaps, including labels clipped at the image border."""
+    from ultralytics.utils.plotting import Annotator
+
+    im = np.zeros((120, 160, 3), dtype=np.uint8)
+    annotator = Annotator(im, line_width=2)
+    boxes = np.array([[10, 30, 60, 80], [100, 0, 159, 40], [-5, -5, 20, 20]], dtype=np.float32)
+    annotator.box_labels(boxes, ["a 0.50", "b 0.90", None], [(255, 0, 0), (0, 255, 0), (255, 0, 0)])
+    annotator.box_labels(boxes[:1], ["a 0.50"], [(255, 0, 0)])
+    result = annotator.result()
+    assert result is im and (im[30, 35] == (255, 0, 0)).all()  # drawn in place, box edge
+    assert Annotator.label_bitmap.cache_info().hits >= 1
+
+
 def test_utils_files(tmp_path):
     """Test file handling utilities including file age, date, and paths with spaces."""
     from ultralytics.utils.files import file_age, file_date, get_latest_run, spaces_in_path
@@ -543,6 +897,12 @@ def test_nn_modules_conv():
     m.fuse_convs()
     m(x)
 
+    m = CBAM(c1, c1, ratio=4).eval()
+    xr = torch.rand(4, c1, 10, 10)
+    y = m(xr)
+    m.fuse()
+    assert torch.allclose(m(xr), y, atol=1e-6)
+
 
 def test_nn_modules_block():
     """Test various neural network block modules."""
@@ -620,6 +980,40 @@ def test_model_tune():
     YOLO("yolo11n-cls.pt").tune(data="imagenet10", plots=False, imgsz=32, epochs=1, iterations=2, device="cpu")
 
 
+@pytest.mark.slow
+@pytest.mark.skipif(not ONLINE, reason="environment is offline")
+def test_model_tune_parallel():
+    """Tune YOLO model with parallel trials and successive halving."""
+    YOLO(MODEL).tune(data="coco8.yaml", plots=False, imgsz=32, epochs=3, iterations=3, parallel=2, halving=3)
+
+
+def test_tuner_local_store(tmp_path):
+    """Test the file-locked tuning results store and the per-epoch fitness used for successive halving."""
+    from ultralytics.engine.tuner import Tuner, _epoch_fitness
+
+    tuner = Tuner(args={"project": str(tmp_path), "epochs": 27, "parallel": 2, "halving": 3})
+    assert tuner.parallel == 2 and tuner.rungs == [1, 3, 9]
+    tuner.tune_dir.mkdir(parents=True)
+    for fitness in 0.1, 0.3:
+        tuner._append_csv(tuner.tune_csv, ["fitness", "lr0"], [fitness, 0.01])
+    assert np.allclose(tuner._read_csv(tuner.tune_csv), [[0.1, 0.01], [0.3, 0.01]])
+    assert np.allclose(tuner._read_csv(tuner.tune_csv), np.loadtxt(tuner.tune_csv, delimiter=",", skiprows=1))
+    csv = tmp_path / "results.csv"
+    csv.write_text("epoch,metrics/mAP50(B),metrics/mAP50-95(B),metrics/mAP50-95(M)\n1,.5,.2,.1\n2,.6,.3,.2\n3,.7")
+    assert np.allclose(_epoch_fitness(csv), [0.3, 0.5])  # partially written last line is skipped
+
+
+def test_cpu_autobatch():
+    """Test CPU AutoBatch throughput profiling, dataloader worker sizing and automatic inference batch size."""
+    from ultralytics.utils.autobatch import autoworkers, cpu_autobatch
+
+    batch, rate = cpu_autobatch(YOLO(MODEL).model.train(), imgsz=32, max_num_obj=4, max_batch=4)
+    assert 1 <= batch <= 4 and rate > 0
+    assert 1 <= autoworkers(list(range(16)), rate, workers=2) <= 2
+    assert autoworkers(list(range(16)), rate, workers=0) == 0
+    YOLO(MODEL).predict([SOURCE, SOURCE], imgsz=32, batch=-1, device="cpu")
+
+
 def test_model_embeddings():
     """Test YOLO model embeddings extraction functionality."""
     model_detect = YOLO(MODEL)
@@ -630,6 +1024,44 @@ def test_model_embeddings():
         assert len(model_segment.embed(source=batch, imgsz=32)) == len(batch)
 
 
+def test_model_capture_activations():
+    """Test capturing intermediate layer outputs alongside predictions in a single forward pass."""
+    model = YOLO(MODEL)
+    with model.capture_activations([9, "model.10"]) as capture:
+        results = model.predict([SOURCE, SOURCE], imgsz=32)
+    assert len(results) == 2
+    assert capture.activations[9].shape[0] == 2
+    assert "model.10" in capture.activations
+    model.predict(SOURCE, imgsz=32)  # hooks removed on exit
+    assert capture.activations[9].shape[0] == 2
+
+
+def test_model_feature_taps():
+    """Test persistent feature taps returning reduced activations with each Results object."""
+    model = YOLO(MODEL)
+    model.add_feature_tap("p5", 9, reduce="max", size=2)
+    for _ in range(2):  # taps persist across predict calls
+        results = model.predict([SOURCE, SOURCE], imgsz=32)
+        assert all(r.features["p5"].shape == (1, 2, 2) for r in results)
+    assert results[0].cpu().features["p5"].device.type == "cpu"
+    model.remove_feature_tap()
+    assert not model.predict(SOURCE, imgsz=32)[0].features
+
+
+def test_micro_batcher():
+    """Test grouping concurrent single-image requests into batched predict calls."""
+    from ultralytics.engine.batcher import MicroBatcher
+
+    batcher = MicroBatcher(YOLO(MODEL), max_batch=4, max_wait=0.5, imgsz=32)
+    futures = [batcher.submit(SOURCE) for _ in range(6)]
+    results = [f.result() for f in futures]
+    batcher.close()
+    assert len(results) == 6 and all(r.path.endswith(SOURCE.name) for r in results)
+    assert batcher.images == 6 and batcher.batches < 6
+    with pytest.raises(RuntimeError):
+        batcher.submit(SOURCE)
+
+
 @pytest.mark.skipif(checks.IS_PYTHON_3_12, reason="YOLOWorld with CLIP is not supported in Python 3.12")
 @pytest.mark.skipif(
     checks.IS_PYTHON_3_8 and LINUX and ARM64,
@@ -186,6 +186,7 @@ CFG_FRACTION_KEYS = frozenset(
         "conf",
         "iou",
         "fraction",
+        "tile_overlap",
     }
 )
 CFG_INT_KEYS = frozenset(
@@ -197,10 +198,12 @@ CFG_INT_KEYS = frozenset(
         "close_mosaic",
         "mask_ratio",
         "max_det",
+        "ap_bins",
         "vid_stride",
         "line_width",
         "nbs",
         "save_period",
+        "tiles",
     }
 )
 CFG_BOOL_KEYS = frozenset(
@@ -229,6 +232,7 @@ CFG_BOOL_KEYS = frozenset(
         "augment",
         "agnostic_nms",
         "retina_masks",
+        "lite_results",
         "show_boxes",
         "keras",
         "optimize",
@@ -238,6 +242,7 @@ CFG_BOOL_KEYS = frozenset(
         "nms",
         "profile",
         "multi_scale",
+        "batch_augment",
     }
 )
 
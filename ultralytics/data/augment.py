@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import math
 import random
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Any
 
 import cv2
@@ -18,7 +18,7 @@ from ultralytics.utils import LOGGER, IterableSimpleNamespace, colorstr
 from ultralytics.utils.checks import check_version
 from ultralytics.utils.instance import Instances
 from ultralytics.utils.metrics import bbox_ioa
-from ultralytics.utils.ops import segment2box, xywh2xyxy, xyxyxyxy2xywhr
+from ultralytics.utils.ops import xywh2xyxy, xyxy2xywh, xyxyxyxy2xywhr
 from ultralytics.utils.torch_utils import TORCHVISION_0_10, TORCHVISION_0_11, TORCHVISION_0_13
 
 DEFAULT_MEAN = (0.0, 0.0, 0.0)
@@ -467,6 +467,7 @@ class Mosaic(BaseMixTransform):
         p (float): Probability of applying the mosaic augmentation. Must be in the range 0-1.
         n (int): The grid size, either 4 (for 2x2) or 9 (for 3x3).
         border (tuple[int, int]): Border size for width and height.
+        reuse_canvas (bool): Whether to draw every mosaic into the same canvas instead of allocating a new one.
 
     Methods:
         get_indexes: Return a list of random indexes from the datasets.
@@ -474,6 +475,7 @@ class Mosaic(BaseMixTransform):
         _mosaic3: Create a 1x3 image mosaic.
         _mosaic4: Create a 2x2 image mosaic.
         _mosaic9: Create a 3x3 image mosaic.
+        _canvas: Return a canvas filled with the padding value.
         _update_labels: Update labels with padding.
         _cat_labels: Concatenate labels and clips mosaic border instances.
 
@@ -484,7 +486,7 @@ class Mosaic(BaseMixTransform):
         >>> augmented_labels = mosaic_aug(original_labels)
     """
 
-    def __init__(self, dataset, imgsz: int = 640, p: float = 1.0, n: int = 4):
+    def __init__(self, dataset, imgsz: int = 640, p: float = 1.0, n: int = 4, reuse_canvas: bool = False):
         """Initialize the Mosaic augmentation object.
 
         This class performs mosaic augmentation by combining multiple (4 or 9) images into a single mosaic image. The
@@ -495,6 +497,8 @@ class Mosaic(BaseMixTransform):
             imgsz (int): Image size (height and width) after mosaic pipeline of a single image.
             p (float): Probability of applying the mosaic augmentation. Must be in the range 0-1.
             n (int): The grid size, either 4 (for 2x2) or 9 (for 3x3).
+            reuse_canvas (bool): Whether to draw every mosaic into one canvas kept by each dataloader worker. Only safe
+                if the mosaic image is consumed, e.g. warped by RandomPerspective, before the next mosaic is drawn.
         """
         assert 0 <= p <= 1.0, f"The probability should be in range [0, 1], but got {p}."
         assert n in {4, 9}, "grid must be equal to 4 or 9."
@@ -502,7 +506,22 @@ class Mosaic(BaseMixTransform):
         self.imgsz = imgsz
         self.border = (-imgsz // 2, -imgsz // 2)  # width, height
         self.n = n
-        self.buffer_enabled = self.dataset.cache != "ram"
+        self.buffer_enabled = not str(self.dataset.cache).startswith(("ram", "mmap", "shards"))  # buffer stays empty
+        self.reuse_canvas = reuse_canvas
+        self._buf = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the canvas, so each dataloader worker allocates its own."""
+        return {**self.__dict__, "_buf": None}
+
+    def _canvas(self, h: int, w: int, c: int) -> np.ndarray:
+        """Return an (h, w, c) canvas filled with the padding value 114, reusing the previous one if enabled."""
+        if not self.reuse_canvas:
+            return np.full((h, w, c), 114, dtype=np.uint8)
+        if self._buf is None or self._buf.shape != (h, w, c):
+            self._buf = np.empty((h, w, c), dtype=np.uint8)
+        self._buf.fill(114)  # no new allocation and page faults per sample
+        return self._buf
 
     def get_indexes(self):
         """Return a list of random indexes from the datasets for mosaic augmentation.
@@ -578,7 +597,7 @@ class Mosaic(BaseMixTransform):
             >>> print(result["img"].shape)
             (640, 640, 3)
         """
-        mosaic_labels = []
+        mosaic_labels, pads = [], []
         s = self.imgsz
         for i in range(3):
             labels_patch = labels if i == 0 else labels["mix_labels"][i - 1]
@@ -588,7 +607,7 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img3
             if i == 0:  # center
-                img3 = np.full((s * 3, s * 3, img.shape[2]), 114, dtype=np.uint8)  # base image with 3 tiles
+                img3 = self._canvas(s * 3, s * 3, img.shape[2])  # base image with 3 tiles
                 h0, w0 = h, w
                 c = s, s, s + w, s + h  # xmin, ymin, xmax, ymax (base) coordinates
             elif i == 1:  # right
@@ -603,9 +622,9 @@ class Mosaic(BaseMixTransform):
             # hp, wp = h, w  # height, width previous for next iteration
 
             # Labels assuming imgsz*2 mosaic size
-            labels_patch = self._update_labels(labels_patch, padw + self.border[0], padh + self.border[1])
+            pads.append((padw + self.border[0], padh + self.border[1]))
             mosaic_labels.append(labels_patch)
-        final_labels = self._cat_labels(mosaic_labels)
+        final_labels = self._cat_labels(mosaic_labels, pads)
 
         final_labels["img"] = img3[-self.border[0] : self.border[0], -self.border[1] : self.border[1]]
         return final_labels
@@ -634,7 +653,7 @@ class Mosaic(BaseMixTransform):
             >>> result = mosaic._mosaic4(labels)
             >>> assert result["img"].shape == (1280, 1280, 3)
         """
-        mosaic_labels = []
+        mosaic_labels, pads = [], []
         s = self.imgsz
         yc, xc = (int(random.uniform(-x, 2 * s + x)) for x in self.border)  # mosaic center x, y
         for i in range(4):
@@ -645,7 +664,7 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img4
             if i == 0:  # top left
-                img4 = np.full((s * 2, s * 2, img.shape[2]), 114, dtype=np.uint8)  # base image with 4 tiles
+                img4 = self._canvas(s * 2, s * 2, img.shape[2])  # base image with 4 tiles
                 x1a, y1a, x2a, y2a = max(xc - w, 0), max(yc - h, 0), xc, yc  # xmin, ymin, xmax, ymax (large image)
                 x1b, y1b, x2b, y2b = w - (x2a - x1a), h - (y2a - y1a), w, h  # xmin, ymin, xmax, ymax (small image)
             elif i == 1:  # top right
@@ -659,12 +678,9 @@ class Mosaic(BaseMixTransform):
                 x1b, y1b, x2b, y2b = 0, 0, min(w, x2a - x1a), min(y2a - y1a, h)
 
             img4[y1a:y2a, x1a:x2a] = img[y1b:y2b, x1b:x2b]  # img4[ymin:ymax, xmin:xmax]
-            padw = x1a - x1b
-            padh = y1a - y1b
-
-            labels_patch = self._update_labels(labels_patch, padw, padh)
+            pads.append((x1a - x1b, y1a - y1b))  # padw, padh
             mosaic_labels.append(labels_patch)
-        final_labels = self._cat_labels(mosaic_labels)
+        final_labels = self._cat_labels(mosaic_labels, pads)
         final_labels["img"] = img4
         return final_labels
 
@@ -694,7 +710,7 @@ class Mosaic(BaseMixTransform):
             >>> mosaic_result = mosaic._mosaic9(input_labels)
             >>> mosaic_image = mosaic_result["img"]
         """
-        mosaic_labels = []
+        mosaic_labels, pads = [], []
         s = self.imgsz
         hp, wp = -1, -1  # height, width previous
         for i in range(9):
@@ -705,7 +721,7 @@ class Mosaic(BaseMixTransform):
 
             # Place img in img9
             if i == 0:  # center
-                img9 = np.full((s * 3, s * 3, img.shape[2]), 114, dtype=np.uint8)  # base image with 4 tiles
+                img9 = self._canvas(s * 3, s * 3, img.shape[2])  # base image with 9 tiles
                 h0, w0 = h, w
                 c = s, s, s + w, s + h  # xmin, ymin, xmax, ymax (base) coordinates
             elif i == 1:  # top
@@ -733,9 +749,9 @@ class Mosaic(BaseMixTransform):
             hp, wp = h, w  # height, width previous for next iteration
 
             # Labels assuming imgsz*2 mosaic size
-            labels_patch = self._update_labels(labels_patch, padw + self.border[0], padh + self.border[1])
+            pads.append((padw + self.border[0], padh + self.border[1]))
             mosaic_labels.append(labels_patch)
-        final_labels = self._cat_labels(mosaic_labels)
+        final_labels = self._cat_labels(mosaic_labels, pads)
 
         final_labels["img"] = img9[-self.border[0] : self.border[0], -self.border[1] : self.border[1]]
         return final_labels
@@ -766,14 +782,19 @@ class Mosaic(BaseMixTransform):
         labels["instances"].add_padding(padw, padh)
         return labels
 
-    def _cat_labels(self, mosaic_labels: list[dict[str, Any]]) -> dict[str, Any]:
+    def _cat_labels(
+        self, mosaic_labels: list[dict[str, Any]], pads: list[tuple[int, int]] | None = None
+    ) -> dict[str, Any]:
         """Concatenate and process labels for mosaic augmentation.
 
         This method combines labels from multiple images used in mosaic augmentation, clips instances to the mosaic
-        border, and removes zero-area boxes.
+        border, and removes zero-area boxes. With `pads`, the instances of all tiles are concatenated first and then
+        converted, denormalized and shifted to mosaic coordinates in one vectorized pass.
 
         Args:
             mosaic_labels (list[dict[str, Any]]): A list of label dictionaries for each image in the mosaic.
+            pads (list[tuple[int, int]], optional): Padding (padw, padh) of each image in the mosaic. If None, the
+                instances are expected to be already updated with `_update_labels`.
 
         Returns:
             (dict[str, Any]): A dictionary containing concatenated and processed labels for the mosaic image, including:
@@ -794,19 +815,37 @@ class Mosaic(BaseMixTransform):
         """
         if not mosaic_labels:
             return {}
-        cls = []
-        instances = []
         imgsz = self.imgsz * 2  # mosaic imgsz
-        for labels in mosaic_labels:
-            cls.append(labels["cls"])
-            instances.append(labels["instances"])
+        instances = [labels["instances"] for labels in mosaic_labels]
+        if pads is not None and len({(x.normalized, x._bboxes.format) for x in instances}) > 1:
+            instances = [self._update_labels(x, *pad)["instances"] for x, pad in zip(mosaic_labels, pads)]
+            pads = None  # mixed coordinate states, update tile by tile
+        instances = Instances.concatenate(instances, axis=0)
+        if pads is not None:
+            n = [len(x["instances"]) for x in mosaic_labels]
+            scale = np.repeat(
+                [x["img"].shape[1::-1] if x["instances"].normalized else (1, 1) for x in mosaic_labels], n, axis=0
+            ).astype(np.float32)  # (N, 2) denormalization w, h per instance
+            pad = np.repeat(np.asarray(pads, dtype=np.float32).reshape(-1, 2), n, axis=0)  # (N, 2) padw, padh
+            instances.convert_bbox(format="xyxy")
+            instances = Instances(
+                instances.bboxes * np.tile(scale, 2) + np.tile(pad, 2),
+                instances.segments * scale[:, None] + pad[:, None] if len(instances.segments) else instances.segments,
+                None
+                if instances.keypoints is None
+                else np.concatenate(
+                    (instances.keypoints[..., :2] * scale[:, None] + pad[:, None], instances.keypoints[..., 2:]), -1
+                ),
+                bbox_format="xyxy",
+                normalized=False,
+            )
         # Final labels
         final_labels = {
             "im_file": mosaic_labels[0]["im_file"],
             "ori_shape": mosaic_labels[0]["ori_shape"],
             "resized_shape": (imgsz, imgsz),
-            "cls": np.concatenate(cls, 0),
-            "instances": Instances.concatenate(instances, axis=0),
+            "cls": np.concatenate([labels["cls"] for labels in mosaic_labels], 0),
+            "instances": instances,
             "mosaic_border": self.border,
         }
         final_labels["instances"].clip(imgsz, imgsz)
@@ -1009,6 +1048,7 @@ class RandomPerspective:
         affine_transform: Apply affine transformations to the input image.
         apply_bboxes: Transform bounding boxes using the affine matrix.
         apply_segments: Transform segments and generate new bounding boxes.
+        segments2boxes: Convert segments to boxes of their points inside the image, all segments at once.
         apply_keypoints: Transform keypoints using the affine matrix.
         __call__: Apply the random perspective transformation to images and annotations.
         box_candidates: Filter transformed bounding boxes based on size and aspect ratio.
@@ -1078,36 +1118,42 @@ class RandomPerspective:
             >>> transformed_img, matrix, scale = affine_transform(img, border)
         """
         # Center
-        C = np.eye(3, dtype=np.float32)
-
-        C[0, 2] = -img.shape[1] / 2  # x translation (pixels)
-        C[1, 2] = -img.shape[0] / 2  # y translation (pixels)
+        c = np.array([img.shape[1] / 2, img.shape[0] / 2])  # x, y translation (pixels)
 
         # Perspective
-        P = np.eye(3, dtype=np.float32)
-        P[2, 0] = random.uniform(-self.perspective, self.perspective)  # x perspective (about y)
-        P[2, 1] = random.uniform(-self.perspective, self.perspective)  # y perspective (about x)
+        p = np.array(
+            [
+                random.uniform(-self.perspective, self.perspective),  # x perspective (about y)
+                random.uniform(-self.perspective, self.perspective),  # y perspective (about x)
+            ]
+        )
 
         # Rotation and Scale
-        R = np.eye(3, dtype=np.float32)
         a = random.uniform(-self.degrees, self.degrees)
         # a += random.choice([-180, -90, 0, 90])  # add 90deg rotations to small rotations
         s = random.uniform(1 - self.scale, 1 + self.scale)
         # s = 2 ** random.uniform(-scale, scale)
-        R[:2] = cv2.getRotationMatrix2D(angle=a, center=(0, 0), scale=s)
+        cos, sin = s * math.cos(math.radians(a)), s * math.sin(math.radians(a))
 
         # Shear
-        S = np.eye(3, dtype=np.float32)
-        S[0, 1] = math.tan(random.uniform(-self.shear, self.shear) * math.pi / 180)  # x shear (deg)
-        S[1, 0] = math.tan(random.uniform(-self.shear, self.shear) * math.pi / 180)  # y shear (deg)
+        shx = math.tan(random.uniform(-self.shear, self.shear) * math.pi / 180)  # x shear (deg)
+        shy = math.tan(random.uniform(-self.shear, self.shear) * math.pi / 180)  # y shear (deg)
 
         # Translation
-        T = np.eye(3, dtype=np.float32)
-        T[0, 2] = random.uniform(0.5 - self.translate, 0.5 + self.translate) * self.size[0]  # x translation (pixels)
-        T[1, 2] = random.uniform(0.5 - self.translate, 0.5 + self.translate) * self.size[1]  # y translation (pixels)
+        t = np.array(
+            [
+                random.uniform(0.5 - self.translate, 0.5 + self.translate) * self.size[0],  # x translation (pixels)
+                random.uniform(0.5 - self.translate, 0.5 + self.translate) * self.size[1],  # y translation (pixels)
+            ]
+        )
 
-        # Combined rotation matrix
-        M = T @ S @ R @ P @ C  # order of operations (right to left) is IMPORTANT
+        # Combined matrix M = T @ S @ R @ P @ C (order right to left is IMPORTANT), composed in closed form
+        K = np.array([[cos + shx * -sin, sin + shx * cos], [shy * cos - sin, shy * sin + cos]]) + np.outer(t, p)
+        M = np.eye(3, dtype=np.float32)
+        M[:2, :2] = K
+        M[:2, 2] = t - K @ c
+        M[2, :2] = p
+        M[2, 2] = 1 - p @ c
         # Affine image
         if (border[0] != 0) or (border[1] != 0) or (M != np.eye(3)).any():  # image changed
             if self.perspective:
@@ -1181,11 +1227,48 @@ class RandomPerspective:
         xy = xy @ M.T  # transform
         xy = xy[:, :2] / xy[:, 2:3]
         segments = xy.reshape(n, -1, 2)
-        bboxes = np.stack([segment2box(xy, self.size[0], self.size[1]) for xy in segments], 0)
+        bboxes = self.segments2boxes(segments, *self.size)
         segments[..., 0] = segments[..., 0].clip(bboxes[:, 0:1], bboxes[:, 2:3])
         segments[..., 1] = segments[..., 1].clip(bboxes[:, 1:2], bboxes[:, 3:4])
         return bboxes, segments
 
+    @staticmethod
+    def segments2boxes(segments: np.ndarray, width: int, height: int) -> np.ndarray:
+        """Convert segments to the xyxy boxes of their points inside the image, all segments at once.
+
+        This is a vectorized `segment2box` over a (N, M, 2) array: segments with 3 of 4 sides outside the image are
+        clipped to it first, and segments without any point inside the image get an all-zero box.
+
+        Args:
+            segments (np.ndarray): Segments with shape (N, M, 2) in pixels.
+            width (int): Image width.
+            height (int): Image height.
+
+        Returns:
+            (np.ndarray): Boxes with shape (N, 4) in xyxy format.
+
+        Examples:
+            >>> segments = np.array([[[10, 10], [50, 20], [30, 60]]], dtype=np.float32)
+            >>> RandomPerspective.segments2boxes(segments, 640, 640)
+            array([[10., 10., 50., 60.]], dtype=float32)
+        """
+        x, y = segments[..., 0], segments[..., 1]
+        outside = np.stack([x.min(1) < 0, y.min(1) < 0, x.max(1) > width, y.max(1) > height]).sum(0) >= 3
+        x = np.where(outside[:, None], x.clip(0, width), x)
+        y = np.where(outside[:, None], y.clip(0, height), y)
+        inside = (x >= 0) & (y >= 0) & (x <= width) & (y <= height)
+        bboxes = np.stack(
+            [
+                np.where(inside, x, np.inf).min(1),
+                np.where(inside, y, np.inf).min(1),
+                np.where(inside, x, -np.inf).max(1),
+                np.where(inside, y, -np.inf).max(1),
+            ],
+            1,
+        )
+        bboxes[~(inside & (x != 0)).any(1)] = 0  # no point inside the image
+        return bboxes.astype(segments.dtype)
+
     def apply_keypoints(self, keypoints: np.ndarray, M: np.ndarray) -> np.ndarray:
         """Apply affine transformation to keypoints.
 
@@ -1415,7 +1498,10 @@ class RandomHSV:
 
             hue, sat, val = cv2.split(cv2.cvtColor(img, cv2.COLOR_BGR2HSV))
             im_hsv = cv2.merge((cv2.LUT(hue, lut_hue), cv2.LUT(sat, lut_sat), cv2.LUT(val, lut_val)))
-            cv2.cvtColor(im_hsv, cv2.COLOR_HSV2BGR, dst=img)  # no return needed
+            if img.flags.writeable:
+                cv2.cvtColor(im_hsv, cv2.COLOR_HSV2BGR, dst=img)  # no return needed
+            else:  # read-only view, e.g. of a memory-mapped image cache
+                labels["img"] = cv2.cvtColor(im_hsv, cv2.COLOR_HSV2BGR)
         return labels
 
 
@@ -2153,6 +2239,213 @@ class Format:
         return masks, instances, cls
 
 
+class BatchAugment:
+    """Apply HSV color jitter, flips and affine warps to whole collated detection batches as tensor ops.
+
+    This is the batched counterpart of RandomPerspective, RandomHSV and RandomFlip. It runs on the device of the batch,
+    e.g. in `DetectionTrainer.preprocess_batch` after the images are moved to the training device, so these
+    augmentations cost a few vectorized kernels per batch instead of per-image work in the dataloader workers. Images
+    are warped with one `grid_sample` call, and boxes of all images are transformed, clipped and filtered together.
+
+    Attributes:
+        hsv (tuple[float, float, float]): Hue, saturation and value gains.
+        degrees (float): Maximum absolute rotation in degrees.
+        translate (float): Maximum translation as a fraction of the image size.
+        scale (float): Scaling factor range, e.g. scale=0.5 means 0.5-1.5.
+        shear (float): Maximum shear angle in degrees.
+        perspective (float): Perspective distortion factor.
+        flipud (float): Probability of flipping each image vertically.
+        fliplr (float): Probability of flipping each image horizontally.
+
+    Methods:
+        from_hyp: Create a BatchAugment from training hyperparameters.
+        affine: Warp images and transform their boxes with random per-image affine or perspective matrices.
+        hsv_jitter: Apply random per-image HSV gains to RGB images.
+        __call__: Augment a collated batch dictionary.
+
+    Examples:
+        >>> augment = BatchAugment(degrees=10.0, fliplr=0.5)
+        >>> batch = {"img": torch.rand(8, 3, 640, 640), "bboxes": torch.rand(20, 4) * 0.5 + 0.25}
+        >>> batch.update(cls=torch.zeros(20, 1), batch_idx=torch.randint(0, 8, (20,)).float())
+        >>> batch = augment(batch)
+    """
+
+    def __init__(
+        self,
+        hsv_h: float = 0.015,
+        hsv_s: float = 0.7,
+        hsv_v: float = 0.4,
+        degrees: float = 0.0,
+        translate: float = 0.1,
+        scale: float = 0.5,
+        shear: float = 0.0,
+        perspective: float = 0.0,
+        flipud: float = 0.0,
+        fliplr: float = 0.5,
+    ) -> None:
+        """Initialize BatchAugment with augmentation gains and probabilities.
+
+        Args:
+            hsv_h (float): Hue gain.
+            hsv_s (float): Saturation gain.
+            hsv_v (float): Value gain.
+            degrees (float): Maximum absolute rotation in degrees.
+            translate (float): Maximum translation as a fraction of the image size.
+            scale (float): Scaling factor range.
+            shear (float): Maximum shear angle in degrees.
+            perspective (float): Perspective distortion factor.
+            flipud (float): Probability of flipping each image vertically.
+            fliplr (float): Probability of flipping each image horizontally.
+        """
+        self.hsv = (hsv_h, hsv_s, hsv_v)
+        self.degrees = degrees
+        self.translate = translate
+        self.scale = scale
+        self.shear = shear
+        self.perspective = perspective
+        self.flipud = flipud
+        self.fliplr = fliplr
+
+    @classmethod
+    def from_hyp(cls, hyp: IterableSimpleNamespace) -> BatchAugment:
+        """Create a BatchAugment from training hyperparameters, leaving affine warps per image while mosaic is on."""
+        keys = "hsv_h", "hsv_s", "hsv_v", "degrees", "translate", "scale", "shear", "perspective", "flipud", "fliplr"
+        affine = {"degrees", "translate", "scale", "shear", "perspective"}
+        return cls(**{k: 0.0 if hyp.mosaic and k in affine else getattr(hyp, k) for k in keys})
+
+    def __call__(self, batch: dict[str, Any]) -> dict[str, Any]:
+        """Augment a collated batch of images and boxes.
+
+        Args:
+            batch (dict[str, Any]): Batch with float 'img' (B, 3, H, W) in [0, 1], normalized xywh 'bboxes' (N, 4),
+                'cls' (N, 1) and 'batch_idx' (N,) tensors, all on the same device.
+
+        Returns:
+            (dict[str, Any]): The batch with augmented 'img' and the 'bboxes', 'cls' and 'batch_idx' of the boxes
+                that remain after the warp.
+        """
+        img = batch["img"]
+        b, _, h, w = img.shape
+        gain = img.new_tensor([w, h, w, h])
+        idx = batch["batch_idx"].long()
+        boxes = xywh2xyxy(batch["bboxes"].float()) * gain
+        if any((self.degrees, self.translate, self.scale, self.shear, self.perspective)):
+            img, boxes, keep = self.affine(img, boxes, idx)
+            idx = idx[keep]
+            for k in ("bboxes", "cls", "batch_idx"):
+                batch[k] = batch[k][keep]
+        if any(self.hsv) and img.shape[1] == 3:
+            img = self.hsv_jitter(img)
+        for p, dim, cols in ((self.flipud, 2, [1, 3]), (self.fliplr, 3, [0, 2])):
+            if p > 0:
+                flip = torch.rand(b, device=img.device) < p
+                img = torch.where(flip[:, None, None, None], img.flip(dim), img)
+                size = h if dim == 2 else w
+                boxes[:, cols] = torch.where(flip[idx, None], size - boxes[:, cols[::-1]], boxes[:, cols])
+        batch["img"] = img
+        batch["bboxes"] = xyxy2xywh(boxes / gain).to(batch["bboxes"].dtype)
+        return batch
+
+    def _uniform(self, n: int, bound: float, device: torch.device, center: float = 0.0) -> torch.Tensor:
+        """Return `n` random values uniformly drawn from [center - bound, center + bound]."""
+        return torch.empty(n, device=device).uniform_(center - bound, center + bound)
+
+    def affine(
+        self, img: torch.Tensor, boxes: torch.Tensor, idx: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Warp images and transform their boxes with random per-image affine or perspective matrices.
+
+        Matrices are composed as T @ S @ R @ P @ C like in RandomPerspective, images are resampled with a single
+        `grid_sample` over the inverse mapping, and boxes are filtered with the RandomPerspective.box_candidates rules.
+
+        Args:
+            img (torch.Tensor): Images (B, C, H, W) in [0, 1].
+            boxes (torch.Tensor): Boxes (N, 4) in xyxy pixels.
+            idx (torch.Tensor): Image index of each box with shape (N,).
+
+        Returns:
+            img (torch.Tensor): Warped images with padding value 114 / 255.
+            boxes (torch.Tensor): Transformed and clipped boxes of the kept instances.
+            keep (torch.Tensor): Boolean mask (N,) of the kept instances.
+        """
+        b, _, h, w = img.shape
+        dev = img.device
+        p = torch.stack([self._uniform(b, self.perspective, dev), self._uniform(b, self.perspective, dev)], 1)
+        a = self._uniform(b, self.degrees, dev) * math.pi / 180
+        s = self._uniform(b, self.scale, dev, center=1.0)
+        cos, sin = s * a.cos(), s * a.sin()
+        shx = torch.tan(self._uniform(b, self.shear, dev) * math.pi / 180)
+        shy = torch.tan(self._uniform(b, self.shear, dev) * math.pi / 180)
+        tx, ty = self._uniform(b, self.translate, dev, 0.5) * w, self._uniform(b, self.translate, dev, 0.5) * h
+        t = torch.stack([tx, ty], 1)
+        c = img.new_tensor([w / 2, h / 2])
+        K = torch.stack([cos - shx * sin, sin + shx * cos, shy * cos - sin, shy * sin + cos], 1).view(b, 2, 2)
+        K = K + t[:, :, None] * p[:, None, :]
+        M = torch.zeros(b, 3, 3, device=dev)
+        M[:, :2, :2] = K
+        M[:, :2, 2] = t - K @ c
+        M[:, 2, :2] = p
+        M[:, 2, 2] = 1 - p @ c
+
+        # Images, sampling each output pixel from the inverse-mapped input location
+        ys, xs = torch.arange(h, device=dev, dtype=torch.float32), torch.arange(w, device=dev, dtype=torch.float32)
+        dst = torch.stack([xs.view(1, w).expand(h, w), ys.view(h, 1).expand(h, w), torch.ones(h, w, device=dev)], -1)
+        src = dst.view(1, h * w, 3) @ torch.linalg.inv(M).transpose(1, 2)  # (B, H*W, 3)
+        grid = src[..., :2] / src[..., 2:3] / c.new_tensor([(w - 1) / 2, (h - 1) / 2]) - 1  # to [-1, 1]
+        fill = 114 / 255
+        img = F.grid_sample(img - fill, grid.view(b, h, w, 2).to(img.dtype), align_corners=True) + fill
+
+        # Boxes, transforming all 4 corners of every box with the matrix of its image
+        corners = boxes[:, [0, 1, 2, 3, 0, 3, 2, 1]].view(-1, 4, 2)  # x1y1, x2y2, x1y2, x2y1
+        xy = torch.cat((corners, torch.ones_like(corners[..., :1])), -1) @ M[idx].transpose(1, 2)
+        xy = xy[..., :2] / xy[..., 2:3]
+        new = torch.cat((xy.amin(1), xy.amax(1)), 1)
+        new[:, [0, 2]] = new[:, [0, 2]].clamp(0, w)
+        new[:, [1, 3]] = new[:, [1, 3]].clamp(0, h)
+
+        # Filter candidates like RandomPerspective.box_candidates, comparing to the original boxes scaled by s
+        w1, h1 = (boxes[:, 2] - boxes[:, 0]) * s[idx], (boxes[:, 3] - boxes[:, 1]) * s[idx]
+        w2, h2 = new[:, 2] - new[:, 0], new[:, 3] - new[:, 1]
+        ar = torch.maximum(w2 / (h2 + 1e-16), h2 / (w2 + 1e-16))
+        keep = (w2 > 2) & (h2 > 2) & (w2 * h2 / (w1 * h1 + 1e-16) > 0.1) & (ar < 100)
+        return img.clamp(0, 1), new[keep], keep
+
+    def hsv_jitter(self, img: torch.Tensor) -> torch.Tensor:
+        """Apply random per-image HSV gains to RGB images, matching RandomHSV.
+
+        Args:
+            img (torch.Tensor): RGB images (B, 3, H, W) in [0, 1].
+
+        Returns:
+            (torch.Tensor): Color-jittered RGB images.
+        """
+        b = img.shape[0]
+        r = torch.stack([self._uniform(b, g, img.device, center=1.0) for g in self.hsv], 1).view(b, 3, 1, 1).to(img)
+        red, green, blue = img.unbind(1)
+        v, vi = img.max(1)
+        delta = v - img.min(1)[0]
+        d = delta.clamp(min=1e-8)
+        hue = torch.stack([(green - blue) / d % 6, (blue - red) / d + 2, (red - green) / d + 4], 1)
+        hue = hue.gather(1, vi[:, None])[:, 0] / 6 * (delta > 0)
+        sat = delta / v.clamp(min=1e-8)
+
+        # Random gains, hue multiplied like the RandomHSV lookup table
+        hue = (hue * r[:, 0]) % 1.0
+        sat = (sat * r[:, 1]).clamp(0, 1)
+        v = (v * r[:, 2]).clamp(0, 1)
+
+        # Back to RGB
+        i = (hue * 6).floor()
+        f = hue * 6 - i
+        i = i.long() % 6
+        p, q, t = v * (1 - sat), v * (1 - sat * f), v * (1 - sat * (1 - f))
+        rgb = [
+            torch.stack(x, 1).gather(1, i[:, None])
+            for x in ((v, q, p, p, t, v), (t, v, v, q, p, p), (p, p, t, v, v, q))
+        ]
+        return torch.cat(rgb, 1)
+
+
 class LoadVisualPrompt:
     """Create visual prompts from bounding boxes or masks for model input."""
 
@@ -2398,7 +2691,12 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
         >>> hyp.augmentations = augmentations
         >>> transforms = v8_transforms(datasets, imgsz=640, hyp=hyp)
     """
-    mosaic = Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic)
+    if getattr(hyp, "batch_augment", False) and not (dataset.use_segments or dataset.use_keypoints or dataset.use_obb):
+        hyp = copy(hyp)  # HSV, flips and affine warps are applied to whole batches by the trainer, see BatchAugment
+        hyp.hsv_h = hyp.hsv_s = hyp.hsv_v = hyp.flipud = hyp.fliplr = 0.0
+        if not hyp.mosaic:  # with mosaic, warps stay per image to crop from the full 2x mosaic rather than pad
+            hyp.degrees = hyp.translate = hyp.scale = hyp.shear = hyp.perspective = 0.0
+    mosaic = Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic, reuse_canvas=True)  # always warped by affine next
     affine = RandomPerspective(
         degrees=hyp.degrees,
         translate=hyp.translate,
@@ -2415,7 +2713,7 @@ def v8_transforms(dataset, imgsz: int, hyp: IterableSimpleNamespace, stretch: bo
         pre_transform.append(
             CopyPaste(
                 dataset,
-                pre_transform=Compose([Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic), affine]),
+                pre_transform=Compose([Mosaic(dataset, imgsz=imgsz, p=hyp.mosaic, reuse_canvas=True), affine]),
                 p=hyp.copy_paste,
                 mode=hyp.copy_paste_mode,
             )
@@ -15,7 +15,8 @@ import cv2
 import numpy as np
 from torch.utils.data import Dataset
 
-from ultralytics.data.utils import FORMATS_HELP_MSG, HELP_URL, IMG_FORMATS, check_file_speeds
+from ultralytics.data.cache import ImageCache, LabelStore, ShardCache
+from ultralytics.data.utils import FORMATS_HELP_MSG, HELP_URL, IMG_FORMATS, check_file_speeds, get_hash
 from ultralytics.utils import DEFAULT_CFG, LOCAL_RANK, LOGGER, NUM_THREADS, TQDM
 from ultralytics.utils.patches import imread
 
@@ -112,8 +113,9 @@ class BaseDataset(Dataset):
         self.fraction = fraction
         self.channels = channels
         self.cv2_flag = cv2.IMREAD_GRAYSCALE if channels == 1 else cv2.IMREAD_COLOR
+        self.shards = ShardCache.load(img_path) if ShardCache.is_shards(img_path) else None  # packed shard dataset
         self.im_files = self.get_img_files(self.img_path)
-        self.labels = self.get_labels()
+        self.labels = labels = self.get_labels()  # unfiltered labels are saved with image shards
         self.update_labels(include_class=classes)  # single_cls and include_class
         self.ni = len(self.labels)  # number of images
         self.rect = rect
@@ -128,19 +130,21 @@ class BaseDataset(Dataset):
         self.buffer = []  # buffer size = batch size
         self.max_buffer_length = min((self.ni, self.batch_size * 8, 1000)) if self.augment else 0
 
-        # Cache images (options are cache = True, False, None, "ram", "disk")
+        # Cache images (options are cache = True, False, None, "ram", "disk", "mmap", "shards", "shards-webp", ...)
         self.ims, self.im_hw0, self.im_hw = [None] * self.ni, [None] * self.ni, [None] * self.ni
         self.npy_files = [Path(f).with_suffix(".npy") for f in self.im_files]
         self.cache = cache.lower() if isinstance(cache, str) else "ram" if cache is True else None
-        if self.cache == "ram" and self.check_cache_ram():
+        if self.shards is not None:  # images are read from the packed shards
+            self.ims, self.cache = self.shards, "shards"
+        elif self.cache == "ram" and self.check_cache_ram():
             if hyp.deterministic:
                 LOGGER.warning(
                     "cache='ram' may produce non-deterministic training results. "
                     "Consider cache='disk' as a deterministic alternative if your disk space allows."
                 )
             self.cache_images()
-        elif self.cache == "disk" and self.check_cache_disk():
-            self.cache_images()
+        elif (self.cache in {"disk", "mmap"} or str(self.cache).startswith("shards")) and self.check_cache_disk():
+            self.cache_images(labels)
 
         # Transforms
         self.transforms = self.build_transforms(hyp=hyp)
@@ -157,6 +161,9 @@ class BaseDataset(Dataset):
         Raises:
             FileNotFoundError: If no images are found or the path doesn't exist.
         """
+        if self.shards is not None:  # packed shard dataset, no directory to scan
+            n = round(len(self.shards) * self.fraction)
+            return self.shards.im_files[:n]
         try:
             f = []  # image files
             for p in img_path if isinstance(img_path, list) else [img_path]:
@@ -188,6 +195,9 @@ class BaseDataset(Dataset):
         Args:
             include_class (list[int], optional): List of classes to include. If None, all classes are included.
         """
+        if isinstance(self.labels, LabelStore):
+            self.labels = self.labels.filter_classes(include_class, self.single_cls)
+            return
         include_class_array = np.array(include_class).reshape(1, -1)
         for i in range(len(self.labels)):
             if include_class is not None:
@@ -220,6 +230,8 @@ class BaseDataset(Dataset):
         Raises:
             FileNotFoundError: If the image file is not found.
         """
+        if isinstance(self.ims, (ImageCache, ShardCache)):  # shared memory-mapped or packed shard cache
+            return self.ims[i]
         im, f, fn = self.ims[i], self.im_files[i], self.npy_files[i]
         if im is None:  # not cached in RAM
             if fn.exists():  # load npy
@@ -258,8 +270,40 @@ class BaseDataset(Dataset):
 
         return self.ims[i], self.im_hw0[i], self.im_hw[i]
 
-    def cache_images(self) -> None:
-        """Cache images to memory or disk for faster training."""
+    def cache_images(self, labels: LabelStore | list[dict] | None = None) -> None:
+        """Cache images to memory or disk for faster training.
+
+        With cache='mmap', resized images are packed into one file next to the image directory and memory-mapped, so
+        all dataloader workers and DDP ranks on a node share a single copy through the OS page cache. With
+        cache='shards' (JPEG), 'shards-webp' or 'shards-png', resized images are re-encoded and packed with the labels
+        into a shard directory next to the image directory, which can also be used directly as a dataset path.
+
+        Args:
+            labels (LabelStore | list[dict], optional): Labels before `classes` and `single_cls` filtering to save with
+                image shards, so a shard directory is a complete dataset. Defaults to the dataset labels.
+        """
+        if self.cache.startswith("shards"):
+            fmt = self.cache.partition("-")[2] or "jpg"
+            if labels is None:
+                labels = self.labels
+            elif isinstance(labels, LabelStore) and labels is not self.labels:  # follow any rect reordering
+                i = {f: j for j, f in enumerate(labels.files)}
+                labels = labels[np.array([i[f] for f in self.im_files])]
+            key = get_hash(self.im_files + [type(self).__name__, f"{self.imgsz}", f"{self.channels}", fmt])[:16]
+            path = Path(self.im_files[0]).parent.with_suffix(f".{key}.shards")
+            self.ims = ShardCache.load(path, self.ni) or ShardCache.build(
+                path, self.load_image, self.ni, fmt, im_files=self.im_files, labels=labels, prefix=self.prefix
+            )
+            if LOCAL_RANK in {-1, 0}:
+                LOGGER.info(f"{self.prefix}Caching images ({self.ims.nbytes / (1 << 30):.2f}GB {fmt} shards) in {path}")
+            return
+        if self.cache == "mmap":
+            key = get_hash(self.im_files + [type(self).__name__, f"{self.imgsz}", f"{self.channels}"])[:16]  # resize
+            file = Path(self.im_files[0]).parent.with_suffix(f".{key}.images")
+            self.ims = ImageCache.load(file, self.ni) or ImageCache.build(file, self.load_image, self.ni, self.prefix)
+            if LOCAL_RANK in {-1, 0}:
+                LOGGER.info(f"{self.prefix}Caching images ({self.ims.nbytes / (1 << 30):.1f}GB mmap) in {file}")
+            return
         b, gb = 0, 1 << 30  # bytes of cached images, bytes per gigabytes
         fcn, storage = (self.cache_images_to_disk, "Disk") if self.cache == "disk" else (self.load_image, "RAM")
         with ThreadPool(NUM_THREADS) as pool:
@@ -349,11 +393,12 @@ class BaseDataset(Dataset):
         bi = np.floor(np.arange(self.ni) / self.batch_size).astype(int)  # batch index
         nb = bi[-1] + 1  # number of batches
 
-        s = np.array([x.pop("shape") for x in self.labels])  # hw
+        is_store = isinstance(self.labels, LabelStore)
+        s = self.labels.shapes if is_store else np.array([x.pop("shape") for x in self.labels])  # hw
         ar = s[:, 0] / s[:, 1]  # aspect ratio
         irect = ar.argsort()
         self.im_files = [self.im_files[i] for i in irect]
-        self.labels = [self.labels[i] for i in irect]
+        self.labels = self.labels[irect] if is_store else [self.labels[i] for i in irect]
         ar = ar[irect]
 
         # Set training image shapes
@@ -373,6 +418,12 @@ class BaseDataset(Dataset):
         """Return transformed label information for given index."""
         return self.transforms(self.get_image_and_label(index))
 
+    def __getitems__(self, indices: list[int]) -> list[dict[str, Any]]:
+        """Return transformed label information for a batch of indices, decoding shard images ahead in threads."""
+        if isinstance(self.ims, ShardCache):
+            self.ims.prefetch(indices)
+        return [self[i] for i in indices]
+
     def get_image_and_label(self, index: int) -> dict[str, Any]:
         """Get and return label information from the datasets.
 
@@ -382,7 +433,9 @@ class BaseDataset(Dataset):
         Returns:
             (dict[str, Any]): Label dictionary with image and metadata.
         """
-        label = deepcopy(self.labels[index])  # requires deepcopy() https://github.com/ultralytics/ultralytics/pull/1948
+        label = self.labels[index]  # a LabelStore returns a fresh dict that owns its arrays
+        if not isinstance(self.labels, LabelStore):
+            label = deepcopy(label)  # requires deepcopy() https://github.com/ultralytics/ultralytics/pull/1948
         label.pop("shape", None)  # shape is for rect, remove it
         label["img"], label["ori_shape"], label["resized_shape"] = self.load_image(index)
         label["ratio_pad"] = (
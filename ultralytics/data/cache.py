@@ -0,0 +1,609 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+"""Columnar, memory-mapped and packed dataset caches shared by all dataloader workers."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+from typing import Any, Callable
+
+import cv2
+import numpy as np
+
+from ultralytics.utils import LOCAL_RANK, LOGGER, NUM_THREADS, TQDM, is_dir_writeable
+
+
+class LabelStore:
+    """Columnar store of YOLO labels that is memory-mapped from a single binary cache file.
+
+    Instead of one dictionary per image, all instances of a dataset live in flat arrays: float32 `cls` (M, 1) and
+    `bboxes` (M, 4), optional `keypoints` (M, K, D), and polygon points (P, 2) indexed by per-instance `seg_offset`. The
+    instances of image `i` are rows `offset[i]:offset[i + 1]`. A saved store is opened with a single read-only `mmap`,
+    so dataloader workers share the page cache instead of each unpickling its own copy of every label, and indexing an
+    image slices the columns instead of deep-copying a dictionary.
+
+    Attributes:
+        columns (dict[str, np.ndarray]): Column arrays, possibly memory-mapped and read-only.
+        im_files (list[str]): Image file of each stored image.
+        index (np.ndarray): Stored image index of each image of this view, in order.
+        meta (dict): Metadata saved with the store, e.g. hash, version and scan results.
+        file (Path | None): Backing cache file, None for stores held only in memory.
+
+    Methods:
+        from_labels: Build a store from a list of label dictionaries.
+        save: Save the store to a binary cache file.
+        load: Open a saved store with memory mapping.
+        filter_classes: Return a store keeping only the instances of some classes.
+        drop_segments: Return a store without segments.
+
+    Examples:
+        >>> store = LabelStore.from_labels(labels)
+        >>> store.save(Path("labels.cache"), meta={"hash": "abc"})
+        >>> store = LabelStore.load(Path("labels.cache"))
+        >>> label = store[0]  # dict with 'im_file', 'shape', 'cls', 'bboxes', 'segments', 'keypoints', ...
+        >>> sorted_store = store[np.argsort(store.shapes[:, 0])]  # reordered view, no copy of the columns
+    """
+
+    MAGIC = b"ULTRALYTICS-LABELS\x00\x01"
+    ALIGN = 64  # column byte alignment
+
+    def __init__(
+        self,
+        columns: dict[str, np.ndarray],
+        im_files: list[str],
+        index: np.ndarray | None = None,
+        meta: dict | None = None,
+        file: Path | None = None,
+    ):
+        """Initialize the LabelStore from column arrays.
+
+        Args:
+            columns (dict[str, np.ndarray]): Column arrays with at least 'shape', 'offset', 'cls' and 'bboxes'.
+            im_files (list[str]): Image file of each stored image.
+            index (np.ndarray, optional): Stored image index of each image of this view. Defaults to all, in order.
+            meta (dict, optional): Metadata such as hash, version and scan results.
+            file (Path, optional): Backing cache file the columns are memory-mapped from.
+        """
+        self.columns = columns
+        self.im_files = im_files
+        self.index = np.arange(len(im_files)) if index is None else np.asarray(index, dtype=np.int64)
+        self.meta = meta or {}
+        self.file = file
+
+    @classmethod
+    def from_labels(cls, labels: list[dict[str, Any]], meta: dict | None = None) -> LabelStore:
+        """Build a store from a list of label dictionaries as produced by `YOLODataset.cache_labels`.
+
+        Args:
+            labels (list[dict]): Label dictionaries with 'im_file', 'shape', 'cls', 'bboxes', 'segments', 'keypoints'.
+            meta (dict, optional): Metadata to keep with the store.
+
+        Returns:
+            (LabelStore): In-memory store holding the labels.
+        """
+        counts = [len(lb["cls"]) for lb in labels]
+        columns = {
+            "shape": np.array([lb["shape"] for lb in labels], dtype=np.int32).reshape(-1, 2),
+            "offset": np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+            "cls": np.concatenate([lb["cls"] for lb in labels] or [np.zeros((0, 1))]).astype(np.float32).reshape(-1, 1),
+            "bboxes": np.concatenate([lb["bboxes"] for lb in labels] or [np.zeros((0, 4))]).astype(np.float32),
+        }
+        kpts = [lb["keypoints"] for lb in labels if lb["keypoints"] is not None]
+        if kpts:
+            columns["keypoints"] = np.concatenate(kpts).astype(np.float32)
+        if any(len(lb["segments"]) for lb in labels):
+            segments = [
+                s for lb, n in zip(labels, counts) for s in (lb["segments"] or [np.zeros((0, 2))] * n)
+            ]  # one polygon per instance, empty for images without segments
+            columns["seg_offset"] = np.concatenate(([0], np.cumsum([len(s) for s in segments]))).astype(np.int64)
+            columns["segments"] = np.concatenate(segments).astype(np.float32).reshape(-1, 2)
+        return cls(columns, [lb["im_file"] for lb in labels], meta=meta)
+
+    def save(self, path: Path, meta: dict | None = None, prefix: str = "") -> bool:
+        """Save the store to a single binary file of a JSON header followed by aligned raw columns.
+
+        Args:
+            path (Path): Cache file path.
+            meta (dict, optional): Metadata to save instead of `self.meta`.
+            prefix (str): Prefix for log messages.
+
+        Returns:
+            (bool): Whether the file was written.
+        """
+        if not is_dir_writeable(path.parent):
+            LOGGER.warning(f"{prefix}Cache directory {path.parent} is not writable, cache not saved.")
+            return False
+        store = self if np.array_equal(self.index, np.arange(len(self.im_files))) else self.compact()
+        columns, offset = {}, 0
+        for k, v in store.columns.items():
+            columns[k] = {"dtype": v.dtype.str, "shape": list(v.shape), "offset": offset}
+            offset += -(-v.nbytes // self.ALIGN) * self.ALIGN
+        header = json.dumps({"meta": meta or self.meta, "im_files": store.im_files, "columns": columns}).encode()
+        start = -(-(len(self.MAGIC) + 8 + len(header)) // self.ALIGN) * self.ALIGN
+        tmp = path.with_suffix(".cache.tmp")  # write aside, then swap in, as the old file may still be mapped
+        with open(tmp, "wb") as f:
+            f.write(self.MAGIC + struct.pack("<Q", len(header)) + header)
+            for k, v in store.columns.items():
+                f.seek(start + columns[k]["offset"])
+                f.write(np.ascontiguousarray(v).tobytes())
+            f.truncate(start + offset)
+        os.replace(tmp, path)
+        LOGGER.info(f"{prefix}New cache created: {path}")
+        return True
+
+    @classmethod
+    def load(cls, path: Path) -> LabelStore:
+        """Open a saved store, memory-mapping all columns read-only.
+
+        Args:
+            path (Path): Cache file path.
+
+        Returns:
+            (LabelStore): Store whose columns are views of one read-only memory map of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            AssertionError: If the file is not a label store, e.g. a pickled cache of an older version.
+        """
+        with open(path, "rb") as f:
+            assert f.read(len(cls.MAGIC)) == cls.MAGIC, f"{path} is not a label store"
+            size = f.read(8)
+            assert len(size) == 8, f"{path} is truncated"
+            size = struct.unpack("<Q", size)[0]
+            header = json.loads(f.read(size))
+        start = -(-(len(cls.MAGIC) + 8 + size) // cls.ALIGN) * cls.ALIGN
+        buf = np.memmap(path, dtype=np.uint8, mode="r")
+        columns = {}
+        for k, c in header["columns"].items():
+            dtype, shape = np.dtype(c["dtype"]), tuple(c["shape"])
+            i = start + c["offset"]
+            columns[k] = buf[i : i + dtype.itemsize * int(np.prod(shape))].view(dtype).reshape(shape)
+        return cls(columns, header["im_files"], meta=header["meta"], file=Path(path))
+
+    def __getstate__(self) -> dict:
+        """Pickle a file-backed store by path, so spawned dataloader workers map the file instead of copying arrays."""
+        state = self.__dict__.copy()
+        if self.file is not None:
+            state["columns"] = list(self.columns)  # column names only
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled store, re-mapping its backing file if it was pickled by path."""
+        self.__dict__.update(state)
+        if isinstance(self.columns, list):
+            columns = LabelStore.load(self.file).columns
+            self.columns = {k: columns[k] for k in self.columns}
+
+    def __len__(self) -> int:
+        """Return the number of images in the store."""
+        return len(self.index)
+
+    def __iter__(self):
+        """Iterate over the label dictionaries of all images."""
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, idx: int | slice | list | np.ndarray) -> dict[str, Any] | LabelStore:
+        """Return the label dictionary of one image, or a store view of several images.
+
+        Args:
+            idx (int | slice | list | np.ndarray): Image index, or indices/slice/boolean mask selecting images.
+
+        Returns:
+            (dict | LabelStore): For an int, a fresh label dictionary owning copies of its arrays, so it can be modified
+                freely; otherwise a LabelStore view sharing the same columns.
+        """
+        if not isinstance(idx, (int, np.integer)):
+            return LabelStore(self.columns, self.im_files, self.index[idx], self.meta, self.file)
+        i = self.index[idx]
+        c = self.columns
+        a, b = c["offset"][i], c["offset"][i + 1]
+        segments = []
+        if "seg_offset" in c:
+            so = c["seg_offset"][a : b + 1]
+            if so[-1] > so[0]:  # this image has segments
+                segments = [np.array(c["segments"][s:e]) for s, e in zip(so[:-1], so[1:])]
+        return {
+            "im_file": self.im_files[i],
+            "shape": tuple(int(x) for x in c["shape"][i]),
+            "cls": np.array(c["cls"][a:b]),
+            "bboxes": np.array(c["bboxes"][a:b]),
+            "segments": segments,
+            "keypoints": np.array(c["keypoints"][a:b]) if "keypoints" in c else None,
+            "normalized": True,
+            "bbox_format": "xywh",
+        }
+
+    @property
+    def shapes(self) -> np.ndarray:
+        """Return the (height, width) shape of every image with shape (N, 2)."""
+        return self.columns["shape"][self.index]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Return the number of instances of every image with shape (N,)."""
+        offset = self.columns["offset"]
+        return offset[self.index + 1] - offset[self.index]
+
+    @property
+    def files(self) -> list[str]:
+        """Return the image file of every image, in order."""
+        return [self.im_files[i] for i in self.index]
+
+    def num_segments(self) -> int:
+        """Return the number of instances that have a segment polygon."""
+        if "seg_offset" not in self.columns:
+            return 0
+        offset, seg_offset = self.columns["offset"], self.columns["seg_offset"]
+        n = np.diff(seg_offset) > 0  # per instance
+        csum = np.concatenate(([0], np.cumsum(n)))
+        return int((csum[offset[self.index + 1]] - csum[offset[self.index]]).sum())
+
+    def compact(self, keep: np.ndarray | None = None) -> LabelStore:
+        """Return an in-memory store holding only the images of this view and optionally only some instances.
+
+        Args:
+            keep (np.ndarray, optional): Boolean mask over all stored instances to keep. Defaults to all.
+
+        Returns:
+            (LabelStore): A new store with contiguous columns and identity index.
+        """
+        c = self.columns
+        counts = self.counts
+        starts = np.cumsum(counts) - counts
+        rows = np.repeat(c["offset"][self.index] - starts, counts) + np.arange(counts.sum())  # stored instance rows
+        if keep is not None:
+            m = keep[rows]
+            csum = np.concatenate(([0], np.cumsum(m)))
+            counts = csum[starts + counts] - csum[starts]
+            rows = rows[m]
+        columns = {
+            "shape": np.array(self.shapes),
+            "offset": np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+            **{k: np.array(c[k][rows]) for k in ("cls", "bboxes", "keypoints") if k in c},
+        }
+        if "seg_offset" in c:
+            so = c["seg_offset"]
+            lengths = so[rows + 1] - so[rows]
+            seg_starts = np.cumsum(lengths) - lengths
+            points = np.repeat(so[rows] - seg_starts, lengths) + np.arange(lengths.sum())
+            columns["seg_offset"] = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+            columns["segments"] = np.array(c["segments"][points])
+        return LabelStore(columns, self.files, meta=self.meta)
+
+    def filter_classes(self, include_class: list[int] | None, single_cls: bool = False) -> LabelStore:
+        """Return a store keeping only instances of the given classes, optionally mapping all classes to 0.
+
+        Args:
+            include_class (list[int], optional): Classes to keep. If None, all instances are kept.
+            single_cls (bool): Whether to set every class to 0.
+
+        Returns:
+            (LabelStore): Filtered in-memory store, or self if nothing changes.
+        """
+        if include_class is None and not single_cls:
+            return self
+        keep = None if include_class is None else np.isin(self.columns["cls"][:, 0], include_class)
+        store = self.compact(keep)
+        if single_cls:
+            store.columns["cls"][:] = 0
+        return store
+
+    def drop_segments(self) -> LabelStore:
+        """Return a view of this store without segment polygons."""
+        columns = {k: v for k, v in self.columns.items() if k not in {"seg_offset", "segments"}}
+        return LabelStore(columns, self.im_files, self.index, self.meta, self.file)
+
+
+class ImageCache:
+    """Resized dataset images packed into one memory-mapped file that all dataloader workers and DDP ranks share.
+
+    Images are decoded and resized once, then written back to back into a raw file with a (N, 6) index of byte offset,
+    resized height, width and channels, and original height and width. Every process maps the file read-only, so the
+    images live once in the OS page cache rather than once per worker in private memory, and reading an image returns a
+    view of the mapping. The index is written last and marks a complete cache, which later runs and other ranks reuse.
+
+    Attributes:
+        file (Path): Raw image data file. The index is saved next to it with an extra '.index.npy' suffix.
+        index (np.ndarray): Index rows of (offset, h, w, c, h0, w0) per image.
+
+    Methods:
+        build: Decode, resize and pack all images into a new cache file.
+        load: Open an existing complete cache file.
+
+    Examples:
+        >>> cache = ImageCache.load(file, n=len(dataset)) or ImageCache.build(file, dataset.load_image, len(dataset))
+        >>> im, hw_original, hw_resized = cache[0]  # read-only view of the mapped file
+    """
+
+    def __init__(self, file: Path, index: np.ndarray):
+        """Initialize the ImageCache from a cache file and its index.
+
+        Args:
+            file (Path): Raw image data file.
+            index (np.ndarray): Index rows of (offset, h, w, c, h0, w0) per image.
+        """
+        self.file = Path(file)
+        self.index = index
+        self._buf = None
+
+    @staticmethod
+    def index_file(file: Path) -> Path:
+        """Return the index file path of a cache file."""
+        return file.with_name(f"{file.name}.index.npy")
+
+    @classmethod
+    def build(cls, file: Path, load: Callable, n: int, prefix: str = "") -> ImageCache:
+        """Decode, resize and pack all images into a new cache file.
+
+        Args:
+            file (Path): Raw image data file to create.
+            load (Callable): Function `load(i) -> (im, hw_original, hw_resized)` returning image `i` as (h, w, c).
+            n (int): Number of images.
+            prefix (str): Prefix for the progress bar.
+
+        Returns:
+            (ImageCache): The new cache.
+        """
+        index, offset, gb = np.zeros((n, 6), dtype=np.int64), 0, 1 << 30
+        tmp = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f, ThreadPool(NUM_THREADS) as pool:
+            pbar = TQDM(enumerate(pool.imap(load, range(n))), total=n, disable=LOCAL_RANK > 0)
+            for i, (im, hw0, _) in pbar:
+                f.write(np.ascontiguousarray(im).tobytes())
+                index[i] = offset, *im.shape, *hw0
+                offset += im.nbytes
+                pbar.desc = f"{prefix}Caching images ({offset / gb:.1f}GB mmap)"
+            pbar.close()
+        tmp.replace(file)
+        np.save(cls.index_file(file), index, allow_pickle=False)  # written last, marks the cache complete
+        return cls(file, index)
+
+    @classmethod
+    def load(cls, file: Path, n: int) -> ImageCache | None:
+        """Open an existing complete cache file.
+
+        Args:
+            file (Path): Raw image data file.
+            n (int): Expected number of images.
+
+        Returns:
+            (ImageCache | None): The cache, or None if it is missing, incomplete or does not match `n` images.
+        """
+        try:
+            index = np.load(cls.index_file(file), allow_pickle=False)
+            size = file.stat().st_size
+        except (OSError, ValueError):
+            return None
+        if len(index) != n or size != index[-1, 0] + index[-1, 1:4].prod():
+            return None
+        return cls(file, index)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of all cached images in bytes."""
+        return int(self.index[-1, 0] + self.index[-1, 1:4].prod()) if len(self.index) else 0
+
+    def __getstate__(self) -> dict:
+        """Pickle without the memory map, so each process maps the file itself."""
+        return {**self.__dict__, "_buf": None}
+
+    def __len__(self) -> int:
+        """Return the number of cached images."""
+        return len(self.index)
+
+    def __getitem__(self, i: int) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+        """Return image `i` as a read-only view with its original and resized (height, width)."""
+        if self._buf is None:
+            self._buf = np.memmap(self.file, dtype=np.uint8, mode="r")  # mapped lazily in each process
+        o, h, w, c, h0, w0 = self.index[i].tolist()
+        return self._buf[o : o + h * w * c].reshape(h, w, c), (h0, w0), (h, w)
+
+
+class ShardCache:
+    """Resized dataset images re-encoded at train resolution and packed into large sequential shard files.
+
+    Images are decoded and resized once, optionally re-encoded as JPEG, WebP or PNG, and appended to shard files of
+    about `shard_size` bytes each, with a (N, 8) index of shard, byte offset, byte length, resized height, width and
+    channels, and original height and width. The label store of the dataset is saved alongside as 'labels.cache', so a
+    shard directory is a self-contained dataset that can be passed as the image path of a YOLODataset. Training then
+    reads a handful of large files instead of one image and one label file per sample, which suits network storage,
+    and the encoded images are several times smaller than raw '.npy' caches. Reading an image decodes it from a
+    memory-mapped shard; `prefetch` decodes the images of a whole batch ahead in a thread pool.
+
+    Attributes:
+        path (Path): Shard directory holding 'shard-*.bin', 'labels.cache', 'meta.json' and 'index.npy'.
+        index (np.ndarray): Index rows of (shard, offset, nbytes, h, w, c, h0, w0) per image.
+        fmt (str): Image encoding, one of 'jpg', 'webp', 'png' or 'raw' for uncompressed pixels.
+        im_files (list[str]): Source image file of each packed image.
+        threads (int): Number of decode threads used by `prefetch` in each process.
+
+    Methods:
+        build: Decode, resize, encode and pack all images into a new shard directory.
+        load: Open an existing complete shard directory.
+        prefetch: Start decoding images in the thread pool ahead of their use.
+
+    Examples:
+        >>> shards = ShardCache.build(Path("train.shards"), dataset.load_image, len(dataset), labels=dataset.labels)
+        >>> shards.prefetch([0, 1, 2, 3])
+        >>> im, hw_original, hw_resized = shards[0]
+        >>> dataset = YOLODataset(img_path="train.shards", data=data)  # train directly from the shards
+    """
+
+    FORMATS = {"jpg", "webp", "png", "raw"}
+
+    def __init__(self, path: Path, index: np.ndarray, fmt: str, im_files: list[str], threads: int = 4):
+        """Initialize the ShardCache from a shard directory and its index.
+
+        Args:
+            path (Path): Shard directory.
+            index (np.ndarray): Index rows of (shard, offset, nbytes, h, w, c, h0, w0) per image.
+            fmt (str): Image encoding, one of 'jpg', 'webp', 'png' or 'raw'.
+            im_files (list[str]): Source image file of each packed image.
+            threads (int): Number of decode threads used by `prefetch` in each process.
+        """
+        self.path = Path(path)
+        self.index = index
+        self.fmt = fmt
+        self.im_files = im_files
+        self.threads = threads
+        self._maps = {}
+        self._pool = None
+        self._pending = {}
+        self._pid = os.getpid()
+
+    @staticmethod
+    def is_shards(path: Any) -> bool:
+        """Return whether a dataset path is a shard directory."""
+        return isinstance(path, (str, Path)) and (Path(path) / "index.npy").is_file()
+
+    @classmethod
+    def build(
+        cls,
+        path: Path,
+        load: Callable,
+        n: int,
+        fmt: str = "jpg",
+        quality: int = 95,
+        shard_size: int = 1 << 30,
+        im_files: list[str] | None = None,
+        labels: LabelStore | None = None,
+        prefix: str = "",
+    ) -> ShardCache:
+        """Decode, resize, encode and pack all images into a new shard directory.
+
+        Args:
+            path (Path): Shard directory to create. An existing directory is replaced.
+            load (Callable): Function `load(i) -> (im, hw_original, hw_resized)` returning image `i` as (h, w, c).
+            n (int): Number of images.
+            fmt (str): Image encoding, one of 'jpg', 'webp', 'png' or 'raw'. Images with other than 1 or 3 channels
+                are always stored raw.
+            quality (int): JPEG or WebP quality from 0 to 100.
+            shard_size (int): Approximate size of each shard file in bytes.
+            im_files (list[str], optional): Source image file of each image.
+            labels (LabelStore, optional): Labels of the images, saved so the directory is a self-contained dataset.
+            prefix (str): Prefix for the progress bar.
+
+        Returns:
+            (ShardCache): The new shard cache.
+        """
+        import shutil
+
+        if fmt not in cls.FORMATS:
+            raise ValueError(f"Invalid shard format '{fmt}', valid formats are {sorted(cls.FORMATS)}.")
+        params = {
+            "jpg": [cv2.IMWRITE_JPEG_QUALITY, quality],
+            "webp": [cv2.IMWRITE_WEBP_QUALITY, quality],
+            "png": [cv2.IMWRITE_PNG_COMPRESSION, 1],
+        }
+
+        def encode(i):
+            """Load image `i` and return its encoded bytes, shape and original (height, width)."""
+            im, hw0, _ = load(i)
+            if fmt == "raw" or im.shape[2] not in {1, 3}:
+                return np.ascontiguousarray(im).tobytes(), im.shape, hw0
+            return cv2.imencode(f".{fmt}", im, params[fmt])[1].tobytes(), im.shape, hw0
+
+        path = Path(path)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")  # build aside so readers never see a partial dataset
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        index, shard, offset, total, gb = np.zeros((n, 8), dtype=np.int64), 0, 0, 0, 1 << 30
+        f = open(tmp / f"shard-{shard:05d}.bin", "wb")
+        try:
+            with ThreadPool(NUM_THREADS) as pool:
+                pbar = TQDM(enumerate(pool.imap(encode, range(n))), total=n, disable=LOCAL_RANK > 0)
+                for i, (data, shape, hw0) in pbar:
+                    if offset and offset + len(data) > shard_size:  # start the next shard
+                        f.close()
+                        shard, offset = shard + 1, 0
+                        f = open(tmp / f"shard-{shard:05d}.bin", "wb")
+                    f.write(data)
+                    index[i] = shard, offset, len(data), *shape, *hw0
+                    offset += len(data)
+                    total += len(data)
+                    pbar.desc = f"{prefix}Packing images ({total / gb:.2f}GB {fmt} shards)"
+                pbar.close()
+        finally:
+            f.close()
+        im_files = list(im_files) if im_files is not None else [str(i) for i in range(n)]
+        if isinstance(labels, LabelStore):
+            labels.save(tmp / "labels.cache", prefix=prefix)
+            im_files = labels.files
+        (tmp / "meta.json").write_text(json.dumps({"format": fmt, "im_files": im_files}))
+        np.save(tmp / "index.npy", index, allow_pickle=False)  # written last, marks the shards complete
+        shutil.rmtree(path, ignore_errors=True)
+        try:
+            tmp.rename(path)
+        except OSError:  # another process finished first
+            shutil.rmtree(tmp, ignore_errors=True)
+            return cls.load(path, n)
+        return cls(path, index, fmt, im_files)
+
+    @classmethod
+    def load(cls, path: Path, n: int | None = None) -> ShardCache | None:
+        """Open an existing complete shard directory.
+
+        Args:
+            path (Path): Shard directory.
+            n (int, optional): Expected number of images, not checked if None.
+
+        Returns:
+            (ShardCache | None): The shard cache, or None if it is missing, incomplete or does not match `n` images.
+        """
+        path = Path(path)
+        try:
+            index = np.load(path / "index.npy", allow_pickle=False)
+            meta = json.loads((path / "meta.json").read_text())
+            ends = {int(s): int(e) for s, e in zip(index[:, 0], index[:, 1] + index[:, 2])}  # last end per shard
+            sizes = {s: (path / f"shard-{s:05d}.bin").stat().st_size for s in ends}
+        except (OSError, ValueError, KeyError):
+            return None
+        if (n is not None and len(index) != n) or any(sizes[s] != e for s, e in ends.items()):
+            return None
+        return cls(path, index, meta["format"], meta["im_files"])
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of all packed images in bytes."""
+        return int(self.index[:, 2].sum())
+
+    def __getstate__(self) -> dict:
+        """Pickle without memory maps and threads, so each process opens its own."""
+        return {**self.__dict__, "_maps": {}, "_pool": None, "_pending": {}}
+
+    def __len__(self) -> int:
+        """Return the number of packed images."""
+        return len(self.index)
+
+    def __getitem__(self, i: int) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+        """Return image `i` with its original and resized (height, width), waiting for it if prefetched."""
+        future = self._pending.pop(i, None)
+        return future.result() if future is not None else self._decode(i)
+
+    def _decode(self, i: int) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+        """Read image `i` from its memory-mapped shard and decode it."""
+        s, o, nb, h, w, c, h0, w0 = self.index[i].tolist()
+        buf = self._maps.get(s)
+        if buf is None:  # mapped lazily in each process
+            buf = self._maps[s] = np.memmap(self.path / f"shard-{s:05d}.bin", dtype=np.uint8, mode="r")
+        buf = buf[o : o + nb]
+        im = buf if self.fmt == "raw" or c not in {1, 3} else cv2.imdecode(buf, cv2.IMREAD_UNCHANGED)
+        return im.reshape(h, w, c), (h0, w0), (h, w)
+
+    def prefetch(self, indices: list[int]) -> None:
+        """Start decoding images in the thread pool, so later reads of these indices only wait for the result.
+
+        Args:
+            indices (list[int]): Indices of the images about to be read.
+        """
+        if self._pool is None or self._pid != os.getpid():  # threads do not survive a fork into a worker
+            self._pool, self._pending, self._pid = ThreadPoolExecutor(self.threads), {}, os.getpid()
+        if len(self._pending) > 4 * len(indices):  # drop prefetches that were never read
+            self._pending.clear()
+        for i in indices:
+            if i not in self._pending:
+                self._pending[i] = self._pool.submit(self._decode, i)
@@ -30,6 +30,7 @@ from .augment import (
     v8_transforms,
 )
 from .base import BaseDataset
+from .cache import LabelStore
 from .converter import merge_multi_segment
 from .utils import (
     HELP_URL,
@@ -43,7 +44,7 @@ from .utils import (
 )
 
 # Ultralytics datasets *.cache version, >= 1.0.0 for Ultralytics YOLO models
-DATASET_CACHE_VERSION = "1.0.3"
+DATASET_CACHE_VERSION = "2.0.0"
 
 
 class YOLODataset(BaseDataset):
@@ -87,16 +88,16 @@ class YOLODataset(BaseDataset):
         assert not (self.use_segments and self.use_keypoints), "Can not use both segments and keypoints."
         super().__init__(*args, channels=self.data.get("channels", 3), **kwargs)
 
-    def cache_labels(self, path: Path = Path("./labels.cache")) -> dict:
+    def cache_labels(self, path: Path = Path("./labels.cache")) -> LabelStore:
         """Cache datasets labels, check images and read shapes.
 
         Args:
             path (Path): Path where to save the cache file.
 
         Returns:
-            (dict): Dictionary containing cached labels and related information.
+            (LabelStore): Columnar labels, memory-mapped from the saved cache file, with scan results in `meta`.
         """
-        x = {"labels": []}
+        labels = []
         nm, nf, ne, nc, msgs = 0, 0, 0, 0, []  # number missing, found, empty, corrupt, messages
         desc = f"{self.prefix}Scanning {path.parent / path.stem}..."
         total = len(self.im_files)
@@ -127,7 +128,7 @@ class YOLODataset(BaseDataset):
                 ne += ne_f
                 nc += nc_f
                 if im_file:
-                    x["labels"].append(
+                    labels.append(
                         {
                             "im_file": im_file,
                             "shape": shape,
@@ -148,57 +149,65 @@ class YOLODataset(BaseDataset):
             LOGGER.info("\n".join(msgs))
         if nf == 0:
             LOGGER.warning(f"{self.prefix}No labels found in {path}. {HELP_URL}")
-        x["hash"] = get_hash(self.label_files + self.im_files)
-        x["results"] = nf, nm, ne, nc, len(self.im_files)
-        x["msgs"] = msgs  # warnings
-        save_dataset_cache_file(self.prefix, path, x, DATASET_CACHE_VERSION)
-        return x
+        meta = {
+            "hash": get_hash(self.label_files + self.im_files),
+            "results": (nf, nm, ne, nc, len(self.im_files)),
+            "msgs": msgs,  # warnings
+            "version": DATASET_CACHE_VERSION,
+        }
+        store = LabelStore.from_labels(labels, meta)
+        return LabelStore.load(path) if store.save(path, prefix=self.prefix) else store  # map saved cache
 
-    def get_labels(self) -> list[dict]:
-        """Return dictionary of labels for YOLO training.
+    def get_labels(self) -> LabelStore:
+        """Return labels for YOLO training.
 
-        This method loads labels from disk or cache, verifies their integrity, and prepares them for training.
+        This method loads labels from disk or cache, verifies their integrity, and prepares them for training. Labels
+        are held in a columnar LabelStore memory-mapped from the cache file, so dataloader workers share them.
 
         Returns:
-            (list[dict]): List of label dictionaries, each containing information about an image and its annotations.
+            (LabelStore): Labels that index like a list of label dictionaries, one per image.
         """
         self.label_files = img2label_paths(self.im_files)
-        cache_path = Path(self.label_files[0]).parent.with_suffix(".cache")
-        try:
-            cache, exists = load_dataset_cache_file(cache_path), True  # attempt to load a *.cache file
-            assert cache["version"] == DATASET_CACHE_VERSION  # matches current version
-            assert cache["hash"] == get_hash(self.label_files + self.im_files)  # identical hash
-        except (FileNotFoundError, AssertionError, AttributeError, ModuleNotFoundError):
-            cache, exists = self.cache_labels(cache_path), False  # run cache ops
+        if self.shards is not None:  # labels packed with the shards, no label files to scan or hash
+            cache_path = self.shards.path / "labels.cache"
+            labels, exists = LabelStore.load(cache_path), True
+            labels = labels[: len(self.im_files)] if len(labels) > len(self.im_files) else labels  # fraction
+        else:
+            cache_path = Path(self.label_files[0]).parent.with_suffix(".cache")
+            labels = None
+            try:
+                labels, exists = LabelStore.load(cache_path), True  # attempt to map a *.cache file
+                assert labels.meta["version"] == DATASET_CACHE_VERSION  # matches current version
+                assert labels.meta["hash"] == get_hash(self.label_files + self.im_files)  # identical hash
+            except (FileNotFoundError, AssertionError, KeyError, ValueError):
+                del labels  # unmap a stale cache before it is replaced, Windows can't replace a mapped file
+                labels, exists = self.cache_labels(cache_path), False  # run cache ops
 
         # Display cache
-        nf, nm, ne, nc, n = cache.pop("results")  # found, missing, empty, corrupt, total
+        nf, nm, ne, nc, n = labels.meta["results"]  # found, missing, empty, corrupt, total
         if exists and LOCAL_RANK in {-1, 0}:
             d = f"Scanning {cache_path}... {nf} images, {nm + ne} backgrounds, {nc} corrupt"
             TQDM(None, desc=self.prefix + d, total=n, initial=n)  # display results
-            if cache["msgs"]:
-                LOGGER.info("\n".join(cache["msgs"]))  # display warnings
+            if labels.meta["msgs"]:
+                LOGGER.info("\n".join(labels.meta["msgs"]))  # display warnings
 
         # Read cache
-        [cache.pop(k) for k in ("hash", "version", "msgs")]  # remove items
-        labels = cache["labels"]
-        if not labels:
+        if not len(labels):
             raise RuntimeError(
                 f"No valid images found in {cache_path}. Images with incorrectly formatted labels are ignored. {HELP_URL}"
             )
-        self.im_files = [lb["im_file"] for lb in labels]  # update im_files
+        self.im_files = labels.files  # update im_files
 
         # Check if the datasets is all boxes or all segments
-        lengths = ((len(lb["cls"]), len(lb["bboxes"]), len(lb["segments"])) for lb in labels)
-        len_cls, len_boxes, len_segments = (sum(x) for x in zip(*lengths))
+        len_cls = len_boxes = int(labels.counts.sum())
+        len_segments = labels.num_segments()
         if len_segments and len_boxes != len_segments:
             LOGGER.warning(
                 f"Box and segment counts should be equal, but got len(segments) = {len_segments}, "
                 f"len(boxes) = {len_boxes}. To resolve this only boxes will be used and all segments will be removed. "
                 "To avoid this please supply either a detect or segment datasets, not a detect-segment mixed datasets."
             )
-            for lb in labels:
-                lb["segments"] = []
+            labels = labels.drop_segments()
         if len_cls == 0:
             LOGGER.warning(f"Labels are missing or empty in {cache_path}, training may not work correctly. {HELP_URL}")
         return labels
@@ -0,0 +1,152 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+"""
+Micro-batching for serving single-image requests from many concurrent callers.
+
+Usage:
+    from ultralytics import YOLO
+    from ultralytics.engine.batcher import MicroBatcher
+
+    batcher = MicroBatcher(YOLO("yolo11n.pt"), max_batch=8, max_wait=0.005, conf=0.25)
+    result = batcher("image.jpg")  # call from any thread, returns a single Results object
+    batcher.close()
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+
+from ultralytics.utils import LOGGER
+
+
+class MicroBatcher:
+    """Group concurrent single-image predict requests into batched forward passes.
+
+    Requests are queued and a background worker waits at most `max_wait` seconds after the first queued request for
+    more to arrive, then runs up to `max_batch` images through one `predict()` call, so the predictor preprocesses and
+    infers them as a single batch. Each caller gets back the Results object for its own image.
+
+    Attributes:
+        model (Model): Model used for prediction. Only the worker threads call it.
+        max_batch (int): Maximum number of images per forward pass.
+        max_wait (float): Maximum time in seconds to wait for a batch to fill after the first request arrives.
+        workers (int): Number of worker threads, each running one batch at a time.
+        kwargs (dict): Keyword arguments passed to every `predict()` call.
+        batches (int): Number of batches run so far.
+        images (int): Number of images processed so far.
+
+    Methods:
+        __call__: Submit an image and block until its Results are ready.
+        submit: Submit an image and return a Future resolving to its Results.
+        close: Stop the worker threads after processing queued requests.
+
+    Examples:
+        >>> batcher = MicroBatcher(YOLO("yolo11n.pt"), max_batch=4, max_wait=0.01)
+        >>> futures = [batcher.submit(im) for im in images]
+        >>> results = [f.result() for f in futures]
+        >>> batcher.close()
+    """
+
+    def __init__(self, model, max_batch: int = 8, max_wait: float = 0.005, workers: int = 1, **kwargs: Any):
+        """Initialize the MicroBatcher and start its worker threads.
+
+        Args:
+            model (Model): Model used for prediction.
+            max_batch (int): Maximum number of images per forward pass.
+            max_wait (float): Maximum seconds to wait for more requests after the first one in a batch.
+            workers (int): Number of worker threads. Values above 1 require `model.predict()` to be safe to call
+                concurrently, e.g. an object that hands each call its own model instance.
+            **kwargs (Any): Additional keyword arguments for `model.predict()`, e.g. `conf` or `imgsz`.
+        """
+        self.model = model
+        self.max_batch = max(int(max_batch), 1)
+        self.max_wait = max_wait
+        self.workers = max(int(workers), 1)
+        self.kwargs = {"verbose": False, **kwargs}
+        self.batches = 0
+        self.images = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(self.workers)]
+        for t in self._threads:
+            t.start()
+
+    def __call__(self, source):
+        """Submit an image and block until its Results object is ready.
+
+        Args:
+            source (str | Path | PIL.Image | np.ndarray): A single image source.
+
+        Returns:
+            (ultralytics.engine.results.Results): Prediction results for the image.
+        """
+        return self.submit(source).result()
+
+    def submit(self, source) -> Future:
+        """Submit an image for batched prediction.
+
+        Args:
+            source (str | Path | PIL.Image | np.ndarray): A single image source.
+
+        Returns:
+            (concurrent.futures.Future): Future resolving to the Results object for the image.
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed.")
+        future = Future()
+        self._queue.put((source, future))
+        return future
+
+    def close(self):
+        """Stop accepting requests, process those already queued and join the worker threads."""
+        if not self._closed:
+            self._closed = True
+            for _ in self._threads:
+                self._queue.put(None)
+            for t in self._threads:
+                t.join()
+
+    def _collect(self) -> tuple[list, bool]:
+        """Block for the first request, then gather more until the batch is full or `max_wait` elapses."""
+        item = self._queue.get()
+        if item is None:
+            return [], True
+        batch = [item]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self):
+        """Worker loop running one `predict()` call per collected batch and resolving each caller's Future."""
+        stop = False
+        while not stop:
+            batch, stop = self._collect()
+            if not batch:
+                continue
+            sources, futures = zip(*batch)
+            try:
+                results = self.model.predict(list(sources), batch=len(sources), **self.kwargs)
+            except Exception as e:
+                LOGGER.warning(f"MicroBatcher batch of {len(sources)} failed: {e}")
+                for f in futures:
+                    f.set_exception(e)
+                continue
+            with self._lock:
+                self.batches += 1
+                self.images += len(sources)
+            for f, r in zip(futures, results):
+                f.set_result(r)
@@ -46,6 +46,7 @@ class Model(torch.nn.Module):
         session (HUBTrainingSession): The Ultralytics HUB session, if applicable.
         task (str): The type of task the model is intended for.
         model_name (str): The name of the model.
+        feature_taps (dict): Persistent feature taps whose activations are attached to each Results.
 
     Methods:
         __call__: Alias for the predict method, enabling the model instance to be callable.
@@ -57,6 +58,9 @@ class Model(torch.nn.Module):
         save: Save the current state of the model to a file.
         info: Log or return information about the model.
         fuse: Fuse Conv2d and BatchNorm2d layers for optimized inference.
+        capture_activations: Capture intermediate layer outputs during prediction.
+        add_feature_tap: Register a persistent feature tap returned with every Results object.
+        remove_feature_tap: Remove one or all feature taps.
         predict: Perform object detection predictions.
         track: Perform object tracking.
         val: Validate the model on a datasets.
@@ -117,6 +121,7 @@ class Model(torch.nn.Module):
         self.session = None  # HUB session
         self.task = task  # task type
         self.model_name = None  # model name
+        self.feature_taps = {}  # persistent activation captures attached to Results.features
         model = str(model).strip()
 
         # Check if Ultralytics HUB model from https://hub.ultralytics.com
@@ -474,6 +479,107 @@ class Model(torch.nn.Module):
             kwargs["embed"] = [len(self.model.model) - 2]  # embed second-to-last layer if no indices passed
         return self.predict(source, stream, **kwargs)
 
+    def capture_activations(
+        self, layers: int | str | torch.nn.Module | list | dict, reduce: str | callable | None = None, size=None
+    ):
+        """Return a context manager that captures intermediate layer outputs during prediction.
+
+        Any forward pass run inside the context, such as `predict()` or `track()`, records the outputs of the requested
+        layers, so detections and feature maps are obtained from a single inference instead of separate runs.
+
+        Args:
+            layers (int | str | torch.nn.Module | list | dict): Layers to capture. Integers index the model's layer
+                sequence, strings are submodule names (e.g. "model.9.spatial_attention") and modules are hooked
+                directly. A dict maps custom capture names to any of these.
+            reduce (str | callable, optional): Channel reduction applied inside the hook, "mean", "max" or a callable.
+            size (int | tuple[int, int], optional): Spatial size to average-pool captured outputs down to.
+
+        Returns:
+            (ultralytics.utils.torch_utils.ActivationCapture): Context manager whose `activations` dict holds the
+                captured outputs keyed by layer (or by the custom names when a dict is passed).
+
+        Examples:
+            >>> model = YOLO("yolo11n.pt")
+            >>> with model.capture_activations([9]) as capture:
+            ...     results = model.predict("image.jpg")
+            >>> feature_map = capture.activations[9]
+        """
+        from ultralytics.utils.torch_utils import ActivationCapture
+
+        if not isinstance(layers, dict):
+            layers = {k: k for k in (layers if isinstance(layers, (list, tuple)) else [layers])}
+        return ActivationCapture({k: self._get_layer(v) for k, v in layers.items()}, reduce=reduce, size=size)
+
+    def add_feature_tap(
+        self, name: str, layer: int | str | torch.nn.Module, reduce: str | callable | None = None, size=None
+    ) -> None:
+        """Register a persistent feature tap whose activations are returned with every Results object.
+
+        The forward hook stays registered across `predict()` and `track()` calls. Captured activations are reduced and
+        resized inside the hook on the inference device, and each image's slice is stored in `Results.features[name]`.
+
+        Args:
+            name (str): Key under which the activation is stored in `Results.features`.
+            layer (int | str | torch.nn.Module): Layer index, submodule name or module to tap.
+            reduce (str | callable, optional): Channel reduction applied inside the hook, "mean", "max" or a callable,
+                e.g. to keep only a (1, H, W) heatmap instead of a full (C, H, W) feature map.
+            size (int | tuple[int, int], optional): Spatial size to average-pool the activation down to.
+
+        Examples:
+            >>> model = YOLO("yolo11n.pt")
+            >>> model.add_feature_tap("p5", 9, reduce="mean")
+            >>> results = model.predict("image.jpg")
+            >>> heatmap = results[0].features["p5"]  # (1, H, W) tensor on the inference device
+        """
+        from ultralytics.utils.torch_utils import ActivationCapture
+
+        self.remove_feature_tap(name)
+        tap = ActivationCapture({name: self._get_layer(layer)}, reduce=reduce, size=size)
+        self.feature_taps[name] = tap.__enter__()
+        if len(self.feature_taps) == 1:
+            self.add_callback("on_predict_postprocess_end", self._attach_features)
+
+    def remove_feature_tap(self, name: str | None = None) -> None:
+        """Remove a feature tap by name, or all feature taps if no name is given.
+
+        Args:
+            name (str, optional): Name of the tap to remove.
+        """
+        for k in [name] if name is not None else list(self.feature_taps):
+            tap = self.feature_taps.pop(k, None)
+            if tap is not None:
+                tap.__exit__()
+        if not self.feature_taps and self._attach_features in self.callbacks["on_predict_postprocess_end"]:
+            self.callbacks["on_predict_postprocess_end"].remove(self._attach_features)
+
+    def _attach_features(self, predictor) -> None:
+        """Attach the activations captured by feature taps to the current batch of Results.
+
+        With tiled inference the batch holds every tile plus the full frame of each image, and only the full-frame rows
+        are attached.
+        """
+        frames = getattr(predictor, "frames", None)
+        for name, tap in self.feature_taps.items():
+            x = tap.activations.pop(name, None)
+            if x is None:
+                continue
+            if frames is not None and len(x) == len(predictor.tiles):
+                x = x[frames]
+            if len(x) != len(predictor.results):
+                LOGGER.warning(f"Feature tap '{name}' rows ({len(x)}) don't match results ({len(predictor.results)}).")
+                continue
+            for i, r in enumerate(predictor.results):
+                r.features[name] = x[i]
+
+    def _get_layer(self, layer: int | str | torch.nn.Module) -> torch.nn.Module:
+        """Resolve a layer index, submodule name or module into a module of the underlying PyTorch model."""
+        self._check_is_pytorch_model()
+        if isinstance(layer, int):
+            return self.model.model[layer]
+        if isinstance(layer, str):
+            return self.model.get_submodule(layer)
+        return layer
+
     def predict(
         self,
         source: str | Path | int | Image.Image | list | tuple | np.ndarray | torch.Tensor = None,
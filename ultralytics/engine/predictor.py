@@ -48,8 +48,10 @@ import torch
 from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data import load_inference_source
 from ultralytics.data.augment import LetterBox
+from ultralytics.engine.results import Results
 from ultralytics.nn.autobackend import AutoBackend
 from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
+from ultralytics.utils.autobatch import check_infer_batch_size
 from ultralytics.utils.checks import check_imgsz, check_imshow
 from ultralytics.utils.files import increment_path
 from ultralytics.utils.torch_utils import attempt_compile, select_device, smart_inference_mode
@@ -252,6 +254,10 @@ class BasePredictor:
                 inference.
         """
         self.imgsz = check_imgsz(self.args.imgsz, stride=self.model.stride, min_dim=2)  # check image size
+        if self.args.batch < 1 and getattr(self.model, "pt", False):  # AutoBatch
+            self.args.batch = check_infer_batch_size(
+                self.model.model, self.imgsz, half=self.args.half, batch=self.args.batch
+            )
         self.dataset = load_inference_source(
             source=source,
             batch=self.args.batch,
@@ -334,6 +340,8 @@ class BasePredictor:
                 with profilers[2]:
                     self.results = self.postprocess(preds, im, im0s)
                 self.run_callbacks("on_predict_postprocess_end")
+                if self.args.lite_results:
+                    Results.pack(self.results)
 
                 # Visualize, save, write results
                 n = len(im0s)
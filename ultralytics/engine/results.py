@@ -7,8 +7,9 @@ Usage: See https://docs.ultralytics.com/modes/predict/
 
 from __future__ import annotations
 
+import weakref
 from copy import deepcopy
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -182,7 +183,7 @@ class Results(SimpleClass, DataExportMixin):
     various coordinate transformations.
 
     Attributes:
-        orig_img (np.ndarray): The original image as a numpy array.
+        orig_img (np.ndarray | None): The original image as a numpy array, None once a weakly referenced image is freed.
         orig_shape (tuple[int, int]): Original image shape in (height, width) format.
         boxes (Boxes | None): Detected bounding boxes.
         masks (Masks | None): Segmentation masks.
@@ -193,6 +194,7 @@ class Results(SimpleClass, DataExportMixin):
         names (dict): Dictionary mapping class indices to class names.
         path (str): Path to the input image file.
         save_dir (str | None): Directory to save results.
+        features (dict[str, torch.Tensor]): Per-image activations captured by the model's feature taps.
 
     Methods:
         update: Update the Results object with new detection data.
@@ -201,6 +203,7 @@ class Results(SimpleClass, DataExportMixin):
         cuda: Move all tensors in the Results object to GPU memory.
         to: Move all tensors to the specified device and dtype.
         new: Create a new Results object with the same image, path, names, and speed attributes.
+        pack: Share one contiguous tensor across a batch of Results and optionally weakly reference their images.
         plot: Plot detection results on an input RGB image.
         show: Display the image with annotated inference results.
         save: Save annotated inference results image to file.
@@ -223,7 +226,7 @@ class Results(SimpleClass, DataExportMixin):
 
     def __init__(
         self,
-        orig_img: np.ndarray,
+        orig_img: np.ndarray | weakref.ref | None,
         path: str,
         names: dict[int, str],
         boxes: torch.Tensor | None = None,
@@ -232,11 +235,12 @@ class Results(SimpleClass, DataExportMixin):
         keypoints: torch.Tensor | None = None,
         obb: torch.Tensor | None = None,
         speed: dict[str, float] | None = None,
+        orig_shape: tuple[int, int] | None = None,
     ) -> None:
         """Initialize the Results class for storing and manipulating inference results.
 
         Args:
-            orig_img (np.ndarray): The original image as a numpy array.
+            orig_img (np.ndarray | weakref.ref | None): The original image as a numpy array, or a weak reference to it.
             path (str): The path to the image file.
             names (dict): A dictionary of class names.
             boxes (torch.Tensor | None): A 2D tensor of bounding box coordinates for each detection.
@@ -245,6 +249,7 @@ class Results(SimpleClass, DataExportMixin):
             keypoints (torch.Tensor | None): A 2D tensor of keypoint coordinates for each detection.
             obb (torch.Tensor | None): A 2D tensor of oriented bounding box coordinates for each detection.
             speed (dict | None): A dictionary containing preprocess, inference, and postprocess speeds (ms/image).
+            orig_shape (tuple[int, int] | None): Original image shape, required only if `orig_img` is not available.
 
         Notes:
             For the default pose model, keypoint indices for human body pose estimation are:
@@ -254,7 +259,7 @@ class Results(SimpleClass, DataExportMixin):
             13: Left Knee, 14: Right Knee, 15: Left Ankle, 16: Right Ankle
         """
         self.orig_img = orig_img
-        self.orig_shape = orig_img.shape[:2]
+        self.orig_shape = orig_shape or self.orig_img.shape[:2]
         self.boxes = Boxes(boxes, self.orig_shape) if boxes is not None else None  # native size boxes
         self.masks = Masks(masks, self.orig_shape) if masks is not None else None  # native size or imgsz masks
         self.probs = Probs(probs) if probs is not None else None
@@ -264,8 +269,20 @@ class Results(SimpleClass, DataExportMixin):
         self.names = names
         self.path = path
         self.save_dir = None
+        self.features = {}  # activations from Model.add_feature_tap()
         self._keys = "boxes", "masks", "probs", "keypoints", "obb"
 
+    @property
+    def orig_img(self) -> np.ndarray | None:
+        """Return the original image, or None if it was weakly referenced and has been freed."""
+        img = self._orig_img
+        return img() if isinstance(img, weakref.ref) else img
+
+    @orig_img.setter
+    def orig_img(self, img: np.ndarray | weakref.ref | None) -> None:
+        """Set the original image, either as an array or as a weak reference that does not keep it alive."""
+        self._orig_img = img
+
     def __getitem__(self, idx):
         """Return a Results object for a specific index of inference results.
 
@@ -360,6 +377,12 @@ class Results(SimpleClass, DataExportMixin):
             v = getattr(self, k)
             if v is not None:
                 setattr(r, k, getattr(v, fn)(*args, **kwargs))
+        if fn == "__getitem__":  # features describe the whole image, not individual detections
+            r.features = self.features
+        elif fn == "numpy":
+            r.features = {k: v.cpu().numpy() for k, v in self.features.items()}
+        else:
+            r.features = {k: getattr(v, fn)(*args, **kwargs) for k, v in self.features.items()}
         return r
 
     def cpu(self):
@@ -438,7 +461,46 @@ class Results(SimpleClass, DataExportMixin):
             >>> results = model("path/to/image.jpg")
             >>> new_result = results[0].new()
         """
-        return Results(orig_img=self.orig_img, path=self.path, names=self.names, speed=self.speed)
+        return Results(
+            orig_img=self._orig_img, path=self.path, names=self.names, speed=self.speed, orig_shape=self.orig_shape
+        )
+
+    @staticmethod
+    def pack(results: list[Results], device: str | torch.device = "cpu", weak_img: bool = True) -> list[Results]:
+        """Store the detections of a batch of Results in one contiguous tensor shared through per-image views.
+
+        Boxes, OBB, keypoints and probs of all results are concatenated and moved to `device` in a single transfer, and
+        each result is given a view of its own rows, so later `cpu()` and `numpy()` calls return views instead of
+        copies. Attributes whose rows differ in shape across the batch, e.g. tracked and untracked boxes, are left as
+        is. With `weak_img`, each result holds its original image by weak reference and no longer keeps the frame alive
+        once the caller releases it.
+
+        Args:
+            results (list[Results]): Results of one batch, modified in place.
+            device (str | torch.device): Device of the shared tensor.
+            weak_img (bool): Whether to hold `orig_img` by weak reference.
+
+        Returns:
+            (list[Results]): The same Results objects.
+
+        Examples:
+            >>> results = Results.pack(model(["im1.jpg", "im2.jpg"]))
+            >>> results[0].boxes.data.untyped_storage() is results[1].boxes.data.untyped_storage()
+        """
+        for k in ("boxes", "obb", "keypoints", "probs"):
+            items = [getattr(r, k) for r in results]
+            if not items or not all(v is not None and isinstance(v.data, torch.Tensor) for v in items):
+                continue
+            if len({v.data.shape[1:] for v in items}) > 1:  # e.g. 7-column tracked boxes next to 6-column boxes
+                continue
+            data = torch.cat([v.data for v in items]).to(device)
+            for r, v, view in zip(results, items, data.split([len(v) for v in items])):
+                setattr(r, k, v.__class__(view, v.orig_shape))
+        if weak_img:
+            for r in results:
+                if r.orig_img is not None:
+                    r.orig_img = weakref.ref(r.orig_img)
+        return results
 
     def plot(
         self,
@@ -460,6 +522,7 @@ class Results(SimpleClass, DataExportMixin):
         filename: str | None = None,
         color_mode: str = "class",
         txt_color: tuple[int, int, int] = (255, 255, 255),
+        inplace: bool = False,
     ) -> np.ndarray:
         """Plot detection results on an input RGB image.
 
@@ -482,6 +545,8 @@ class Results(SimpleClass, DataExportMixin):
             filename (str | None): Filename to save image if save is True.
             color_mode (str): Specify the color mode, e.g., 'instance' or 'class'.
             txt_color (tuple[int, int, int]): Specify the RGB text color for classification task.
+            inplace (bool): Whether to draw directly on `img` (or the original image) instead of on a copy, e.g. to
+                annotate a reused frame buffer without a full-frame copy per call.
 
         Returns:
             (np.ndarray): Annotated image as a numpy array.
@@ -493,6 +558,8 @@ class Results(SimpleClass, DataExportMixin):
             >>>     im.show()
         """
         assert color_mode in {"instance", "class"}, f"Expected color_mode='instance' or 'class', not {color_mode}."
+        if img is None and self.orig_img is None:
+            raise ValueError("The original image of these Results has been released, pass 'img' to plot on.")
         if img is None and isinstance(self.orig_img, torch.Tensor):
             img = (self.orig_img[0].detach().permute(1, 2, 0).contiguous() * 255).byte().cpu().numpy()
 
@@ -501,8 +568,9 @@ class Results(SimpleClass, DataExportMixin):
         pred_boxes, show_boxes = self.obb if is_obb else self.boxes, boxes
         pred_masks, show_masks = self.masks, masks
         pred_probs, show_probs = self.probs, probs
+        img = self.orig_img if img is None else img
         annotator = Annotator(
-            deepcopy(self.orig_img if img is None else img),
+            img if inplace else deepcopy(img),
             line_width,
             font_size,
             font,
@@ -530,17 +598,18 @@ class Results(SimpleClass, DataExportMixin):
             )
             annotator.masks(pred_masks.data, colors=[colors(x, True) for x in idx], im_gpu=im_gpu)
 
-        # Plot Detect results
+        # Plot Detect results, in reverse so the most confident boxes are drawn on top
         if pred_boxes is not None and show_boxes:
-            for i, d in enumerate(reversed(pred_boxes)):
-                c, d_conf, id = int(d.cls), float(d.conf) if conf else None, int(d.id.item()) if d.is_track else None
+            cls = pred_boxes.cls.tolist()[::-1]
+            confs = pred_boxes.conf.tolist()[::-1]
+            ids = pred_boxes.id.tolist()[::-1] if pred_boxes.is_track else [None] * len(cls)
+            box_labels, box_colors = [], []
+            for i, (c, d_conf, id) in enumerate(zip(cls, confs, ids)):
+                c, id = int(c), None if id is None else int(id)
                 name = ("" if id is None else f"id:{id} ") + names[c]
-                label = (f"{name} {d_conf:.2f}" if conf else name) if labels else None
-                box = d.xyxyxyxy.squeeze() if is_obb else d.xyxy.squeeze()
-                annotator.box_label(
-                    box,
-                    label,
-                    color=colors(
+                box_labels.append((f"{name} {d_conf:.2f}" if conf else name) if labels else None)
+                box_colors.append(
+                    colors(
                         c
                         if color_mode == "class"
                         else id
@@ -549,8 +618,11 @@ class Results(SimpleClass, DataExportMixin):
                         if color_mode == "instance"
                         else None,
                         True,
-                    ),
+                    )
                 )
+            xy = pred_boxes.xyxyxyxy if is_obb else pred_boxes.xyxy
+            xy = (xy.cpu().numpy() if isinstance(xy, torch.Tensor) else xy)[::-1]
+            annotator.box_labels(xy, box_labels, box_colors)
 
         # Plot Classify results
         if pred_probs is not None and show_probs:
@@ -941,8 +1013,7 @@ class Boxes(BaseTensor):
         """
         return self.data[:, -3] if self.is_track else None
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xywh(self) -> torch.Tensor | np.ndarray:
         """Convert bounding boxes from [x1, y1, x2, y2] format to [x, y, width, height] format.
 
@@ -960,8 +1031,7 @@ class Boxes(BaseTensor):
         """
         return ops.xyxy2xywh(self.xyxy)
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyn(self) -> torch.Tensor | np.ndarray:
         """Return normalized bounding box coordinates relative to the original image size.
 
@@ -983,8 +1053,7 @@ class Boxes(BaseTensor):
         xyxy[..., [1, 3]] /= self.orig_shape[0]
         return xyxy
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xywhn(self) -> torch.Tensor | np.ndarray:
         """Return normalized bounding boxes in [x, y, width, height] format.
 
@@ -1045,8 +1114,7 @@ class Masks(BaseTensor):
             masks = masks[None, :]
         super().__init__(masks, orig_shape)
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xyn(self) -> list[np.ndarray]:
         """Return normalized xy-coordinates of the segmentation masks.
 
@@ -1069,8 +1137,7 @@ class Masks(BaseTensor):
             for x in ops.masks2segments(self.data)
         ]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xy(self) -> list[np.ndarray]:
         """Return the [x, y] pixel coordinates for each segment in the mask tensor.
 
@@ -1142,8 +1209,7 @@ class Keypoints(BaseTensor):
         super().__init__(keypoints, orig_shape)
         self.has_visible = self.data.shape[-1] == 3
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xy(self) -> torch.Tensor | np.ndarray:
         """Return x, y coordinates of keypoints.
 
@@ -1165,8 +1231,7 @@ class Keypoints(BaseTensor):
         """
         return self.data[..., :2]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xyn(self) -> torch.Tensor | np.ndarray:
         """Return normalized coordinates (x, y) of keypoints relative to the original image size.
 
@@ -1186,8 +1251,7 @@ class Keypoints(BaseTensor):
         xy[..., 1] /= self.orig_shape[0]
         return xy
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def conf(self) -> torch.Tensor | np.ndarray | None:
         """Return confidence values for each keypoint.
 
@@ -1249,8 +1313,7 @@ class Probs(BaseTensor):
         """
         super().__init__(probs, orig_shape)
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top1(self) -> int:
         """Return the index of the class with the highest probability.
 
@@ -1264,8 +1327,7 @@ class Probs(BaseTensor):
         """
         return int(self.data.argmax())
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top5(self) -> list[int]:
         """Return the indices of the top 5 class probabilities.
 
@@ -1279,8 +1341,7 @@ class Probs(BaseTensor):
         """
         return (-self.data).argsort(0)[:5].tolist()  # this way works with both torch and numpy.
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top1conf(self) -> torch.Tensor | np.ndarray:
         """Return the confidence score of the highest probability class.
 
@@ -1298,8 +1359,7 @@ class Probs(BaseTensor):
         """
         return self.data[self.top1]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top5conf(self) -> torch.Tensor | np.ndarray:
         """Return confidence scores for the top 5 classification predictions.
 
@@ -1446,8 +1506,7 @@ class OBB(BaseTensor):
         """
         return self.data[:, -3] if self.is_track else None
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyxyxy(self) -> torch.Tensor | np.ndarray:
         """Convert OBB format to 8-point (xyxyxyxy) coordinate format for rotated bounding boxes.
 
@@ -1464,8 +1523,7 @@ class OBB(BaseTensor):
         """
         return ops.xywhr2xyxyxyxy(self.xywhr)
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyxyxyn(self) -> torch.Tensor | np.ndarray:
         """Convert rotated bounding boxes to normalized xyxyxyxy format.
 
@@ -1485,8 +1543,7 @@ class OBB(BaseTensor):
         xyxyxyxyn[..., 1] /= self.orig_shape[0]
         return xyxyxyxyn
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxy(self) -> torch.Tensor | np.ndarray:
         """Convert oriented bounding boxes (OBB) to axis-aligned bounding boxes in xyxy format.
 
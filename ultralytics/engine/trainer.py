@@ -40,7 +40,7 @@ from ultralytics.utils import (
     colorstr,
     emojis,
 )
-from ultralytics.utils.autobatch import check_train_batch_size
+from ultralytics.utils.autobatch import autoworkers, check_train_batch_size, cpu_autobatch
 from ultralytics.utils.checks import check_amp, check_file, check_imgsz, check_model_file_from_stem, print_args
 from ultralytics.utils.dist import ddp_cleanup, generate_ddp_command
 from ultralytics.utils.files import get_latest_run
@@ -148,13 +148,14 @@ class BaseTrainer:
         self.save_period = self.args.save_period
 
         self.batch_size = self.args.batch
+        self.throughput = 0.0  # CPU images/s profiled by AutoBatch, used to size dataloader workers
         self.epochs = self.args.epochs or 100  # in case users accidentally pass epochs=None with timed training
         self.start_epoch = 0
         if RANK == -1:
             print_args(vars(self.args))
 
         # Device
-        if self.device.type in {"cpu", "mps"}:
+        if self.device.type == "mps" or (self.device.type == "cpu" and self.batch_size >= 1):
             self.args.workers = 0  # faster CPU training as time dominated by inference, not dataloading
 
         # Model and Dataset
@@ -323,6 +324,11 @@ class BaseTrainer:
         self.train_loader = self.get_dataloader(
             self.data["train"], batch_size=batch_size, rank=LOCAL_RANK, mode="train"
         )
+        if self.throughput:  # CPU AutoBatch, keep only the workers needed to feed the profiled model throughput
+            nw = autoworkers(self.train_loader.dataset, self.throughput, self.train_loader.num_workers)
+            if nw < self.train_loader.num_workers:
+                self.args.workers = self.train_loader.num_workers = nw
+                self.train_loader.reset()
         # Note: When training DOTA datasets, double batch size could get OOM on images with >2000 objects.
         self.test_loader = self.get_dataloader(
             self.data.get("val") or self.data.get("test"),
@@ -529,6 +535,14 @@ class BaseTrainer:
 
     def auto_batch(self, max_num_obj=0):
         """Calculate optimal batch size based on model and device memory constraints."""
+        if self.device.type == "cpu":  # profile throughput within a fraction of RAM
+            batch, self.throughput = cpu_autobatch(
+                deepcopy(self.model).train(),
+                self.args.imgsz,
+                fraction=self.batch_size if 0.0 < self.batch_size < 1.0 else 0.6,
+                max_num_obj=max_num_obj,
+            )
+            return batch
         return check_train_batch_size(
             model=self.model,
             imgsz=self.args.imgsz,
@@ -16,12 +16,17 @@ Examples:
 
 from __future__ import annotations
 
+import contextlib
 import gc
+import math
+import os
 import random
 import shutil
 import subprocess
+import sys
 import time
 from datetime import datetime
+from pathlib import Path
 
 import numpy as np
 import torch
@@ -33,20 +38,83 @@ from ultralytics.utils.patches import torch_load
 from ultralytics.utils.plotting import plot_tune_results
 
 
+@contextlib.contextmanager
+def _file_lock(file: Path, timeout: float = 60.0):
+    """Hold an exclusive lock on a file shared between processes using an atomically created '.lock' file.
+
+    Args:
+        file (Path): File to lock.
+        timeout (float): Seconds after which a lock is considered stale, e.g. left behind by a killed process.
+    """
+    lock = file.with_name(f"{file.name}.lock")
+    t = time.time()
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.time() - t > timeout:
+                lock.unlink(missing_ok=True)  # break stale lock
+                t = time.time()
+            time.sleep(0.01)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        lock.unlink(missing_ok=True)
+
+
+def _stat_key(file: Path) -> tuple[int, int]:
+    """Return the size and modification time of a file, used to detect changes by other processes."""
+    st = file.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _epoch_fitness(file: Path) -> list[float]:
+    """Return the fitness of each epoch in a training 'results.csv' file.
+
+    Fitness follows the task metrics: the sum of all mAP50-95 columns for detection, segmentation, pose and OBB, and the
+    mean of top-1 and top-5 accuracy for classification. Lines still being written by the trainer are skipped.
+
+    Args:
+        file (Path): Path to the 'results.csv' file of a training run.
+
+    Returns:
+        (list[float]): Fitness per completed epoch.
+    """
+    try:
+        lines = file.read_text(encoding="utf-8").splitlines()
+        keys = [k.strip() for k in lines[0].split(",")]
+        rows = np.array([line.split(",") for line in lines[1:] if line.count(",") == len(keys) - 1], dtype=float)
+    except (OSError, IndexError, ValueError):
+        return []
+    if (cols := [j for j, k in enumerate(keys) if "mAP50-95" in k]) and len(rows):
+        return rows[:, cols].sum(1).tolist()
+    if (cols := [j for j, k in enumerate(keys) if "accuracy_top" in k]) and len(rows):
+        return rows[:, cols].mean(1).tolist()
+    return []
+
+
 class Tuner:
     """A class for hyperparameter tuning of YOLO models.
 
     The class evolves YOLO model hyperparameters over a given number of iterations by mutating them according to the
     search space and retraining the model to evaluate their performance. Supports both local CSV storage and distributed
-    MongoDB Atlas coordination for multi-machine hyperparameter optimization.
+    MongoDB Atlas coordination for multi-machine hyperparameter optimization. Several trials can train concurrently in
+    a local process pool, and asynchronous successive halving stops trials that fall behind at intermediate epochs. The
+    CSV results are written under a file lock, so several Tuner processes can share one `tune_dir` without MongoDB.
 
     Attributes:
         space (dict[str, tuple]): Hyperparameter search space containing bounds and scaling factors for mutation.
         tune_dir (Path): Directory where evolution logs and results will be saved.
         tune_csv (Path): Path to the CSV file where evolution logs are saved.
+        tune_rungs (Path): Path to the CSV file where intermediate fitness at successive halving epochs is saved.
         args (dict): Configuration arguments for the tuning process.
         callbacks (list): Callback functions to be executed during tuning.
         prefix (str): Prefix string for logging messages.
+        parallel (int): Number of trials trained concurrently.
+        halving (int): Successive halving reduction factor, trials must rank in the top 1/halving at each rung epoch.
+        rungs (list[int]): Epochs at which running trials are compared for successive halving.
         mongodb (MongoClient): Optional MongoDB client for distributed tuning.
         collection (Collection): MongoDB collection for storing tuning results.
 
@@ -79,6 +147,9 @@ class Tuner:
 
         Tune with custom search space:
         >>> model.tune(space={"lr0": (1e-5, 1e-1), "momentum": (0.6, 0.98)})
+
+        Tune 4 trials at a time on 4 GPUs, stopping trials outside the top third at intermediate epochs:
+        >>> model.tune(data="coco8.yaml", epochs=30, iterations=100, device="0,1,2,3", parallel=4, halving=3)
     """
 
     def __init__(self, args=DEFAULT_CFG, _callbacks: list | None = None):
@@ -119,14 +190,23 @@ class Tuner:
         mongodb_uri = args.pop("mongodb_uri", None)
         mongodb_db = args.pop("mongodb_db", "ultralytics")
         mongodb_collection = args.pop("mongodb_collection", "tuner_results")
+        self.parallel = max(int(args.pop("parallel", 1)), 1)
+        self.halving = int(args.pop("halving", 0))
 
         self.args = get_cfg(overrides=args)
         self.args.exist_ok = self.args.resume  # resume w/ same tune_dir
         self.tune_dir = get_save_dir(self.args, name=self.args.name or "tune")
         self.args.name, self.args.exist_ok, self.args.resume = (None, False, False)  # reset to not affect training
         self.tune_csv = self.tune_dir / "tune_results.csv"
+        self.tune_rungs = self.tune_dir / "tune_rungs.csv"
         self.callbacks = _callbacks or callbacks.get_default_callbacks()
         self.prefix = colorstr("Tuner: ")
+        self.rungs = []
+        if self.halving > 1:  # compare trials at epochs/halving, epochs/halving^2 and epochs/halving^3
+            self.rungs = sorted({math.ceil(self.args.epochs / self.halving**k) for k in (1, 2, 3)} - {self.args.epochs})
+            if not self.args.val:
+                LOGGER.warning(f"{self.prefix}successive halving requires 'val=True' to compare trials before the end")
+        self._csv_cache = {}
         callbacks.add_integration_callbacks(self)
 
         # MongoDB Atlas support (optional)
@@ -250,7 +330,7 @@ class Tuner:
 
             # Write to CSV
             headers = ",".join(["fitness", *list(self.space.keys())]) + "\n"
-            with open(self.tune_csv, "w", encoding="utf-8") as f:
+            with _file_lock(self.tune_csv), open(self.tune_csv, "w", encoding="utf-8") as f:
                 f.write(headers)
                 for result in all_results:
                     fitness = result["fitness"]
@@ -261,6 +341,41 @@ class Tuner:
         except Exception as e:
             LOGGER.warning(f"{self.prefix}MongoDB to CSV sync failed: {e}")
 
+    def _read_csv(self, file: Path) -> np.ndarray:
+        """Return the rows of a tuning CSV file, parsing it again only when the file has changed on disk.
+
+        Args:
+            file (Path): CSV file with a header row and numeric rows.
+
+        Returns:
+            (np.ndarray): Array of shape (N, C) with the rows of the file, empty if the file does not exist.
+        """
+        if not file.exists():
+            return np.zeros((0, 0))
+        with _file_lock(file):
+            key = _stat_key(file)
+            if self._csv_cache.get(file, (None,))[0] != key:
+                self._csv_cache[file] = (key, np.loadtxt(file, ndmin=2, delimiter=",", skiprows=1))
+        return self._csv_cache[file][1]
+
+    def _append_csv(self, file: Path, header: list[str], row: list[float]) -> None:
+        """Append a row to a tuning CSV file shared with other processes, writing the header if the file is new.
+
+        Args:
+            file (Path): CSV file to append to.
+            header (list[str]): Column names written when the file is created.
+            row (list[float]): Numeric values of the new row.
+        """
+        with _file_lock(file):
+            new = not file.exists()
+            key, rows = self._csv_cache.get(file, (None, None))
+            fresh = new or (rows is not None and key == _stat_key(file))  # cache matches the file before the write
+            with open(file, "a", encoding="utf-8") as f:
+                f.write(("" if not new else ",".join(header) + "\n") + ",".join(map(str, row)) + "\n")
+            if fresh:  # update the cache in place rather than parsing the file again
+                rows = np.array([row], dtype=float) if new else np.concatenate([rows, [row]], 0)
+                self._csv_cache[file] = (_stat_key(file), rows)
+
     def _crossover(self, x: np.ndarray, alpha: float = 0.2, k: int = 9) -> np.ndarray:
         """BLX-α crossover from up to top-k parents (x[:,0]=fitness, rest=genes)."""
         k = min(k, len(x))
@@ -303,7 +418,7 @@ class Tuner:
 
         # Fall back to CSV if MongoDB unavailable or empty
         if x is None and self.tune_csv.exists():
-            csv_data = np.loadtxt(self.tune_csv, ndmin=2, delimiter=",", skiprows=1)
+            csv_data = self._read_csv(self.tune_csv)
             if len(csv_data) > 0:
                 fitness = csv_data[:, 0]  # first column
                 order = np.argsort(-fitness)
@@ -311,7 +426,7 @@ class Tuner:
 
         # Mutate if we have data, otherwise use defaults
         if x is not None:
-            np.random.seed(int(time.time()))
+            np.random.seed(time.time_ns() % 2**32)  # distinct seeds for trials launched within the same second
             ng = len(self.space)
 
             # Crossover
@@ -348,101 +463,194 @@ class Tuner:
         4. Log fitness scores and hyperparameters to MongoDB and/or CSV
         5. Track the best performing configuration across all iterations
 
+        Up to `parallel` trials train at the same time, each in its own subprocess and on its own device when several
+        devices are given. With successive halving, a trial whose fitness at a rung epoch is not in the top 1/halving of
+        all trials recorded at that epoch is stopped and logged with zero fitness.
+
         Args:
             model (Model | None, optional): A pre-initialized YOLO model to be used for training.
             iterations (int): The number of generations to run the evolution for.
             cleanup (bool): Whether to delete iteration weights to reduce storage space during tuning.
         """
         t0 = time.time()
-        best_save_dir, best_metrics = None, None
+        self.best_save_dir, self.best_metrics = None, None
         (self.tune_dir / "weights").mkdir(parents=True, exist_ok=True)
 
         # Sync MongoDB to CSV at startup for proper resume logic
         if self.mongodb:
             self._sync_mongodb_to_csv()
 
-        start = 0
-        if self.tune_csv.exists():
-            x = np.loadtxt(self.tune_csv, ndmin=2, delimiter=",", skiprows=1)
-            start = x.shape[0]
+        start = len(self._read_csv(self.tune_csv))
+        if start:
             LOGGER.info(f"{self.prefix}Resuming tuning run {self.tune_dir} from iteration {start + 1}...")
-        for i in range(start, iterations):
-            # Linearly decay sigma from 0.2 → 0.1 over first 300 iterations
-            frac = min(i / 300.0, 1.0)
-            sigma_i = 0.2 - 0.1 * frac
-
-            # Mutate hyperparameters
-            mutated_hyp = self._mutate(sigma=sigma_i)
-            LOGGER.info(f"{self.prefix}Starting iteration {i + 1}/{iterations} with hyperparameters: {mutated_hyp}")
-
-            metrics = {}
-            train_args = {**vars(self.args), **mutated_hyp}
-            save_dir = get_save_dir(get_cfg(train_args))
-            weights_dir = save_dir / "weights"
+        device = str(self.args.device or "")
+        devices = device.split(",") if self.parallel > 1 and "," in device else []  # one device per trial
+        slots, running, i, stop = list(range(self.parallel)), [], start, False
+        while running or (i < iterations and not stop):
+            while slots and i < iterations and not stop:
+                # Linearly decay sigma from 0.2 → 0.1 over first 300 iterations
+                frac = min(i / 300.0, 1.0)
+                sigma_i = 0.2 - 0.1 * frac
+
+                # Mutate hyperparameters
+                mutated_hyp = self._mutate(sigma=sigma_i)
+                LOGGER.info(f"{self.prefix}Starting iteration {i + 1}/{iterations} with hyperparameters: {mutated_hyp}")
+                slot = slots.pop(0)
+                running.append(self._launch(i, mutated_hyp, slot, devices[slot % len(devices)] if devices else None))
+                i += 1
+
+            self._wait(running)
+            for trial in running:
+                if trial["proc"].poll() is None:
+                    self._prune(trial)
+            for trial in [t for t in running if t["proc"].poll() is not None]:
+                running.remove(trial)
+                slots.append(trial["slot"])
+                stop |= self._finish(trial, iterations, t0, cleanup)
+
+    def _launch(self, i: int, hyp: dict[str, float], slot: int, device: str | None = None) -> dict:
+        """Start training one trial in a subprocess (to avoid dataloader hang) without waiting for it.
+
+        Args:
+            i (int): Iteration index of the trial.
+            hyp (dict[str, float]): Mutated hyperparameters of the trial.
+            slot (int): Index of the worker slot running the trial.
+            device (str | None, optional): Device for the trial, overriding the tuning `device` argument.
+
+        Returns:
+            (dict): Trial record with the iteration, hyperparameters, slot, save directory, process and log file.
+        """
+        train_args = {**vars(self.args), **hyp}
+        if device is not None:
+            train_args["device"] = device
+        save_dir = get_save_dir(get_cfg(train_args))
+        save_dir.mkdir(parents=True, exist_ok=True)  # reserve the directory before the next trial picks its name
+        train_args.update(project=str(save_dir.parent), name=save_dir.name, exist_ok=True)
+        env, log = os.environ.copy(), None
+        if self.parallel > 1:  # share CPU threads between trials and keep their console output apart
+            env["YOLO_NUM_THREADS"] = str(max((os.cpu_count() or 1) // self.parallel, 1))
+            log = open(save_dir / "train.log", "w", encoding="utf-8")
+        launch = [sys.executable, "-m", "ultralytics.cfg.__init__"]  # workaround yolo not found
+        cmd = [*launch, "train", *(f"{k}={v}" for k, v in train_args.items())]
+        proc = subprocess.Popen(cmd, env=env, stdout=log, stderr=subprocess.STDOUT if log else None)
+        return {"i": i, "hyp": hyp, "slot": slot, "save_dir": save_dir, "proc": proc, "log": log, "rungs": self.rungs}
+
+    def _wait(self, running: list[dict]) -> None:
+        """Wait for the oldest running trial, returning periodically if other trials or halving need attention."""
+        timeout = 5 if len(running) > 1 or self.rungs else None
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            running[0]["proc"].wait(timeout=timeout)
+
+    def _prune(self, trial: dict) -> None:
+        """Record the fitness of a running trial at each reached rung epoch and stop it if it ranks too low.
+
+        A trial continues only if its fitness is within the top 1/halving of all trials recorded at the same epoch,
+        including trials of other Tuner processes sharing the rungs file.
+
+        Args:
+            trial (dict): Trial record returned by `_launch()`.
+        """
+        if not trial["rungs"]:
+            return
+        fitness = _epoch_fitness(trial["save_dir"] / "results.csv")
+        while trial["rungs"] and len(fitness) >= trial["rungs"][0]:
+            epoch, trial["rungs"] = trial["rungs"][0], trial["rungs"][1:]
+            f = round(fitness[epoch - 1], 5)
+            self._append_csv(self.tune_rungs, ["epoch", "fitness"], [epoch, f])
+            x = self._read_csv(self.tune_rungs)
+            history = np.sort(x[x[:, 0] == epoch, 1])[::-1]
+            k = len(history) // self.halving  # number of trials that may continue
+            if k and f < history[k - 1]:
+                LOGGER.info(
+                    f"{self.prefix}Stopping iteration {trial['i'] + 1} at epoch {epoch}, "
+                    f"fitness {f} is not in the top 1/{self.halving} of {len(history)} trials"
+                )
+                trial["proc"].terminate()
+                trial["proc"].wait()
+                trial["pruned"] = epoch
+                return
+
+    def _finish(self, trial: dict, iterations: int, t0: float, cleanup: bool = True) -> bool:
+        """Log the results of a finished trial and update the best hyperparameters.
+
+        Args:
+            trial (dict): Trial record returned by `_launch()`.
+            iterations (int): The number of generations to run the evolution for.
+            t0 (float): Start time of the tuning run.
+            cleanup (bool): Whether to delete iteration weights to reduce storage space during tuning.
+
+        Returns:
+            (bool): Whether the target number of iterations has been reached in MongoDB.
+        """
+        if trial["log"]:
+            trial["log"].close()
+        i, mutated_hyp, save_dir = trial["i"], trial["hyp"], trial["save_dir"]
+        weights_dir = save_dir / "weights"
+        metrics = {}
+        if not trial.get("pruned"):
             try:
-                # Train YOLO model with mutated hyperparameters (run in subprocess to avoid dataloader hang)
-                launch = [__import__("sys").executable, "-m", "ultralytics.cfg.__init__"]  # workaround yolo not found
-                cmd = [*launch, "train", *(f"{k}={v}" for k, v in train_args.items())]
-                return_code = subprocess.run(cmd, check=True).returncode
+                assert trial["proc"].returncode == 0, "training failed"
                 ckpt_file = weights_dir / ("best.pt" if (weights_dir / "best.pt").exists() else "last.pt")
                 metrics = torch_load(ckpt_file)["train_metrics"]
-                assert return_code == 0, "training failed"
 
                 # Cleanup
-                time.sleep(1)
                 gc.collect()
                 torch.cuda.empty_cache()
 
             except Exception as e:
                 LOGGER.error(f"training failure for hyperparameter tuning iteration {i + 1}\n{e}")
 
-            # Save results - MongoDB takes precedence
-            fitness = metrics.get("fitness", 0.0)
-            if self.mongodb:
-                self._save_to_mongodb(fitness, mutated_hyp, metrics, i + 1)
-                self._sync_mongodb_to_csv()
-                total_mongo_iterations = self.collection.count_documents({})
-                if total_mongo_iterations >= iterations:
-                    LOGGER.info(
-                        f"{self.prefix}Target iterations ({iterations}) reached in MongoDB ({total_mongo_iterations}). Stopping."
-                    )
-                    break
-            else:
-                # Save to CSV only if no MongoDB
-                log_row = [round(fitness, 5)] + [mutated_hyp[k] for k in self.space.keys()]
-                headers = "" if self.tune_csv.exists() else (",".join(["fitness", *list(self.space.keys())]) + "\n")
-                with open(self.tune_csv, "a", encoding="utf-8") as f:
-                    f.write(headers + ",".join(map(str, log_row)) + "\n")
-
-            # Get best results
-            x = np.loadtxt(self.tune_csv, ndmin=2, delimiter=",", skiprows=1)
-            fitness = x[:, 0]  # first column
-            best_idx = fitness.argmax()
-            best_is_current = best_idx == i
-            if best_is_current:
-                best_save_dir = str(save_dir)
-                best_metrics = {k: round(v, 5) for k, v in metrics.items()}
-                for ckpt in weights_dir.glob("*.pt"):
-                    shutil.copy2(ckpt, self.tune_dir / "weights")
-            elif cleanup and best_save_dir:
-                shutil.rmtree(best_save_dir, ignore_errors=True)  # remove iteration dirs to reduce storage space
-
-            # Plot tune results
-            plot_tune_results(str(self.tune_csv))
-
-            # Save and print tune results
-            header = (
-                f"{self.prefix}{i + 1}/{iterations} iterations complete ✅ ({time.time() - t0:.2f}s)\n"
-                f"{self.prefix}Results saved to {colorstr('bold', self.tune_dir)}\n"
-                f"{self.prefix}Best fitness={fitness[best_idx]} observed at iteration {best_idx + 1}\n"
-                f"{self.prefix}Best fitness metrics are {best_metrics}\n"
-                f"{self.prefix}Best fitness model is {best_save_dir}"
-            )
-            LOGGER.info("\n" + header)
-            data = {k: float(x[best_idx, i + 1]) for i, k in enumerate(self.space.keys())}
-            YAML.save(
-                self.tune_dir / "best_hyperparameters.yaml",
-                data=data,
-                header=remove_colorstr(header.replace(self.prefix, "# ")) + "\n",
-            )
-            YAML.print(self.tune_dir / "best_hyperparameters.yaml")
+        # Save results - MongoDB takes precedence
+        fitness = metrics.get("fitness", 0.0)
+        x = self._read_csv(self.tune_csv)
+        best_is_current = not len(x) or fitness > x[:, 0].max()
+        stop = False
+        if self.mongodb:
+            self._save_to_mongodb(fitness, mutated_hyp, metrics, i + 1)
+            self._sync_mongodb_to_csv()
+            total_mongo_iterations = self.collection.count_documents({})
+            if total_mongo_iterations >= iterations:
+                LOGGER.info(
+                    f"{self.prefix}Target iterations ({iterations}) reached in MongoDB ({total_mongo_iterations}). "
+                    "Stopping."
+                )
+                stop = True
+        else:
+            # Save to CSV only if no MongoDB
+            log_row = [round(fitness, 5)] + [mutated_hyp[k] for k in self.space.keys()]
+            self._append_csv(self.tune_csv, ["fitness", *list(self.space.keys())], log_row)
+
+        # Get best results
+        x = self._read_csv(self.tune_csv)
+        fitness = x[:, 0]  # first column
+        best_idx = fitness.argmax()
+        if best_is_current:
+            self.best_save_dir = str(save_dir)
+            self.best_metrics = {k: round(v, 5) for k, v in metrics.items()}
+            for ckpt in weights_dir.glob("*.pt"):
+                shutil.copy2(ckpt, self.tune_dir / "weights")
+        elif cleanup and self.best_save_dir:
+            shutil.rmtree(self.best_save_dir, ignore_errors=True)  # remove iteration dirs to reduce storage space
+        if cleanup and trial.get("pruned") and str(save_dir) != self.best_save_dir:
+            shutil.rmtree(save_dir, ignore_errors=True)  # stopped by successive halving, never the best model
+
+        # Plot tune results
+        plot_tune_results(str(self.tune_csv))
+
+        # Save and print tune results
+        header = (
+            f"{self.prefix}{len(x)}/{iterations} iterations complete ✅ ({time.time() - t0:.2f}s)\n"
+            f"{self.prefix}Results saved to {colorstr('bold', self.tune_dir)}\n"
+            f"{self.prefix}Best fitness={fitness[best_idx]} observed at iteration {best_idx + 1}\n"
+            f"{self.prefix}Best fitness metrics are {self.best_metrics}\n"
+            f"{self.prefix}Best fitness model is {self.best_save_dir}"
+        )
+        LOGGER.info("\n" + header)
+        data = {k: float(x[best_idx, i + 1]) for i, k in enumerate(self.space.keys())}
+        YAML.save(
+            self.tune_dir / "best_hyperparameters.yaml",
+            data=data,
+            header=remove_colorstr(header.replace(self.prefix, "# ")) + "\n",
+        )
+        YAML.print(self.tune_dir / "best_hyperparameters.yaml")
+        return stop
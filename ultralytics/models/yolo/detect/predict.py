@@ -1,8 +1,13 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+import math
+
+import torch
+
 from ultralytics.engine.predictor import BasePredictor
 from ultralytics.engine.results import Results
 from ultralytics.utils import nms, ops
+from ultralytics.utils.metrics import box_ios
 
 
 class DetectionPredictor(BasePredictor):
@@ -15,9 +20,16 @@ class DetectionPredictor(BasePredictor):
         args (namespace): Configuration arguments for the predictor.
         model (nn.Module): The detection model used for inference.
         batch (list): Batch of images and metadata for processing.
+        tiles (list[tuple] | None): Source image index, crop offset and crop shape of every image in the current
+            tiled batch, or None when tiled inference is not active.
+        frames (list[int] | None): Batch index of the full-frame view of every source image in the current tiled
+            batch, or None when tiled inference is not active.
 
     Methods:
+        preprocess: Prepare input images, slicing them into overlapping tiles when tiled inference is enabled.
+        get_tile_windows: Compute overlapping tile windows for an image within the tile budget.
         postprocess: Process raw model predictions into detection results.
+        merge_tiles: Map tile detections back to image coordinates and merge them into one result per image.
         construct_results: Build Results objects from processed predictions.
         construct_result: Create a single Result object from a prediction.
         get_obj_feats: Extract object features from the feature maps.
@@ -28,8 +40,68 @@ class DetectionPredictor(BasePredictor):
         >>> args = dict(model="yolo11n.pt", source=ASSETS)
         >>> predictor = DetectionPredictor(overrides=args)
         >>> predictor.predict_cli()
+
+        Tiled (SAHI-style) inference for small objects in high-resolution images
+        >>> args = dict(model="yolo11n.pt", source=ASSETS, tiles=6, tile_overlap=0.2)
+        >>> predictor = DetectionPredictor(overrides=args)
+        >>> predictor.predict_cli()
     """
 
+    def preprocess(self, im):
+        """Prepare input images for inference, slicing each image into overlapping tiles if `tiles` is set.
+
+        With tiled inference every image contributes its tiles plus one full-frame view, and all of them are stacked
+        into a single batch so the whole set runs in one forward pass. Tiled inference applies to detection models with
+        image (not tensor) inputs only.
+
+        Args:
+            im (torch.Tensor | list[np.ndarray]): Images of shape (N, 3, H, W) for tensor, [(H, W, 3) x N] for list.
+
+        Returns:
+            (torch.Tensor): Preprocessed image tensor of shape (M, 3, h, w), where M >= N when tiling.
+        """
+        self.tiles = self.frames = None
+        if not self.args.tiles or self.args.task != "detect" or isinstance(im, torch.Tensor):
+            return super().preprocess(im)
+        crops, self.tiles, self.frames = [], [], []
+        for i, x in enumerate(im):
+            for x1, y1, x2, y2 in self.get_tile_windows(x.shape[:2]):
+                crops.append(x[y1:y2, x1:x2])
+                self.tiles.append((i, x1, y1, (y2 - y1, x2 - x1)))
+            self.frames.append(len(crops))
+            crops.append(x)  # full frame for objects larger than a tile
+            self.tiles.append((i, 0, 0, x.shape[:2]))
+        return super().preprocess(crops)
+
+    def get_tile_windows(self, shape):
+        """Compute overlapping tile windows for an image within the `tiles` budget.
+
+        The grid is sized so that tiles approach the model input size, then the axis with more tiles is reduced until
+        the grid fits the budget, keeping the number of images per forward pass predictable. Tiles cover the whole
+        image and adjacent tiles overlap by `tile_overlap` of the tile size.
+
+        Args:
+            shape (tuple[int, int]): Image shape as (height, width).
+
+        Returns:
+            (list[tuple[int, int, int, int]]): Tile windows as (x1, y1, x2, y2), empty if the image fits in one tile.
+        """
+        h, w = shape
+        o = min(self.args.tile_overlap, 0.9)
+        ny = max(math.ceil((h / self.imgsz[0] - o) / (1 - o)), 1)
+        nx = max(math.ceil((w / self.imgsz[1] - o) / (1 - o)), 1)
+        while nx * ny > self.args.tiles:
+            if nx >= ny:
+                nx -= 1
+            else:
+                ny -= 1
+        if nx * ny <= 1:
+            return []
+        th, tw = h / (ny - (ny - 1) * o), w / (nx - (nx - 1) * o)  # tile size covering the image with overlap
+        ys = [round(j * th * (1 - o)) for j in range(ny)]
+        xs = [round(i * tw * (1 - o)) for i in range(nx)]
+        return [(x, y, min(round(x + tw), w), min(round(y + th), h)) for y in ys for x in xs]
+
     def postprocess(self, preds, img, orig_imgs, **kwargs):
         """Post-process predictions and return a list of Results objects.
 
@@ -50,7 +122,8 @@ class DetectionPredictor(BasePredictor):
             >>> results = predictor.predict("path/to/image.jpg")
             >>> processed_results = predictor.postprocess(preds, img, orig_imgs)
         """
-        save_feats = getattr(self, "_feats", None) is not None
+        tiled = getattr(self, "tiles", None) is not None
+        save_feats = getattr(self, "_feats", None) is not None and not tiled
         preds = nms.non_max_suppression(
             preds,
             self.args.conf,
@@ -67,6 +140,9 @@ class DetectionPredictor(BasePredictor):
         if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
             orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)[..., ::-1]
 
+        if tiled:
+            return self.merge_tiles(preds, img, orig_imgs)
+
         if save_feats:
             obj_feats = self.get_obj_feats(self._feats, preds[1])
             preds = preds[0]
@@ -79,10 +155,39 @@ class DetectionPredictor(BasePredictor):
 
         return results
 
+    def merge_tiles(self, preds, img, orig_imgs):
+        """Map per-tile detections back to image coordinates and merge them into one Results object per image.
+
+        Detections of the same class from different tiles are merged with Fast-NMS using intersection over the smaller
+        box, so a box cut off at a tile border is suppressed by the complete box from a neighbouring tile or the
+        full-frame view.
+
+        Args:
+            preds (list[torch.Tensor]): Post-NMS detections for every tile, each of shape (N, 6).
+            img (torch.Tensor): Batch of preprocessed tiles used for inference.
+            orig_imgs (list[np.ndarray]): Original input images.
+
+        Returns:
+            (list[Results]): Results objects with merged detections for each original image.
+        """
+        merged = [[] for _ in orig_imgs]
+        for pred, (i, x1, y1, shape) in zip(preds, self.tiles):
+            pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], shape)
+            pred[:, [0, 2]] += x1
+            pred[:, [1, 3]] += y1
+            merged[i].append(pred)
+
+        results = []
+        for pred, orig_img, img_path in zip(merged, orig_imgs, self.batch[0]):
+            pred = torch.cat(pred)
+            c = pred[:, 5:6] * (0 if self.args.agnostic_nms else max(orig_img.shape[:2]))  # offset boxes by class
+            keep = nms.TorchNMS.fast_nms(pred[:, :4] + c, pred[:, 4], self.args.iou, iou_func=box_ios)
+            boxes = pred[keep[: self.args.max_det]]
+            results.append(Results(orig_img, path=img_path, names=self.model.names, boxes=boxes))
+        return results
+
     def get_obj_feats(self, feat_maps, idxs):
         """Extract object features from the feature maps."""
-        import torch
-
         s = min(x.shape[1] for x in feat_maps)  # find shortest vector length
         obj_feats = torch.cat(
             [x.permute(0, 2, 3, 1).reshape(x.shape[0], -1, s, x.shape[1] // s).mean(dim=-1) for x in feat_maps], dim=1
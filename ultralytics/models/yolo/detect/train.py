@@ -12,6 +12,7 @@ import torch
 import torch.nn as nn
 
 from ultralytics.data import build_dataloader, build_yolo_dataset
+from ultralytics.data.augment import BatchAugment
 from ultralytics.engine.trainer import BaseTrainer
 from ultralytics.models import yolo
 from ultralytics.nn.tasks import DetectionModel
@@ -31,6 +32,7 @@ class DetectionTrainer(BaseTrainer):
         model (DetectionModel): The YOLO detection model being trained.
         data (dict): Dictionary containing datasets information including class names and number of classes.
         loss_names (tuple): Names of the loss components used in training (box_loss, cls_loss, dfl_loss).
+        batch_augment (BatchAugment | None): Batched HSV, flip and affine augmentation applied on the training device.
 
     Methods:
         build_dataset: Build YOLO datasets for training or validation.
@@ -61,6 +63,7 @@ class DetectionTrainer(BaseTrainer):
             _callbacks (list, optional): List of callback functions to be executed during training.
         """
         super().__init__(cfg, overrides, _callbacks)
+        self.batch_augment = BatchAugment.from_hyp(self.args) if self.args.batch_augment else None
 
     def build_dataset(self, img_path: str, mode: str = "train", batch: int | None = None):
         """Build YOLO Dataset for training or validation.
@@ -105,7 +108,7 @@ class DetectionTrainer(BaseTrainer):
         )
 
     def preprocess_batch(self, batch: dict) -> dict:
-        """Preprocess a batch of images by scaling and converting to float.
+        """Preprocess a batch of images by scaling and converting to float, then apply batched augmentation if enabled.
 
         Args:
             batch (dict): Dictionary containing batch data with 'img' tensor.
@@ -117,6 +120,8 @@ class DetectionTrainer(BaseTrainer):
             if isinstance(v, torch.Tensor):
                 batch[k] = v.to(self.device, non_blocking=self.device.type == "cuda")
         batch["img"] = batch["img"].float() / 255
+        if self.batch_augment is not None and not {"masks", "keypoints"} & set(batch) and batch["bboxes"].shape[1] == 4:
+            batch = self.batch_augment(batch)  # detect boxes only, the dataset skips these transforms per image
         if self.args.multi_scale:
             imgs = batch["img"]
             sz = (
@@ -133,6 +138,14 @@ class DetectionTrainer(BaseTrainer):
             batch["img"] = imgs
         return batch
 
+    def _close_dataloader_mosaic(self):
+        """Update dataloaders to stop using mosaic augmentation and apply affine warps to whole batches instead."""
+        super()._close_dataloader_mosaic()
+        if self.batch_augment is not None:
+            hyp = copy(self.args)
+            hyp.mosaic = 0.0
+            self.batch_augment = BatchAugment.from_hyp(hyp)
+
     def set_model_attributes(self):
         """Set model attributes based on datasets information."""
         # Nl = de_parallel(self.model).model[-1].nl  # number of detection layers (to scale hyps)
@@ -9,6 +9,7 @@ from typing import Any
 import numpy as np
 import torch
 import torch.distributed as dist
+from torch.nn.utils.rnn import pad_sequence
 
 from ultralytics.data import build_dataloader, build_yolo_dataset, converter
 from ultralytics.engine.validator import BaseValidator
@@ -34,6 +35,8 @@ class DetectionValidator(BaseValidator):
         lb (list[Any]): List for storing ground truth labels for hybrid saving.
         jdict (list[dict[str, Any]]): List for storing JSON detection results.
         stats (dict[str, list[torch.Tensor]]): Dictionary for storing statistics during validation.
+        batched_stats (bool): Whether matching statistics are computed per batch on device, which requires the default
+            `_prepare_batch`, `_prepare_pred` and `_process_batch` methods.
 
     Examples:
         >>> from ultralytics.models.yolo.detect import DetectionValidator
@@ -58,7 +61,12 @@ class DetectionValidator(BaseValidator):
         self.args.task = "detect"
         self.iouv = torch.linspace(0.5, 0.95, 10)  # IoU vector for mAP@0.5:0.95
         self.niou = self.iouv.numel()
-        self.metrics = DetMetrics()
+        self.metrics = DetMetrics(bins=self.args.ap_bins)
+        self.batched_stats = all(
+            getattr(type(self), m) is getattr(DetectionValidator, m)
+            for m in ("_prepare_batch", "_prepare_pred", "_process_batch")
+        )
+        self._stats_buf, self._stats_len = {}, {}
 
     def preprocess(self, batch: dict[str, Any]) -> dict[str, Any]:
         """Preprocess batch of images for YOLO validation.
@@ -95,6 +103,7 @@ class DetectionValidator(BaseValidator):
         self.end2end = getattr(model, "end2end", False)
         self.seen = 0
         self.jdict = []
+        self._stats_buf, self._stats_len = {}, {}
         self.metrics.names = model.names
         self.confusion_matrix = ConfusionMatrix(names=model.names, save_matches=self.args.plots and self.args.visualize)
 
@@ -172,22 +181,29 @@ class DetectionValidator(BaseValidator):
             preds (list[dict[str, torch.Tensor]]): List of predictions from the model.
             batch (dict[str, Any]): Batch data containing ground truth.
         """
+        if self.batched_stats:
+            self.seen += len(preds)
+            self._append_stats(self._batch_stats(preds, batch))
+            if self.metrics.bins and max(self._stats_len.values()) >= 1 << 20:  # bound memory for streaming mAP
+                self._flush_stats()
+            if not (self.args.plots or self.args.save_json or self.args.save_txt):
+                return
         for si, pred in enumerate(preds):
-            self.seen += 1
             pbatch = self._prepare_batch(si, batch)
             predn = self._prepare_pred(pred)
-
-            cls = pbatch["cls"].cpu().numpy()
             no_pred = predn["cls"].shape[0] == 0
-            self.metrics.update_stats(
-                {
-                    **self._process_batch(predn, pbatch),
-                    "target_cls": cls,
-                    "target_img": np.unique(cls),
-                    "conf": np.zeros(0) if no_pred else predn["conf"].cpu().numpy(),
-                    "pred_cls": np.zeros(0) if no_pred else predn["cls"].cpu().numpy(),
-                }
-            )
+            if not self.batched_stats:
+                self.seen += 1
+                cls = pbatch["cls"].cpu().numpy()
+                self.metrics.update_stats(
+                    {
+                        **self._process_batch(predn, pbatch),
+                        "target_cls": cls,
+                        "target_img": np.unique(cls),
+                        "conf": np.zeros(0) if no_pred else predn["conf"].cpu().numpy(),
+                        "pred_cls": np.zeros(0) if no_pred else predn["cls"].cpu().numpy(),
+                    }
+                )
             # Evaluate
             if self.args.plots:
                 self.confusion_matrix.process_batch(predn, pbatch, conf=self.args.conf)
@@ -210,6 +226,83 @@ class DetectionValidator(BaseValidator):
                     self.save_dir / "labels" / f"{Path(pbatch['im_file']).stem}.txt",
                 )
 
+    def _batch_stats(self, preds: list[dict[str, torch.Tensor]], batch: dict[str, Any]) -> dict[str, torch.Tensor]:
+        """Match all predictions of a batch to ground truth at once using padded device tensors.
+
+        Reproduces the greedy matching of `match_predictions()`: each detection is assigned its highest-IoU label of the
+        same class, and each label at each IoU threshold keeps the lowest-index detection assigned to it.
+
+        Args:
+            preds (list[dict[str, torch.Tensor]]): List of predictions from the model.
+            batch (dict[str, Any]): Batch data containing ground truth.
+
+        Returns:
+            (dict[str, torch.Tensor]): Device tensors 'tp' (N, 10), 'conf' (N,), 'pred_cls' (N,), 'target_cls' (M,) and
+                'target_img' with the unique classes of every image.
+        """
+        preds = [self._prepare_pred(p) for p in preds]
+        conf = torch.cat([p["conf"] for p in preds])
+        pred_cls = torch.cat([p["cls"] for p in preds])
+        cls = batch["cls"].view(-1)
+        bi = batch["batch_idx"].view(-1).long()
+        stats = {
+            "tp": torch.zeros((conf.shape[0], self.niou), dtype=torch.bool, device=conf.device),
+            "conf": conf,
+            "pred_cls": pred_cls,
+            "target_cls": cls,
+            "target_img": torch.unique(torch.stack([bi, cls.long()], 1), dim=0)[:, 1] if cls.shape[0] else cls,
+        }
+        if not cls.shape[0] or not conf.shape[0]:
+            return stats
+
+        # Pad labels (bs, G) and detections (bs, D), labels are sorted by image index by the collate function
+        bs, n = len(preds), [p["cls"].shape[0] for p in preds]
+        counts = torch.bincount(bi, minlength=bs)
+        pos = torch.arange(cls.shape[0], device=cls.device) - (counts.cumsum(0) - counts)[bi]
+        gt_cls = cls.new_full((bs, int(counts.max())), -1)
+        gt_cls[bi, pos] = cls
+        gt_bboxes = cls.new_zeros((*gt_cls.shape, 4))
+        imgsz = batch["img"].shape[2:]
+        gt_bboxes[bi, pos] = ops.xywh2xyxy(batch["bboxes"]) * torch.tensor(imgsz, device=cls.device)[[1, 0, 1, 0]]
+        det_cls = pad_sequence([p["cls"] for p in preds], batch_first=True, padding_value=-2)
+        det_bboxes = pad_sequence([p["bboxes"] for p in preds], batch_first=True)
+
+        # Assign every detection its best same-class label, then keep the first detection per label and threshold
+        iou = box_iou(gt_bboxes, det_bboxes) * (gt_cls.unsqueeze(2) == det_cls.unsqueeze(1))  # (bs, G, D)
+        best_iou, best_gt = iou.max(1)  # (bs, D)
+        hit = best_iou.unsqueeze(1) >= self.iouv.to(iou.device).view(1, -1, 1)  # (bs, 10, D)
+        nd = det_cls.shape[1]
+        key = best_gt.unsqueeze(1) * nd + torch.arange(nd, device=iou.device)
+        key, order = key.masked_fill(~hit, gt_cls.shape[1] * nd).sort(-1)  # unmatched detections form a last group
+        first = torch.ones_like(hit)
+        first[..., 1:] = key[..., 1:] // nd != key[..., :-1] // nd
+        correct = torch.zeros_like(hit).scatter_(2, order, first) & hit
+        valid = torch.arange(nd, device=iou.device) < torch.tensor(n, device=iou.device).unsqueeze(1)
+        stats["tp"] = correct.transpose(1, 2)[valid]
+        return stats
+
+    def _append_stats(self, stats: dict[str, torch.Tensor]) -> None:
+        """Append batch statistics to preallocated device buffers, doubling a buffer's capacity when it is full.
+
+        Args:
+            stats (dict[str, torch.Tensor]): Statistics of one batch as returned by `_batch_stats()`.
+        """
+        for k, v in stats.items():
+            buf, n = self._stats_buf.get(k), self._stats_len.get(k, 0)
+            if buf is None or n + v.shape[0] > buf.shape[0]:
+                new = v.new_empty((max(2 * (0 if buf is None else buf.shape[0]), n + v.shape[0], 1024), *v.shape[1:]))
+                if n:
+                    new[:n] = buf[:n]
+                self._stats_buf[k] = buf = new
+            buf[n : n + v.shape[0]] = v
+            self._stats_len[k] = n + v.shape[0]
+
+    def _flush_stats(self) -> None:
+        """Transfer buffered batch statistics to host memory in a single copy and add them to the metrics."""
+        if self._stats_len:
+            self.metrics.update_stats({k: self._stats_buf[k][:n].cpu().numpy() for k, n in self._stats_len.items()})
+        self._stats_buf, self._stats_len = {}, {}
+
     def finalize_metrics(self) -> None:
         """Set final values for metrics speed and confusion matrix."""
         if self.args.plots:
@@ -221,6 +314,7 @@ class DetectionValidator(BaseValidator):
 
     def gather_stats(self) -> None:
         """Gather stats from all GPUs."""
+        self._flush_stats()
         if RANK == 0:
             gathered_stats = [None] * dist.get_world_size()
             dist.gather_object(self.metrics.stats, gathered_stats, dst=0)
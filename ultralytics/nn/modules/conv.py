@@ -585,6 +585,24 @@ class ChannelAttention(nn.Module):
         out = avg_out + max_out
         return self.sigmoid(out)
 
+    def forward_fuse(self, x):
+        """Apply channel attention with both pooled descriptors sharing a single MLP pass.
+
+        The average- and max-pooled vectors are stacked and multiplied by the `f1` weights as one batched matmul. Since
+        `f2` is linear without bias, the two ReLU outputs are summed before `f2` so it is also applied only once.
+
+        Args:
+            x (torch.Tensor): Input tensor of shape (B, C, H, W).
+
+        Returns:
+            (torch.Tensor): Channel attention weights of shape (B, C, 1, 1).
+        """
+        b, c = x.shape[:2]
+        x = x.flatten(2)
+        pooled = torch.stack((x.mean(2), x.amax(2)), 2)  # (B, C, 2)
+        hidden = self.relu(self.f1.weight.view(-1, c) @ pooled).sum(2, keepdim=True)  # (B, C // ratio, 1)
+        return self.sigmoid(self.f2.weight.view(c, -1) @ hidden).view(b, c, 1, 1)
+
 
 class SpatialAttention(nn.Module):
     def __init__(self, kernel_size=7):
@@ -601,6 +619,17 @@ class SpatialAttention(nn.Module):
         x = self.conv1(x)
         return self.sigmoid(x)
 
+    def forward_fuse(self, x):
+        """Apply spatial attention using index-free channel reductions.
+
+        Args:
+            x (torch.Tensor): Input tensor of shape (B, C, H, W).
+
+        Returns:
+            (torch.Tensor): Spatial attention weights of shape (B, 1, H, W).
+        """
+        return self.sigmoid(self.conv1(torch.cat((x.mean(1, keepdim=True), x.amax(1, keepdim=True)), 1)))
+
 
 class CBAM(nn.Module):
     """Convolutional Block Attention Module."""
@@ -615,3 +644,13 @@ class CBAM(nn.Module):
         out = self.channel_attention(x) * x
         out = self.spatial_attention(out) * out
         return out
+
+    def fuse(self):
+        """Switch both attention branches to their inference-optimized forward passes.
+
+        Submodules are kept in place, so forward hooks registered on `channel_attention` or `spatial_attention` keep
+        working after fusion. The fused paths contain no data-dependent control flow and trace cleanly under
+        `torch.jit.trace` and `torch.compile`.
+        """
+        self.channel_attention.forward = self.channel_attention.forward_fuse
+        self.spatial_attention.forward = self.spatial_attention.forward_fuse
@@ -1,7 +1,15 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from .aggregate import TrackAggregator
 from .bot_sort import BOTSORT
 from .byte_tracker import BYTETracker
-from .track import register_tracker
+from .track import register_aggregator, register_tracker, track_result
 
-__all__ = "BOTSORT", "BYTETracker", "register_tracker"  # allow simpler import
+__all__ = (
+    "BOTSORT",
+    "BYTETracker",
+    "TrackAggregator",
+    "register_aggregator",
+    "register_tracker",
+    "track_result",
+)  # allow simpler import
@@ -0,0 +1,242 @@
+# Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
+"""Collapse tracked detections into one record per object and stream the records to a columnar file."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import cv2
+import numpy as np
+
+from ultralytics.utils import LOGGER
+from ultralytics.utils.checks import check_requirements
+
+
+class TrackAggregator:
+    """Aggregate tracked detections into one record per track ID with bounded memory.
+
+    Each active track keeps a single running record: frame span, number of frames, maximum confidence, bounding box
+    area statistics, and a fixed-size crop, box and optional geo location from the frame with the highest confidence.
+    A track that has not been seen for `max_age` frames is finished, and finished records are written in chunks of
+    `flush_size` to a compressed NPZ file per chunk or to row groups of a single Parquet file, so memory stays bounded by
+    the number of concurrently visible objects regardless of footage length.
+
+    Attributes:
+        file (Path | None): Output file, `.npz` (written as `<stem>_<chunk>.npz`) or `.parquet`; None only counts.
+        max_age (int): Number of frames without an update after which a track is finished.
+        flush_size (int): Number of finished records that triggers a write.
+        crop_size (int): Side length of the square best-frame crop stored per record.
+        geo (Callable | None): Optional function `geo(frame, result) -> (lat, lon)` called at each new best frame.
+        active (dict): Records of tracks that are still active, keyed by track ID.
+        frame (int): Number of results processed so far, used as the frame index.
+        count (int): Number of records finished so far.
+
+    Methods:
+        update: Update track records with a list of tracked Results.
+        flush: Write finished records to the output file.
+        close: Finish all active tracks and write every remaining record.
+        load: Load all records written to an output file.
+
+    Examples:
+        >>> from ultralytics import YOLO
+        >>> from ultralytics.trackers import TrackAggregator, register_aggregator
+        >>> model = YOLO("yolo11n.pt")
+        >>> aggregator = TrackAggregator("survey.npz", max_age=60)
+        >>> register_aggregator(model, aggregator)
+        >>> for _ in model.track("survey.mp4", stream=True):
+        ...     pass
+        >>> print(f"{aggregator.close()} unique objects")
+        >>> records = TrackAggregator.load("survey.npz")
+    """
+
+    def __init__(
+        self,
+        file: str | Path | None = None,
+        max_age: int = 60,
+        flush_size: int = 256,
+        crop_size: int = 64,
+        geo: Callable | None = None,
+    ):
+        """Initialize the TrackAggregator.
+
+        Args:
+            file (str | Path, optional): Output `.npz` or `.parquet` file. If None, records are only counted.
+            max_age (int): Number of frames without an update after which a track is finished.
+            flush_size (int): Number of finished records that triggers a write.
+            crop_size (int): Side length of the square best-frame crop stored per record.
+            geo (Callable, optional): Function `geo(frame, result) -> (lat, lon)` giving the location of a frame.
+        """
+        self.file = Path(file) if file else None
+        if self.file and self.file.suffix not in {".npz", ".parquet"}:
+            raise ValueError(f"Unsupported record file '{self.file}', expected a '.npz' or '.parquet' file.")
+        if self.file and self.file.suffix == ".npz":
+            for f in self.file.parent.glob(f"{self.file.stem}_*.npz"):  # overwrite chunks of a previous run
+                f.unlink()
+        self.max_age = max_age
+        self.flush_size = flush_size
+        self.crop_size = crop_size
+        self.geo = geo
+        self.active = {}
+        self.frame = 0
+        self.count = 0
+        self._done = []
+        self._chunk = 0
+        self._writer = None
+
+    def update(self, results: list) -> None:
+        """Update track records with a list of tracked Results and finish tracks not seen for `max_age` frames.
+
+        Args:
+            results (list[ultralytics.engine.results.Results]): Tracked results in frame order.
+        """
+        for result in results:
+            self._update(result)
+            self.frame += 1
+        for k in [k for k, rec in self.active.items() if self.frame - rec["last_frame"] > self.max_age]:
+            self._done.append(self.active.pop(k))
+        if len(self._done) >= self.flush_size:
+            self.flush()
+
+    def _update(self, result) -> None:
+        """Update the records of all tracks present in one Results object."""
+        is_obb = result.obb is not None
+        boxes = result.obb if is_obb else result.boxes
+        if boxes is None or not boxes.is_track:
+            return
+        ids = boxes.id.int().tolist()
+        cls = boxes.cls.int().tolist()
+        conf = boxes.conf.cpu().numpy()
+        xyxy = (boxes.xyxyxyxy.reshape(-1, 8) if is_obb else boxes.xyxy).cpu().numpy()  # polygon corners for OBB
+        wh = (boxes.xywhr if is_obb else boxes.xywh)[:, 2:4].cpu().numpy()
+        area = wh[:, 0] * wh[:, 1]
+        for j, tid in enumerate(ids):
+            rec = self.active.get(tid)
+            if rec is None:
+                rec = self.active[tid] = {
+                    "track_id": tid,
+                    "first_frame": self.frame,
+                    "n_frames": 0,
+                    "max_conf": -1.0,
+                    "area_min": np.inf,
+                    "area_max": 0.0,
+                    "area_sum": 0.0,
+                }
+            rec["last_frame"] = self.frame
+            rec["n_frames"] += 1
+            rec["area_min"] = min(rec["area_min"], area[j])
+            rec["area_max"] = max(rec["area_max"], area[j])
+            rec["area_sum"] += area[j]
+            if conf[j] > rec["max_conf"]:
+                rec["max_conf"] = conf[j]
+                rec["cls"] = cls[j]
+                rec["best_frame"] = self.frame
+                rec["box"] = xyxy[j]
+                rec["source"] = str(result.path)
+                rec["crop"] = self._crop(result.orig_img, xyxy[j])
+                rec["lat"], rec["lon"] = self.geo(self.frame, result) if self.geo else (np.nan, np.nan)
+
+    def _crop(self, img: np.ndarray, box: np.ndarray) -> np.ndarray:
+        """Return a `crop_size` x `crop_size` crop of the axis-aligned bounds of a box."""
+        h, w = img.shape[:2]
+        x1, x2 = np.clip(np.round([box[0::2].min(), box[0::2].max()]).astype(int), 0, w)
+        y1, y2 = np.clip(np.round([box[1::2].min(), box[1::2].max()]).astype(int), 0, h)
+        crop = img[y1 : max(y2, y1 + 1), x1 : max(x2, x1 + 1)]
+        if not crop.size:
+            return np.zeros((self.crop_size, self.crop_size, 3), dtype=np.uint8)
+        return cv2.resize(crop, (self.crop_size, self.crop_size), interpolation=cv2.INTER_AREA)
+
+    def _columns(self, records: list[dict]) -> dict[str, np.ndarray]:
+        """Convert a list of records into a dictionary of column arrays."""
+        n = np.array([r["n_frames"] for r in records], dtype=np.int32)
+        return {
+            "track_id": np.array([r["track_id"] for r in records], dtype=np.int64),
+            "cls": np.array([r["cls"] for r in records], dtype=np.int32),
+            "source": np.array([r["source"] for r in records]),
+            "first_frame": np.array([r["first_frame"] for r in records], dtype=np.int64),
+            "last_frame": np.array([r["last_frame"] for r in records], dtype=np.int64),
+            "best_frame": np.array([r["best_frame"] for r in records], dtype=np.int64),
+            "n_frames": n,
+            "max_conf": np.array([r["max_conf"] for r in records], dtype=np.float32),
+            "area_min": np.array([r["area_min"] for r in records], dtype=np.float32),
+            "area_max": np.array([r["area_max"] for r in records], dtype=np.float32),
+            "area_mean": np.array([r["area_sum"] for r in records], dtype=np.float32) / n,
+            "lat": np.array([r["lat"] for r in records], dtype=np.float64),
+            "lon": np.array([r["lon"] for r in records], dtype=np.float64),
+            "box": np.stack([r["box"] for r in records]).astype(np.float32),
+            "crop": np.stack([r["crop"] for r in records]),
+        }
+
+    def flush(self) -> None:
+        """Write all finished records to the output file and release them from memory."""
+        if not self._done:
+            return
+        records, self._done = self._done, []
+        self.count += len(records)
+        if self.file is None:
+            return
+        cols = self._columns(records)
+        if self.file.suffix == ".npz":
+            np.savez_compressed(self.file.with_name(f"{self.file.stem}_{self._chunk:05d}.npz"), **cols)
+        else:
+            check_requirements("pyarrow")
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            crops = cols.pop("crop")
+            table = pa.table(
+                {
+                    **{k: v.tolist() if v.ndim > 1 else v for k, v in cols.items()},
+                    "crop": [cv2.imencode(".jpg", c)[1].tobytes() for c in crops],  # JPEG bytes
+                }
+            )
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.file, table.schema)
+            self._writer.write_table(table)
+        self._chunk += 1
+
+    def close(self) -> int:
+        """Finish all active tracks, write every remaining record and close the output file.
+
+        Returns:
+            (int): Total number of records, i.e. unique tracked objects.
+        """
+        self._done.extend(self.active.values())
+        self.active = {}
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self.file is not None:
+            LOGGER.info(f"{self.count} track records saved to {self.file}")
+        return self.count
+
+    def __enter__(self) -> TrackAggregator:
+        """Return the aggregator for use as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the aggregator on exiting the context."""
+        self.close()
+
+    @staticmethod
+    def load(file: str | Path) -> dict[str, np.ndarray]:
+        """Load all records written to an output file as a dictionary of column arrays.
+
+        Args:
+            file (str | Path): The `.npz` or `.parquet` file passed to the aggregator.
+
+        Returns:
+            (dict[str, np.ndarray]): Column arrays; `crop` holds (N, S, S, 3) images for NPZ and JPEG bytes for Parquet.
+        """
+        file = Path(file)
+        if file.suffix == ".parquet":
+            check_requirements("pyarrow")
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(file)
+            return {k: np.array(table.column(k).to_pylist()) for k in table.column_names}
+        chunks = [np.load(f) for f in sorted(file.parent.glob(f"{file.stem}_*.npz"))]
+        if not chunks:
+            return {}
+        return {k: np.concatenate([c[k] for c in chunks]) for k in chunks[0].files}
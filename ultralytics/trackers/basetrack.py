@@ -1,6 +1,8 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 """Module defines the base classes and structures for object tracking in YOLO."""
 
+from __future__ import annotations
+
 from collections import OrderedDict
 from typing import Any
 
@@ -113,3 +115,78 @@ class BaseTrack:
     def reset_id() -> None:
         """Reset the global track ID counter to its initial value."""
         BaseTrack._count = 0
+
+
+class TrackStore:
+    """Columnar storage for the Kalman filter states of all live tracks of a tracker.
+
+    Track means and covariances are kept in preallocated arrays that grow by doubling. Each attached track reads and
+    writes its own row through its `slot`, so predicting, correcting or warping many tracks becomes a single batched
+    array operation on the gathered rows instead of a per-track Python loop.
+
+    Attributes:
+        mean (np.ndarray): State means of shape (capacity, ndim).
+        covariance (np.ndarray): State covariances of shape (capacity, ndim, ndim).
+        tracks (list): Track attached to each slot, or None for free slots.
+
+    Methods:
+        add: Attach a track and copy its state into a free slot.
+        remove: Detach a track, handing it back a private copy of its state.
+        retain: Detach all tracks except the given ones.
+        slots: Get the slot indices of a list of tracks.
+
+    Examples:
+        >>> store = TrackStore()
+        >>> store.add(track)  # track.mean is now a view of store.mean[track.slot]
+        >>> slots = store.slots([track])
+        >>> store.mean[slots, :2] += 1.0  # shift all gathered tracks at once
+    """
+
+    def __init__(self, capacity: int = 64, ndim: int = 8):
+        """Initialize empty state arrays with the given capacity and state dimension."""
+        self.mean = np.zeros((capacity, ndim))
+        self.covariance = np.zeros((capacity, ndim, ndim))
+        self.tracks = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))  # pop() hands out the lowest free slot first
+
+    def __len__(self) -> int:
+        """Return the number of attached tracks."""
+        return len(self.tracks) - len(self._free)
+
+    def _grow(self):
+        """Double the capacity of the state arrays."""
+        n = len(self.tracks)
+        self.mean = np.concatenate([self.mean, np.zeros_like(self.mean)])
+        self.covariance = np.concatenate([self.covariance, np.zeros_like(self.covariance)])
+        self.tracks.extend([None] * n)
+        self._free = list(range(2 * n - 1, n - 1, -1)) + self._free
+
+    def add(self, track) -> None:
+        """Attach a track, copying its current mean and covariance into a free slot."""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.mean[slot], self.covariance[slot] = track.mean, track.covariance
+        self.tracks[slot] = track
+        track.store, track.slot = self, slot
+
+    def remove(self, track) -> None:
+        """Detach a track and free its slot, handing the track a private copy of its state."""
+        slot = track.slot
+        track.store, track.slot = None, None
+        track.mean, track.covariance = self.mean[slot].copy(), self.covariance[slot].copy()
+        self.tracks[slot] = None
+        self._free.append(slot)
+
+    def retain(self, tracks: list) -> None:
+        """Detach every attached track that is not in `tracks`."""
+        live = {t.slot for t in tracks if t.store is self}
+        for slot, t in enumerate(self.tracks):
+            if t is not None and slot not in live:
+                self.remove(t)
+
+    def slots(self, tracks: list) -> np.ndarray | None:
+        """Return the slot indices of `tracks`, or None if any of them is not attached to this store."""
+        if not all(t.store is self for t in tracks):
+            return None
+        return np.fromiter((t.slot for t in tracks), dtype=np.intp, count=len(tracks))
@@ -94,17 +94,17 @@ class BOTrack(STrack):
 
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
 
-    def re_activate(self, new_track: BOTrack, frame_id: int, new_id: bool = False) -> None:
+    def re_activate(self, new_track: BOTrack, frame_id: int, new_id: bool = False, correct: bool = True) -> None:
         """Reactivate a track with updated features and optionally assign a new ID."""
         if new_track.curr_feat is not None:
             self.update_features(new_track.curr_feat)
-        super().re_activate(new_track, frame_id, new_id)
+        super().re_activate(new_track, frame_id, new_id, correct)
 
-    def update(self, new_track: BOTrack, frame_id: int) -> None:
+    def update(self, new_track: BOTrack, frame_id: int, correct: bool = True) -> None:
         """Update the track with new detection information and the current frame ID."""
         if new_track.curr_feat is not None:
             self.update_features(new_track.curr_feat)
-        super().update(new_track, frame_id)
+        super().update(new_track, frame_id, correct)
 
     @property
     def tlwh(self) -> np.ndarray:
@@ -120,16 +120,11 @@ class BOTrack(STrack):
         """Predict the mean and covariance for multiple object tracks using a shared Kalman filter."""
         if len(stracks) <= 0:
             return
-        multi_mean = np.asarray([st.mean.copy() for st in stracks])
-        multi_covariance = np.asarray([st.covariance for st in stracks])
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_mean[i][6] = 0
-                multi_mean[i][7] = 0
+        multi_mean, multi_covariance = BOTrack.get_states(stracks)
+        tracked = np.fromiter((st.state == TrackState.Tracked for st in stracks), dtype=bool, count=len(stracks))
+        multi_mean[~tracked, 6:8] = 0
         multi_mean, multi_covariance = BOTrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-        for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-            stracks[i].mean = mean
-            stracks[i].covariance = cov
+        BOTrack.set_states(stracks, multi_mean, multi_covariance)
 
     def convert_coords(self, tlwh: np.ndarray) -> np.ndarray:
         """Convert tlwh bounding box coordinates to xywh format."""
@@ -8,7 +8,7 @@ import numpy as np
 
 from ..utils import LOGGER
 from ..utils.ops import xywh2ltwh
-from .basetrack import BaseTrack, TrackState
+from .basetrack import BaseTrack, TrackState, TrackStore
 from .utils import matching
 from .utils.kalman_filter import KalmanFilterXYAH
 
@@ -23,8 +23,10 @@ class STrack(BaseTrack):
         shared_kalman (KalmanFilterXYAH): Shared Kalman filter used across all STrack instances for prediction.
         _tlwh (np.ndarray): Private attribute to store top-left corner coordinates and width and height of bounding box.
         kalman_filter (KalmanFilterXYAH): Instance of Kalman filter used for this particular object track.
-        mean (np.ndarray): Mean state estimate vector.
-        covariance (np.ndarray): Covariance of state estimate.
+        mean (np.ndarray): Mean state estimate vector, a view into the tracker's TrackStore once attached.
+        covariance (np.ndarray): Covariance of state estimate, a view into the tracker's TrackStore once attached.
+        store (TrackStore | None): Columnar store holding this track's Kalman state, or None if detached.
+        slot (int | None): Row of this track's state in `store`.
         is_activated (bool): Boolean flag indicating if the track has been activated.
         score (float): Confidence score of the track.
         tracklet_len (int): Length of the tracklet.
@@ -38,6 +40,9 @@ class STrack(BaseTrack):
         predict: Predict the next state of the object using Kalman filter.
         multi_predict: Predict the next states for multiple tracks.
         multi_gmc: Update multiple track states using a homography matrix.
+        multi_update: Correct multiple track states with matched detections in one batched update.
+        get_states: Gather the means and covariances of multiple tracks.
+        set_states: Write back the means and covariances of multiple tracks.
         activate: Activate a new tracklet.
         re_activate: Reactivate a previously lost tracklet.
         update: Update the state of a matched track.
@@ -66,6 +71,7 @@ class STrack(BaseTrack):
         assert len(xywh) in {5, 6}, f"expected 5 or 6 values but got {len(xywh)}"
         self._tlwh = np.asarray(xywh2ltwh(xywh[:4]), dtype=np.float32)
         self.kalman_filter = None
+        self.store, self.slot = None, None
         self.mean, self.covariance = None, None
         self.is_activated = False
 
@@ -75,6 +81,52 @@ class STrack(BaseTrack):
         self.idx = xywh[-1]
         self.angle = xywh[4] if len(xywh) == 6 else None
 
+    @property
+    def mean(self) -> np.ndarray | None:
+        """Get the mean state estimate, read from the track store when attached."""
+        return self._mean if self.store is None else self.store.mean[self.slot]
+
+    @mean.setter
+    def mean(self, value: np.ndarray | None):
+        """Set the mean state estimate, writing into the track store when attached."""
+        if self.store is None:
+            self._mean = value
+        else:
+            self.store.mean[self.slot] = value
+
+    @property
+    def covariance(self) -> np.ndarray | None:
+        """Get the state covariance, read from the track store when attached."""
+        return self._covariance if self.store is None else self.store.covariance[self.slot]
+
+    @covariance.setter
+    def covariance(self, value: np.ndarray | None):
+        """Set the state covariance, writing into the track store when attached."""
+        if self.store is None:
+            self._covariance = value
+        else:
+            self.store.covariance[self.slot] = value
+
+    @staticmethod
+    def get_states(stracks: list[STrack]) -> tuple[np.ndarray, np.ndarray]:
+        """Gather means (N, 8) and covariances (N, 8, 8) of tracks, with a single fancy index if they share a store."""
+        store = stracks[0].store
+        slots = None if store is None else store.slots(stracks)
+        if slots is not None:
+            return store.mean[slots], store.covariance[slots]
+        return np.asarray([st.mean for st in stracks]), np.asarray([st.covariance for st in stracks])
+
+    @staticmethod
+    def set_states(stracks: list[STrack], mean: np.ndarray, covariance: np.ndarray):
+        """Write back means and covariances of tracks, with a single fancy-index assignment if they share a store."""
+        store = stracks[0].store
+        slots = None if store is None else store.slots(stracks)
+        if slots is not None:
+            store.mean[slots], store.covariance[slots] = mean, covariance
+        else:
+            for st, m, c in zip(stracks, mean, covariance):
+                st.mean, st.covariance = m, c
+
     def predict(self):
         """Predict the next state (mean and covariance) of the object using the Kalman filter."""
         mean_state = self.mean.copy()
@@ -87,34 +139,37 @@ class STrack(BaseTrack):
         """Perform multi-object predictive tracking using Kalman filter for the provided list of STrack instances."""
         if len(stracks) <= 0:
             return
-        multi_mean = np.asarray([st.mean.copy() for st in stracks])
-        multi_covariance = np.asarray([st.covariance for st in stracks])
-        for i, st in enumerate(stracks):
-            if st.state != TrackState.Tracked:
-                multi_mean[i][7] = 0
+        multi_mean, multi_covariance = STrack.get_states(stracks)
+        tracked = np.fromiter((st.state == TrackState.Tracked for st in stracks), dtype=bool, count=len(stracks))
+        multi_mean[~tracked, 7] = 0
         multi_mean, multi_covariance = STrack.shared_kalman.multi_predict(multi_mean, multi_covariance)
-        for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-            stracks[i].mean = mean
-            stracks[i].covariance = cov
+        STrack.set_states(stracks, multi_mean, multi_covariance)
 
     @staticmethod
     def multi_gmc(stracks: list[STrack], H: np.ndarray = np.eye(2, 3)):
         """Update state tracks positions and covariances using a homography matrix for multiple tracks."""
         if stracks:
-            multi_mean = np.asarray([st.mean.copy() for st in stracks])
-            multi_covariance = np.asarray([st.covariance for st in stracks])
+            multi_mean, multi_covariance = STrack.get_states(stracks)
 
             R = H[:2, :2]
             R8x8 = np.kron(np.eye(4, dtype=float), R)
             t = H[:2, 2]
 
-            for i, (mean, cov) in enumerate(zip(multi_mean, multi_covariance)):
-                mean = R8x8.dot(mean)
-                mean[:2] += t
-                cov = R8x8.dot(cov).dot(R8x8.transpose())
+            multi_mean = multi_mean @ R8x8.T
+            multi_mean[:, :2] += t
+            multi_covariance = R8x8 @ multi_covariance @ R8x8.T
+            STrack.set_states(stracks, multi_mean, multi_covariance)
 
-                stracks[i].mean = mean
-                stracks[i].covariance = cov
+    @staticmethod
+    def multi_update(stracks: list[STrack], detections: list[STrack]):
+        """Correct the states of tracks with their matched detections in one batched Kalman filter update."""
+        if stracks:
+            multi_mean, multi_covariance = STrack.get_states(stracks)
+            measurement = np.asarray([st.convert_coords(det.tlwh) for st, det in zip(stracks, detections)])
+            multi_mean, multi_covariance = stracks[0].kalman_filter.multi_update(
+                multi_mean, multi_covariance, measurement
+            )
+            STrack.set_states(stracks, multi_mean, multi_covariance)
 
     def activate(self, kalman_filter: KalmanFilterXYAH, frame_id: int):
         """Activate a new tracklet using the provided Kalman filter and initialize its state and covariance."""
@@ -129,11 +184,19 @@ class STrack(BaseTrack):
         self.frame_id = frame_id
         self.start_frame = frame_id
 
-    def re_activate(self, new_track: STrack, frame_id: int, new_id: bool = False):
-        """Reactivate a previously lost track using new detection data and update its state and attributes."""
-        self.mean, self.covariance = self.kalman_filter.update(
-            self.mean, self.covariance, self.convert_coords(new_track.tlwh)
-        )
+    def re_activate(self, new_track: STrack, frame_id: int, new_id: bool = False, correct: bool = True):
+        """Reactivate a previously lost track using new detection data and update its state and attributes.
+
+        Args:
+            new_track (STrack): The new track containing updated information.
+            frame_id (int): The ID of the current frame.
+            new_id (bool): Whether to assign a new track ID.
+            correct (bool): Whether to apply the Kalman filter correction, False if `multi_update` already applied it.
+        """
+        if correct:
+            self.mean, self.covariance = self.kalman_filter.update(
+                self.mean, self.covariance, self.convert_coords(new_track.tlwh)
+            )
         self.tracklet_len = 0
         self.state = TrackState.Tracked
         self.is_activated = True
@@ -145,12 +208,13 @@ class STrack(BaseTrack):
         self.angle = new_track.angle
         self.idx = new_track.idx
 
-    def update(self, new_track: STrack, frame_id: int):
+    def update(self, new_track: STrack, frame_id: int, correct: bool = True):
         """Update the state of a matched track.
 
         Args:
             new_track (STrack): The new track containing updated information.
             frame_id (int): The ID of the current frame.
+            correct (bool): Whether to apply the Kalman filter correction, False if `multi_update` already applied it.
 
         Examples:
             Update the state of a track with new detection information
@@ -161,10 +225,10 @@ class STrack(BaseTrack):
         self.frame_id = frame_id
         self.tracklet_len += 1
 
-        new_tlwh = new_track.tlwh
-        self.mean, self.covariance = self.kalman_filter.update(
-            self.mean, self.covariance, self.convert_coords(new_tlwh)
-        )
+        if correct:
+            self.mean, self.covariance = self.kalman_filter.update(
+                self.mean, self.covariance, self.convert_coords(new_track.tlwh)
+            )
         self.state = TrackState.Tracked
         self.is_activated = True
 
@@ -243,6 +307,7 @@ class BYTETracker:
         args (Namespace): Command-line arguments.
         max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
         kalman_filter (KalmanFilterXYAH): Kalman Filter object.
+        store (TrackStore): Columnar store holding the Kalman states of all tracked and lost tracks.
 
     Methods:
         update: Update object tracker with new detections.
@@ -250,6 +315,7 @@ class BYTETracker:
         init_track: Initialize object tracking with detections.
         get_dists: Calculate the distance between tracks and detections.
         multi_predict: Predict the location of tracks.
+        update_matched: Apply matched detections to tracks with a single batched Kalman filter update.
         reset_id: Reset the ID counter of STrack.
         reset: Reset the tracker by clearing all tracks.
         joint_stracks: Combine two lists of stracks.
@@ -278,6 +344,7 @@ class BYTETracker:
         self.args = args
         self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
         self.kalman_filter = self.get_kalmanfilter()
+        self.store = TrackStore()
         self.reset_id()
 
     def update(self, results, img: np.ndarray | None = None, feats: np.ndarray | None = None) -> np.ndarray:
@@ -325,31 +392,14 @@ class BYTETracker:
 
         dists = self.get_dists(strack_pool, detections)
         matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
-
-        for itracked, idet in matches:
-            track = strack_pool[itracked]
-            det = detections[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        self.update_matched(strack_pool, detections, matches, activated_stracks, refind_stracks)
         # Step 3: Second association, with low score detection boxes association the untrack to the low score detections
         detections_second = self.init_track(results_second, feats_second)
         r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
         # TODO
         dists = matching.iou_distance(r_tracked_stracks, detections_second)
         matches, u_track, _u_detection_second = matching.linear_assignment(dists, thresh=0.5)
-        for itracked, idet in matches:
-            track = r_tracked_stracks[itracked]
-            det = detections_second[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        self.update_matched(r_tracked_stracks, detections_second, matches, activated_stracks, refind_stracks)
 
         for it in u_track:
             track = r_tracked_stracks[it]
@@ -360,9 +410,7 @@ class BYTETracker:
         detections = [detections[i] for i in u_detection]
         dists = self.get_dists(unconfirmed, detections)
         matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
-        for itracked, idet in matches:
-            unconfirmed[itracked].update(detections[idet], self.frame_id)
-            activated_stracks.append(unconfirmed[itracked])
+        self.update_matched(unconfirmed, detections, matches, activated_stracks, refind_stracks)
         for it in u_unconfirmed:
             track = unconfirmed[it]
             track.mark_removed()
@@ -373,6 +421,7 @@ class BYTETracker:
             if track.score < self.args.new_track_thresh:
                 continue
             track.activate(self.kalman_filter, self.frame_id)
+            self.store.add(track)
             activated_stracks.append(track)
         # Step 5: Update state
         for track in self.lost_stracks:
@@ -387,6 +436,7 @@ class BYTETracker:
         self.lost_stracks.extend(lost_stracks)
         self.lost_stracks = self.sub_stracks(self.lost_stracks, self.removed_stracks)
         self.tracked_stracks, self.lost_stracks = self.remove_duplicate_stracks(self.tracked_stracks, self.lost_stracks)
+        self.store.retain(self.tracked_stracks + self.lost_stracks)  # free the state rows of dropped tracks
         self.removed_stracks.extend(removed_stracks)
         if len(self.removed_stracks) > 1000:
             self.removed_stracks = self.removed_stracks[-999:]  # clip remove stracks to 1000 maximum
@@ -416,6 +466,35 @@ class BYTETracker:
         """Predict the next states for multiple tracks using Kalman filter."""
         STrack.multi_predict(tracks)
 
+    def update_matched(
+        self,
+        tracks: list[STrack],
+        detections: list[STrack],
+        matches: np.ndarray,
+        activated_stracks: list[STrack],
+        refind_stracks: list[STrack],
+    ):
+        """Apply matched detections to tracks, correcting all matched states in a single batched Kalman update.
+
+        Args:
+            tracks (list[STrack]): Tracks indexed by the first column of `matches`.
+            detections (list[STrack]): Detections indexed by the second column of `matches`.
+            matches (np.ndarray | list): Matched (track index, detection index) pairs of shape (M, 2).
+            activated_stracks (list[STrack]): List that updated tracked tracks are appended to.
+            refind_stracks (list[STrack]): List that re-activated lost tracks are appended to.
+        """
+        if not len(matches):
+            return
+        tracks, detections = [tracks[i] for i, _ in matches], [detections[j] for _, j in matches]
+        STrack.multi_update(tracks, detections)
+        for track, det in zip(tracks, detections):
+            if track.state == TrackState.Tracked:
+                track.update(det, self.frame_id, correct=False)
+                activated_stracks.append(track)
+            else:
+                track.re_activate(det, self.frame_id, new_id=False, correct=False)
+                refind_stracks.append(track)
+
     @staticmethod
     def reset_id():
         """Reset the ID counter for STrack instances to ensure unique track IDs across tracking sessions."""
@@ -428,42 +507,34 @@ class BYTETracker:
         self.removed_stracks = []  # type: list[STrack]
         self.frame_id = 0
         self.kalman_filter = self.get_kalmanfilter()
+        self.store = TrackStore()
         self.reset_id()
 
     @staticmethod
     def joint_stracks(tlista: list[STrack], tlistb: list[STrack]) -> list[STrack]:
         """Combine two lists of STrack objects into a single list, ensuring no duplicates based on track IDs."""
-        exists = {}
-        res = []
-        for t in tlista:
-            exists[t.track_id] = 1
-            res.append(t)
-        for t in tlistb:
-            tid = t.track_id
-            if not exists.get(tid, 0):
-                exists[tid] = 1
-                res.append(t)
-        return res
+        res = tlista + tlistb
+        ids = np.fromiter((t.track_id for t in res), dtype=np.int64, count=len(res))
+        _, first = np.unique(ids, return_index=True)  # first occurrence of each ID
+        return [res[i] for i in np.sort(first)]
 
     @staticmethod
     def sub_stracks(tlista: list[STrack], tlistb: list[STrack]) -> list[STrack]:
         """Filter out the stracks present in the second list from the first list."""
-        track_ids_b = {t.track_id for t in tlistb}
-        return [t for t in tlista if t.track_id not in track_ids_b]
+        ids_a = np.fromiter((t.track_id for t in tlista), dtype=np.int64, count=len(tlista))
+        ids_b = np.fromiter((t.track_id for t in tlistb), dtype=np.int64, count=len(tlistb))
+        return [tlista[i] for i in np.flatnonzero(~np.isin(ids_a, ids_b))]
 
     @staticmethod
     def remove_duplicate_stracks(stracksa: list[STrack], stracksb: list[STrack]) -> tuple[list[STrack], list[STrack]]:
         """Remove duplicate stracks from two lists based on Intersection over Union (IoU) distance."""
         pdist = matching.iou_distance(stracksa, stracksb)
-        pairs = np.where(pdist < 0.15)
-        dupa, dupb = [], []
-        for p, q in zip(*pairs):
-            timep = stracksa[p].frame_id - stracksa[p].start_frame
-            timeq = stracksb[q].frame_id - stracksb[q].start_frame
-            if timep > timeq:
-                dupb.append(q)
-            else:
-                dupa.append(p)
-        resa = [t for i, t in enumerate(stracksa) if i not in dupa]
-        resb = [t for i, t in enumerate(stracksb) if i not in dupb]
-        return resa, resb
+        p, q = np.nonzero(pdist < 0.15)
+        keepa, keepb = np.ones(len(stracksa), dtype=bool), np.ones(len(stracksb), dtype=bool)
+        if len(p):
+            timea = np.array([t.frame_id - t.start_frame for t in stracksa])
+            timeb = np.array([t.frame_id - t.start_frame for t in stracksb])
+            longer = timea[p] > timeb[q]  # keep the track that has existed longer
+            keepb[q[longer]] = False
+            keepa[p[~longer]] = False
+        return [stracksa[i] for i in np.flatnonzero(keepa)], [stracksb[i] for i in np.flatnonzero(keepb)]
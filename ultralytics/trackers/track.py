@@ -88,16 +88,44 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
         if not persist and predictor.vid_path[i if is_stream else 0] != vid_path:
             tracker.reset()
             predictor.vid_path[i if is_stream else 0] = vid_path
+        predictor.results[i] = track_result(tracker, result, is_obb)
 
-        det = (result.obb if is_obb else result.boxes).cpu().numpy()
-        tracks = tracker.update(det, result.orig_img, getattr(result, "feats", None))
-        if len(tracks) == 0:
-            continue
-        idx = tracks[:, -1].astype(int)
-        predictor.results[i] = result[idx]
 
-        update_args = {"obb" if is_obb else "boxes": torch.as_tensor(tracks[:, :-1])}
-        predictor.results[i].update(**update_args)
+def track_result(tracker: object, result: object, is_obb: bool = False) -> object:
+    """Update a tracker with the detections of one Results object and return the Results with track IDs.
+
+    Args:
+        tracker (BYTETracker | BOTSORT): Tracker to update with the detections.
+        result (ultralytics.engine.results.Results): Detection results for one frame.
+        is_obb (bool): Whether the detections are oriented bounding boxes.
+
+    Returns:
+        (ultralytics.engine.results.Results): Results restricted to tracked detections with track IDs, or the input
+            Results unchanged if nothing is tracked in this frame.
+
+    Examples:
+        Track detections frame by frame without registering predictor callbacks
+        >>> tracker = BYTETracker(args, frame_rate=30)
+        >>> for result in model.predict(frames):
+        ...     result = track_result(tracker, result)
+    """
+    det = (result.obb if is_obb else result.boxes).cpu().numpy()
+    tracks = tracker.update(det, result.orig_img, getattr(result, "feats", None))
+    if len(tracks) == 0:
+        return result
+    result = result[tracks[:, -1].astype(int)]
+    result.update(**{"obb" if is_obb else "boxes": torch.as_tensor(tracks[:, :-1])})
+    return result
+
+
+def on_predict_batch_end(predictor: object, aggregator: object) -> None:
+    """Feed the tracked results of a batch to a track aggregator.
+
+    Args:
+        predictor (ultralytics.engine.predictor.BasePredictor): The predictor holding the tracked batch results.
+        aggregator (ultralytics.trackers.aggregate.TrackAggregator): Aggregator collapsing tracks into records.
+    """
+    aggregator.update(predictor.results)
 
 
 def register_tracker(model: object, persist: bool) -> None:
@@ -114,3 +142,22 @@ def register_tracker(model: object, persist: bool) -> None:
     """
     model.add_callback("on_predict_start", partial(on_predict_start, persist=persist))
     model.add_callback("on_predict_postprocess_end", partial(on_predict_postprocess_end, persist=persist))
+
+
+def register_aggregator(model: object, aggregator: object) -> None:
+    """Register a track aggregator that collapses each tracked object into one record during `model.track()`.
+
+    Args:
+        model (object): The model object to register the aggregation callback for.
+        aggregator (ultralytics.trackers.aggregate.TrackAggregator): Aggregator receiving every tracked batch. Call its
+            `close()` method after tracking to write the remaining records.
+
+    Examples:
+        Aggregate tracks of a survey video into one record per object
+        >>> aggregator = TrackAggregator("survey.npz")
+        >>> register_aggregator(model, aggregator)
+        >>> for _ in model.track("survey.mp4", stream=True):
+        ...     pass
+        >>> aggregator.close()
+    """
+    model.add_callback("on_predict_batch_end", partial(on_predict_batch_end, aggregator=aggregator))
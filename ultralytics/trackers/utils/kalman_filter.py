@@ -23,7 +23,9 @@ class KalmanFilterXYAH:
         predict: Run the Kalman filter prediction step.
         project: Project the state distribution to measurement space.
         multi_predict: Run the Kalman filter prediction step (vectorized version).
+        multi_project: Project multiple state distributions to measurement space (vectorized version).
         update: Run the Kalman filter correction step.
+        multi_update: Run the Kalman filter correction step (vectorized version).
         gating_distance: Compute the gating distance between state distribution and measurements.
 
     Examples:
@@ -184,16 +186,42 @@ class KalmanFilterXYAH:
             self._std_weight_velocity * mean[:, 3],
         ]
         sqr = np.square(np.r_[std_pos, std_vel]).T
+        motion_cov = sqr[:, :, None] * np.eye(sqr.shape[1])  # (N, 8, 8) diagonal matrices
 
-        motion_cov = [np.diag(sqr[i]) for i in range(len(mean))]
-        motion_cov = np.asarray(motion_cov)
-
-        mean = np.dot(mean, self._motion_mat.T)
-        left = np.dot(self._motion_mat, covariance).transpose((1, 0, 2))
-        covariance = np.dot(left, self._motion_mat.T) + motion_cov
+        mean = mean @ self._motion_mat.T
+        covariance = self._motion_mat @ covariance @ self._motion_mat.T + motion_cov
 
         return mean, covariance
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray):
+        """Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            mean (np.ndarray): Projected means with shape (N, 4).
+            covariance (np.ndarray): Projected covariance matrices with shape (N, 4, 4).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = np.tile([0, 0, 1, 1, 0, 0, 0, 0], (3, 1))
+            >>> covariance = np.tile(np.eye(8), (3, 1, 1))
+            >>> projected_mean, projected_cov = kf.multi_project(mean, covariance)
+        """
+        std = [
+            self._std_weight_position * mean[:, 3],
+            self._std_weight_position * mean[:, 3],
+            1e-1 * np.ones_like(mean[:, 3]),
+            self._std_weight_position * mean[:, 3],
+        ]
+        innovation_cov = np.square(np.stack(std, 1))[:, :, None] * np.eye(len(std))
+
+        mean = mean @ self._update_mat.T
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
     def update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
         """Run Kalman filter correction step.
 
@@ -226,6 +254,35 @@ class KalmanFilterXYAH:
         new_covariance = covariance - np.linalg.multi_dot((kalman_gain, projected_cov, kalman_gain.T))
         return new_mean, new_covariance
 
+    def multi_update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
+        """Run Kalman filter correction step for multiple object states (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the predicted states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the predicted states.
+            measurement (np.ndarray): The Nx4 dimensional measurement matrix in the filter's measurement space.
+
+        Returns:
+            new_mean (np.ndarray): Measurement-corrected state means with shape (N, 8).
+            new_covariance (np.ndarray): Measurement-corrected state covariances with shape (N, 8, 8).
+
+        Examples:
+            >>> kf = KalmanFilterXYAH()
+            >>> mean = np.tile([0, 0, 1, 1, 0, 0, 0, 0], (3, 1))
+            >>> covariance = np.tile(np.eye(8), (3, 1, 1))
+            >>> measurement = np.ones((3, 4))
+            >>> new_mean, new_covariance = kf.multi_update(mean, covariance, measurement)
+        """
+        projected_mean, projected_cov = self.multi_project(mean, covariance)
+
+        # Kalman gain K = P H^T S^-1, solved as S K^T = H P since P and S are symmetric
+        kalman_gain = np.linalg.solve(projected_cov, self._update_mat @ covariance).transpose(0, 2, 1)
+        innovation = measurement - projected_mean
+
+        new_mean = mean + (kalman_gain @ innovation[..., None])[..., 0]
+        new_covariance = covariance - kalman_gain @ projected_cov @ kalman_gain.transpose(0, 2, 1)
+        return new_mean, new_covariance
+
     def gating_distance(
         self,
         mean: np.ndarray,
@@ -296,6 +353,7 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
         predict: Run the Kalman filter prediction step.
         project: Project the state distribution to measurement space.
         multi_predict: Run the Kalman filter prediction step in a vectorized manner.
+        multi_project: Project multiple state distributions to measurement space in a vectorized manner.
         update: Run the Kalman filter correction step.
 
     Examples:
@@ -448,16 +506,42 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
             self._std_weight_velocity * mean[:, 3],
         ]
         sqr = np.square(np.r_[std_pos, std_vel]).T
+        motion_cov = sqr[:, :, None] * np.eye(sqr.shape[1])  # (N, 8, 8) diagonal matrices
 
-        motion_cov = [np.diag(sqr[i]) for i in range(len(mean))]
-        motion_cov = np.asarray(motion_cov)
-
-        mean = np.dot(mean, self._motion_mat.T)
-        left = np.dot(self._motion_mat, covariance).transpose((1, 0, 2))
-        covariance = np.dot(left, self._motion_mat.T) + motion_cov
+        mean = mean @ self._motion_mat.T
+        covariance = self._motion_mat @ covariance @ self._motion_mat.T + motion_cov
 
         return mean, covariance
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray):
+        """Project multiple state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (np.ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (np.ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            mean (np.ndarray): Projected means with shape (N, 4).
+            covariance (np.ndarray): Projected covariance matrices with shape (N, 4, 4).
+
+        Examples:
+            >>> kf = KalmanFilterXYWH()
+            >>> mean = np.tile([0, 0, 1, 1, 0, 0, 0, 0], (3, 1))
+            >>> covariance = np.tile(np.eye(8), (3, 1, 1))
+            >>> projected_mean, projected_cov = kf.multi_project(mean, covariance)
+        """
+        std = [
+            self._std_weight_position * mean[:, 2],
+            self._std_weight_position * mean[:, 3],
+            self._std_weight_position * mean[:, 2],
+            self._std_weight_position * mean[:, 3],
+        ]
+        innovation_cov = np.square(np.stack(std, 1))[:, :, None] * np.eye(len(std))
+
+        mean = mean @ self._update_mat.T
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
     def update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray):
         """Run Kalman filter correction step.
 
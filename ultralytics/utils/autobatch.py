@@ -1,9 +1,15 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
-"""Functions for estimating the best YOLO batch size to use a fraction of the available CUDA memory in PyTorch."""
+"""Functions for estimating the best YOLO batch size to use a fraction of the available CUDA or CPU memory."""
 
 from __future__ import annotations
 
+import gc
+import math
 import os
+import random
+import threading
+import time
+from contextlib import contextmanager
 from copy import deepcopy
 
 import numpy as np
@@ -42,6 +48,28 @@ def check_train_batch_size(
         )
 
 
+def check_infer_batch_size(
+    model: torch.nn.Module,
+    imgsz: int | list[int] = 640,
+    half: bool = False,
+    batch: int | float = -1,
+) -> int:
+    """Compute optimal YOLO inference batch size for `val` and `predict` using the autobatch() function.
+
+    Args:
+        model (torch.nn.Module): YOLO model to check batch size for.
+        imgsz (int | list[int], optional): Image size used for inference, the largest side is profiled.
+        half (bool, optional): Use FP16 half-precision inference if True.
+        batch (int | float, optional): Fraction of device memory to use. If -1, use default.
+
+    Returns:
+        (int): Optimal batch size computed using the autobatch() function.
+    """
+    imgsz = max(imgsz) if isinstance(imgsz, (list, tuple)) else imgsz
+    with autocast(enabled=half):
+        return autobatch(deepcopy(model).eval(), imgsz, fraction=batch if 0.0 < batch < 1.0 else 0.6)
+
+
 def autobatch(
     model: torch.nn.Module,
     imgsz: int = 640,
@@ -51,6 +79,8 @@ def autobatch(
 ) -> int:
     """Automatically estimate the best YOLO batch size to use a fraction of the available CUDA memory.
 
+    On CPU the batch size is chosen from profiled throughput and RAM usage instead, see cpu_autobatch().
+
     Args:
         model (torch.nn.Module): YOLO model to compute batch size for.
         imgsz (int, optional): The image size used as input for the YOLO model.
@@ -62,10 +92,12 @@ def autobatch(
         (int): The optimal batch size.
     """
     # Check device
+    device = next(model.parameters()).device  # get model device
+    if device.type == "cpu":
+        return cpu_autobatch(model, imgsz, fraction, batch_size, max_num_obj)[0]
     prefix = colorstr("AutoBatch: ")
     LOGGER.info(f"{prefix}Computing optimal batch size for imgsz={imgsz} at {fraction * 100}% CUDA memory utilization.")
-    device = next(model.parameters()).device  # get model device
-    if device.type in {"cpu", "mps"}:
+    if device.type == "mps":
         LOGGER.warning(f"{prefix}intended for CUDA devices, using default batch-size {batch_size}")
         return batch_size
     if torch.backends.cudnn.benchmark:
@@ -116,3 +148,143 @@ def autobatch(
         return batch_size
     finally:
         torch.cuda.empty_cache()
+
+
+@contextmanager
+def _peak_rss(process, interval: float = 0.005):
+    """Sample the peak resident set size of a psutil process in a background thread while the context is active."""
+    info = {"memory": process.memory_info().rss}
+    stop = threading.Event()
+
+    def sample():
+        while not stop.wait(interval):
+            info["memory"] = max(info["memory"], process.memory_info().rss)
+
+    thread = threading.Thread(target=sample, daemon=True)
+    thread.start()
+    try:
+        yield info
+    finally:
+        stop.set()
+        thread.join()
+        info["memory"] = max(info["memory"], process.memory_info().rss)
+
+
+def cpu_autobatch(
+    model: torch.nn.Module,
+    imgsz: int = 640,
+    fraction: float = 0.60,
+    batch_size: int = DEFAULT_CFG.batch,
+    max_num_obj: int = 1,
+    max_batch: int = 64,
+    n: int = 2,
+) -> tuple[int, float]:
+    """Estimate the YOLO batch size at the knee of the CPU throughput curve within a fraction of the available RAM.
+
+    Batch sizes 1, 2, 4, ... are timed over `n` passes (forward and backward for models in train mode, forward only
+    otherwise) while the peak RSS of the process is sampled. Profiling stops before a batch size expected to exceed the
+    memory budget or once throughput falls clearly below the best seen, and the smallest batch size reaching 90% of the
+    best throughput is selected, as larger batches only add memory and latency beyond that point.
+
+    Args:
+        model (torch.nn.Module): YOLO model on CPU to compute batch size for.
+        imgsz (int, optional): The image size used as input for the YOLO model.
+        fraction (float, optional): The fraction of available RAM to use.
+        batch_size (int, optional): The default batch size to use if an error is detected.
+        max_num_obj (int, optional): The maximum number of objects from datasets, adds the training assigner memory.
+        max_batch (int, optional): The largest batch size to profile.
+        n (int, optional): Number of timed passes per batch size after one warmup pass.
+
+    Returns:
+        batch (int): The optimal batch size.
+        rate (float): Throughput in images per second at that batch size, 0.0 if profiling failed.
+
+    Examples:
+        >>> from ultralytics import YOLO
+        >>> from ultralytics.utils.autobatch import cpu_autobatch
+        >>> batch, rate = cpu_autobatch(YOLO("yolo11n.pt").model.eval(), imgsz=320)
+    """
+    import psutil  # scoped as slow import
+
+    prefix = colorstr("AutoBatch: ")
+    gb = 1 << 30  # bytes to GiB (1024 ** 3)
+    process = psutil.Process()
+    available = psutil.virtual_memory().available / gb  # GiB available
+    budget = available * fraction
+    LOGGER.info(f"{prefix}Profiling CPU throughput for imgsz={imgsz} within {fraction * 100}% of {available:.2f}G RAM.")
+    train = model.training
+    if train and not all(p.requires_grad for p in model.parameters()):
+        model = deepcopy(model).requires_grad_(True)  # released weights are saved with requires_grad=False
+    anchors = sum((imgsz / s) ** 2 for s in model.stride.tolist()) if max_num_obj and hasattr(model, "stride") else 0
+
+    def tensors(y):
+        """Flatten nested model outputs into a list of tensors."""
+        if isinstance(y, torch.Tensor):
+            return [y]
+        return [t for yi in (y.values() if isinstance(y, dict) else y) for t in tensors(yi)]
+
+    results = []  # (batch size, images/s, GiB)
+    try:
+        LOGGER.info(f"{prefix}{'batch':>8s}{'images/s':>12s}{'RAM (GB)':>12s}")
+        base = process.memory_info().rss
+        for b in (2**i for i in range(int(math.log2(max_batch)) + 1)):
+            x = torch.randn(b, 3, imgsz, imgsz)
+            with _peak_rss(process) as info, torch.set_grad_enabled(train):
+                for i in range(n + 1):  # first pass warms up
+                    if i == 1:
+                        t = time.perf_counter()
+                    y = model(x)
+                    if train:
+                        sum(yi.float().sum() for yi in tensors(y)).backward()
+                        model.zero_grad(set_to_none=True)
+                    del y
+            rate = b * n / (time.perf_counter() - t)
+            mem = (info["memory"] - base + b * max_num_obj * anchors * 4) / gb  # simulated assigner buffers in float32
+            LOGGER.info(f"{prefix}{b:>8d}{rate:>12.1f}{mem:>12.3f}")
+            if mem > budget:
+                break
+            results.append((b, rate, mem))
+            best = max(r[1] for r in results)
+            if rate < 0.8 * best or 2 * mem - (results[-2][2] if len(results) > 1 else 0) > budget:
+                break  # past the knee, or the next batch size is expected to exceed the budget
+    except Exception as e:
+        LOGGER.warning(f"{prefix}error detected: {e},  using default batch-size {batch_size}.")
+        return batch_size, 0.0
+    finally:
+        gc.collect()
+
+    if not results:
+        LOGGER.warning(f"{prefix}batch-size 1 exceeds {budget:.2f}G RAM budget, using batch-size 1.")
+        return 1, 0.0
+    best = max(r[1] for r in results)
+    b, rate, mem = next(r for r in results if r[1] >= 0.9 * best)  # knee: smallest batch within 10% of best
+    LOGGER.info(f"{prefix}Using batch-size {b} for CPU {rate:.1f} images/s, {mem:.2f}G/{available:.2f}G RAM ✅")
+    return b, rate
+
+
+def autoworkers(dataset, rate: float, workers: int = 8, n: int = 8) -> int:
+    """Estimate the number of dataloader workers needed to keep up with a profiled model throughput.
+
+    Loads `n` random samples in the current process to measure the per-sample loading time, then returns the smallest
+    number of workers that can produce `rate` images per second, so CPU cores are not taken from the model by idle
+    workers.
+
+    Args:
+        dataset (torch.utils.data.Dataset): Dataset to sample from.
+        rate (float): Model throughput in images per second, e.g. from cpu_autobatch().
+        workers (int, optional): Maximum number of workers.
+        n (int, optional): Number of samples to time.
+
+    Returns:
+        (int): Number of dataloader workers, at most `workers`.
+    """
+    if not workers or rate <= 0 or not len(dataset):
+        return workers
+    indices = random.sample(range(len(dataset)), min(n, len(dataset)))
+    t = time.perf_counter()
+    for i in indices:
+        dataset[i]
+    dt = (time.perf_counter() - t) / len(indices)  # seconds per sample
+    nw = min(workers, max(math.ceil(rate * dt), 1))
+    LOGGER.info(f"{colorstr('AutoBatch: ')}Using {nw} dataloader workers for {rate:.1f} images/s at {dt:.3f}s/image")
+    return nw
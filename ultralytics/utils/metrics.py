@@ -58,23 +58,43 @@ def box_iou(box1: torch.Tensor, box2: torch.Tensor, eps: float = 1e-7) -> torch.
     """Calculate intersection-over-union (IoU) of boxes.
 
     Args:
-        box1 (torch.Tensor): A tensor of shape (N, 4) representing N bounding boxes in (x1, y1, x2, y2) format.
-        box2 (torch.Tensor): A tensor of shape (M, 4) representing M bounding boxes in (x1, y1, x2, y2) format.
+        box1 (torch.Tensor): A tensor of shape (..., N, 4) representing N bounding boxes in (x1, y1, x2, y2) format.
+        box2 (torch.Tensor): A tensor of shape (..., M, 4) representing M bounding boxes in (x1, y1, x2, y2) format.
         eps (float, optional): A small value to avoid division by zero.
 
     Returns:
-        (torch.Tensor): An NxM tensor containing the pairwise IoU values for every element in box1 and box2.
+        (torch.Tensor): An (..., N, M) tensor containing the pairwise IoU values for every element in box1 and box2,
+            where leading batch dimensions are broadcast.
 
     References:
         https://github.com/pytorch/vision/blob/main/torchvision/ops/boxes.py
     """
     # NOTE: Need .float() to get accurate iou values
     # inter(N,M) = (rb(N,M,2) - lt(N,M,2)).clamp(0).prod(2)
-    (a1, a2), (b1, b2) = box1.float().unsqueeze(1).chunk(2, 2), box2.float().unsqueeze(0).chunk(2, 2)
-    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(2)
+    (a1, a2), (b1, b2) = box1.float().unsqueeze(-2).chunk(2, -1), box2.float().unsqueeze(-3).chunk(2, -1)
+    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(-1)
 
     # IoU = inter / (area1 + area2 - inter)
-    return inter / ((a2 - a1).prod(2) + (b2 - b1).prod(2) - inter + eps)
+    return inter / ((a2 - a1).prod(-1) + (b2 - b1).prod(-1) - inter + eps)
+
+
+def box_ios(box1: torch.Tensor, box2: torch.Tensor, eps: float = 1e-7) -> torch.Tensor:
+    """Calculate intersection over the smaller box area (IoS) of boxes.
+
+    Unlike IoU, IoS is close to 1 when one box lies inside the other, which makes it suitable for merging partial
+    detections of an object cut off at a tile border with the complete detection.
+
+    Args:
+        box1 (torch.Tensor): A tensor of shape (N, 4) representing N bounding boxes in (x1, y1, x2, y2) format.
+        box2 (torch.Tensor): A tensor of shape (M, 4) representing M bounding boxes in (x1, y1, x2, y2) format.
+        eps (float, optional): A small value to avoid division by zero.
+
+    Returns:
+        (torch.Tensor): An NxM tensor containing the pairwise IoS values for every element in box1 and box2.
+    """
+    (a1, a2), (b1, b2) = box1.float().unsqueeze(1).chunk(2, 2), box2.float().unsqueeze(0).chunk(2, 2)
+    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(2)
+    return inter / (torch.min((a2 - a1).prod(2), (b2 - b1).prod(2)) + eps)
 
 
 def bbox_iou(
@@ -389,59 +409,47 @@ class ConfusionMatrix(DataExportMixin):
                 self._append_matches("GT", batch, i)  # store GT
         is_obb = gt_bboxes.shape[1] == 5  # check if boxes contains angle for OBB
         conf = 0.25 if conf in {None, 0.01 if is_obb else 0.001} else conf  # apply 0.25 if default val conf is passed
-        no_pred = detections["cls"].shape[0] == 0
-        if gt_cls.shape[0] == 0:  # Check if labels is empty
-            if not no_pred:
-                detections = {k: detections[k][detections["conf"] > conf] for k in detections}
-                detection_classes = detections["cls"].int().tolist()
-                for i, dc in enumerate(detection_classes):
-                    self.matrix[dc, self.nc] += 1  # FP
-                    self._append_matches("FP", detections, i)
-            return
-        if no_pred:
-            gt_classes = gt_cls.int().tolist()
-            for i, gc in enumerate(gt_classes):
-                self.matrix[self.nc, gc] += 1  # FN
-                self._append_matches("FN", batch, i)
-            return
-
         detections = {k: detections[k][detections["conf"] > conf] for k in detections}
-        gt_classes = gt_cls.int().tolist()
-        detection_classes = detections["cls"].int().tolist()
-        bboxes = detections["bboxes"]
-        iou = batch_probiou(gt_bboxes, bboxes) if is_obb else box_iou(gt_bboxes, bboxes)
-
-        x = torch.where(iou > iou_thres)
-        if x[0].shape[0]:
-            matches = torch.cat((torch.stack(x, 1), iou[x[0], x[1]][:, None]), 1).cpu().numpy()
-            if x[0].shape[0] > 1:
-                matches = matches[matches[:, 2].argsort()[::-1]]
-                matches = matches[np.unique(matches[:, 1], return_index=True)[1]]
-                matches = matches[matches[:, 2].argsort()[::-1]]
-                matches = matches[np.unique(matches[:, 0], return_index=True)[1]]
-        else:
-            matches = np.zeros((0, 3))
-
-        n = matches.shape[0] > 0
-        m0, m1, _ = matches.transpose().astype(int)
-        for i, gc in enumerate(gt_classes):
-            j = m0 == i
-            if n and sum(j) == 1:
-                dc = detection_classes[m1[j].item()]
-                self.matrix[dc, gc] += 1  # TP if class is correct else both an FP and an FN
-                if dc == gc:
-                    self._append_matches("TP", detections, m1[j].item())
+        gt_classes = gt_cls.int().cpu().numpy().reshape(-1)
+        detection_classes = detections["cls"].int().cpu().numpy().reshape(-1)
+        ngt, ndet = len(gt_classes), len(detection_classes)
+
+        # One-to-one matching: highest IoU pair per detection, then highest remaining IoU pair per ground truth
+        m0, m1 = np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        if ngt and ndet:
+            bboxes = detections["bboxes"]
+            iou = batch_probiou(gt_bboxes, bboxes) if is_obb else box_iou(gt_bboxes, bboxes)
+            x = torch.where(iou > iou_thres)
+            if x[0].shape[0]:
+                matches = torch.cat((torch.stack(x, 1), iou[x[0], x[1]][:, None]), 1).cpu().numpy()
+                matches = matches[matches[:, 2].argsort()[::-1]]  # sort by IoU once, filters below keep the order
+                for col in (1, 0):  # unique detections, then unique ground truths
+                    keep = np.zeros(len(matches), dtype=bool)
+                    keep[np.unique(matches[:, col], return_index=True)[1]] = True  # first, i.e. highest IoU
+                    matches = matches[keep]
+                m0, m1 = matches[:, 0].astype(int), matches[:, 1].astype(int)
+
+        # Matched GTs are TP (or FP and FN if classes differ), unmatched GTs are FN and unmatched detections are FP
+        gt_hit = np.zeros(ngt, dtype=bool)
+        gt_hit[m0] = True
+        det_hit = np.zeros(ndet, dtype=bool)
+        det_hit[m1] = True
+        bg = self.nc  # background row and column
+        rows = np.concatenate((detection_classes[m1], np.full((~gt_hit).sum(), bg), detection_classes[~det_hit]))
+        cols = np.concatenate((gt_classes[m0], gt_classes[~gt_hit], np.full((~det_hit).sum(), bg)))
+        self.matrix += np.bincount(rows * (bg + 1) + cols, minlength=self.matrix.size).reshape(self.matrix.shape)
+
+        if self.matches is not None:
+            for i, j in zip(m0.tolist(), m1.tolist()):
+                if detection_classes[j] == gt_classes[i]:
+                    self._append_matches("TP", detections, j)
                 else:
-                    self._append_matches("FP", detections, m1[j].item())
+                    self._append_matches("FP", detections, j)
                     self._append_matches("FN", batch, i)
-            else:
-                self.matrix[self.nc, gc] += 1  # FN
+            for i in np.flatnonzero(~gt_hit).tolist():
                 self._append_matches("FN", batch, i)
-
-        for i, dc in enumerate(detection_classes):
-            if not any(m1 == i):
-                self.matrix[dc, self.nc] += 1  # FP
-                self._append_matches("FP", detections, i)
+            for j in np.flatnonzero(~det_hit).tolist():
+                self._append_matches("FP", detections, j)
 
     def matrix(self):
         """Return the confusion matrix."""
@@ -740,6 +748,80 @@ def compute_ap(recall: list[float], precision: list[float]) -> tuple[float, np.n
     return ap, mpre, mrec
 
 
+def _pr_curves(
+    tpc: np.ndarray, fpc: np.ndarray, conf: np.ndarray, n_l: int, x: np.ndarray, eps: float = 1e-16
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the precision, recall and AP of one class from cumulative TP and FP counts in descending confidence.
+
+    Args:
+        tpc (np.ndarray): Cumulative true positive counts of shape (N, T) for T IoU thresholds.
+        fpc (np.ndarray): Cumulative false positive counts of shape (N, T).
+        conf (np.ndarray): Descending confidence of shape (N,) at which the counts are taken.
+        n_l (int): Number of labels of the class.
+        x (np.ndarray): Confidence values at which the precision and recall curves are sampled.
+        eps (float, optional): A small value to avoid division by zero.
+
+    Returns:
+        ap (np.ndarray): Average precision at each IoU threshold of shape (T,).
+        p_curve (np.ndarray): Precision curve sampled at x.
+        r_curve (np.ndarray): Recall curve sampled at x.
+        prec_values (np.ndarray): Precision envelope at mAP@0.5 sampled at recall values x.
+    """
+    # Recall
+    recall = tpc / (n_l + eps)  # recall curve
+    r_curve = np.interp(-x, -conf, recall[:, 0], left=0)  # negative x, xp because xp decreases
+
+    # Precision
+    precision = tpc / (tpc + fpc)  # precision curve
+    p_curve = np.interp(-x, -conf, precision[:, 0], left=1)  # p at pr_score
+
+    # AP from recall-precision curve
+    ap = np.zeros(tpc.shape[1])
+    for j in range(tpc.shape[1]):
+        ap[j], mpre, mrec = compute_ap(recall[:, j], precision[:, j])
+        if j == 0:
+            prec_values = np.interp(x, mrec, mpre)  # precision at mAP@0.5
+    return ap, p_curve, r_curve, prec_values
+
+
+def _ap_results(
+    ap: np.ndarray,
+    p_curve: np.ndarray,
+    r_curve: np.ndarray,
+    prec_values: list[np.ndarray],
+    unique_classes: np.ndarray,
+    nt: np.ndarray,
+    x: np.ndarray,
+    plot: bool = False,
+    on_plot=None,
+    save_dir: Path = Path(),
+    names: dict[int, str] = {},
+    eps: float = 1e-16,
+    prefix: str = "",
+) -> tuple:
+    """Compute F1 curves, plot PR curves and select max-F1 metrics from per-class precision and recall curves.
+
+    Returns:
+        (tuple): The results of `ap_per_class()`.
+    """
+    prec_values = np.array(prec_values) if prec_values else np.zeros((1, 1000))  # (nc, 1000)
+
+    # Compute F1 (harmonic mean of precision and recall)
+    f1_curve = 2 * p_curve * r_curve / (p_curve + r_curve + eps)
+    names = {i: names[k] for i, k in enumerate(unique_classes) if k in names}  # dict: only classes that have data
+    if plot:
+        plot_pr_curve(x, prec_values, ap, save_dir / f"{prefix}PR_curve.png", names, on_plot=on_plot)
+        plot_mc_curve(x, f1_curve, save_dir / f"{prefix}F1_curve.png", names, ylabel="F1", on_plot=on_plot)
+        plot_mc_curve(x, p_curve, save_dir / f"{prefix}P_curve.png", names, ylabel="Precision", on_plot=on_plot)
+        plot_mc_curve(x, r_curve, save_dir / f"{prefix}R_curve.png", names, ylabel="Recall", on_plot=on_plot)
+
+    i = smooth(f1_curve.mean(0), 0.1).argmax()  # max F1 index
+    p, r, f1 = p_curve[:, i], r_curve[:, i], f1_curve[:, i]  # max-F1 precision, recall, F1 values
+    tp = (r * nt).round()  # true positives
+    fp = (tp / (p + eps) - tp).round()  # false positives
+    return tp, fp, p, r, f1, ap, unique_classes.astype(int), p_curve, r_curve, f1_curve, x, prec_values
+
+
 def ap_per_class(
     tp: np.ndarray,
     conf: np.ndarray,
@@ -803,37 +885,93 @@ def ap_per_class(
         # Accumulate FPs and TPs
         fpc = (1 - tp[i]).cumsum(0)
         tpc = tp[i].cumsum(0)
+        ap[ci], p_curve[ci], r_curve[ci], prec = _pr_curves(tpc, fpc, conf[i], n_l, x, eps)
+        prec_values.append(prec)
+
+    return _ap_results(
+        ap,
+        p_curve,
+        r_curve,
+        prec_values,
+        unique_classes,
+        nt,
+        x,
+        plot=plot,
+        on_plot=on_plot,
+        save_dir=save_dir,
+        names=names,
+        eps=eps,
+        prefix=prefix,
+    )
 
-        # Recall
-        recall = tpc / (n_l + eps)  # recall curve
-        r_curve[ci] = np.interp(-x, -conf[i], recall[:, 0], left=0)  # negative x, xp because xp decreases
-
-        # Precision
-        precision = tpc / (tpc + fpc)  # precision curve
-        p_curve[ci] = np.interp(-x, -conf[i], precision[:, 0], left=1)  # p at pr_score
 
-        # AP from recall-precision curve
-        for j in range(tp.shape[1]):
-            ap[ci, j], mpre, mrec = compute_ap(recall[:, j], precision[:, j])
-            if j == 0:
-                prec_values.append(np.interp(x, mrec, mpre))  # precision at mAP@0.5
+def ap_per_class_hist(
+    tp: np.ndarray,
+    n: np.ndarray,
+    nt: np.ndarray,
+    plot: bool = False,
+    on_plot=None,
+    save_dir: Path = Path(),
+    names: dict[int, str] = {},
+    eps: float = 1e-16,
+    prefix: str = "",
+) -> tuple:
+    """Compute the average precision per class from confidence histograms of the detections.
 
-    prec_values = np.array(prec_values) if prec_values else np.zeros((1, 1000))  # (nc, 1000)
+    Detections are binned by confidence into equal-width bins, so the cost depends only on the number of classes and
+    bins, not on the number of detections. Each bin acts as a single operating point at its center confidence, which
+    approximates `ap_per_class()` with an error that shrinks as the number of bins grows.
 
-    # Compute F1 (harmonic mean of precision and recall)
-    f1_curve = 2 * p_curve * r_curve / (p_curve + r_curve + eps)
-    names = {i: names[k] for i, k in enumerate(unique_classes) if k in names}  # dict: only classes that have data
-    if plot:
-        plot_pr_curve(x, prec_values, ap, save_dir / f"{prefix}PR_curve.png", names, on_plot=on_plot)
-        plot_mc_curve(x, f1_curve, save_dir / f"{prefix}F1_curve.png", names, ylabel="F1", on_plot=on_plot)
-        plot_mc_curve(x, p_curve, save_dir / f"{prefix}P_curve.png", names, ylabel="Precision", on_plot=on_plot)
-        plot_mc_curve(x, r_curve, save_dir / f"{prefix}R_curve.png", names, ylabel="Recall", on_plot=on_plot)
+    Args:
+        tp (np.ndarray): True positive counts of shape (nc, bins, T) per class, confidence bin and IoU threshold.
+        n (np.ndarray): Detection counts of shape (nc, bins) per class and confidence bin.
+        nt (np.ndarray): Label counts of shape (nc,) per class.
+        plot (bool, optional): Whether to plot PR curves or not.
+        on_plot (callable, optional): A callback to pass plots path and data when they are rendered.
+        save_dir (Path, optional): Directory to save the PR curves.
+        names (dict[int, str], optional): Dictionary of class names to plot PR curves.
+        eps (float, optional): A small value to avoid division by zero.
+        prefix (str, optional): A prefix string for saving the plot files.
 
-    i = smooth(f1_curve.mean(0), 0.1).argmax()  # max F1 index
-    p, r, f1 = p_curve[:, i], r_curve[:, i], f1_curve[:, i]  # max-F1 precision, recall, F1 values
-    tp = (r * nt).round()  # true positives
-    fp = (tp / (p + eps) - tp).round()  # false positives
-    return tp, fp, p, r, f1, ap, unique_classes.astype(int), p_curve, r_curve, f1_curve, x, prec_values
+    Returns:
+        (tuple): The same results as `ap_per_class()`.
+
+    Examples:
+        >>> tp = np.zeros((2, 100, 10))
+        >>> tp[0, 90] = 3  # 3 correct class 0 detections with confidence in [0.90, 0.91)
+        >>> n = np.zeros((2, 100))
+        >>> n[0, 90] = 4
+        >>> results = ap_per_class_hist(tp, n, nt=np.array([5, 0]))
+    """
+    unique_classes = np.nonzero(nt)[0]  # classes with labels
+    nc, bins = unique_classes.shape[0], n.shape[1]
+    conf = (np.arange(bins)[::-1] + 0.5) / bins  # bin centers, descending
+    x, prec_values = np.linspace(0, 1, 1000), []
+    ap, p_curve, r_curve = np.zeros((nc, tp.shape[2])), np.zeros((nc, 1000)), np.zeros((nc, 1000))
+    for ci, c in enumerate(unique_classes):
+        if c >= n.shape[0] or not n[c].any():
+            continue
+        i = n[c, ::-1] > 0  # non-empty bins, descending confidence
+        tpc = tp[c, ::-1][i].cumsum(0)
+        fpc = n[c, ::-1][i].cumsum(0)[:, None] - tpc
+        ap[ci], p_curve[ci], r_curve[ci], prec = _pr_curves(tpc, fpc, conf[i], nt[c], x, eps)
+        prec_values.append(prec)
+
+    return _ap_results(
+        ap,
+        p_curve,
+        r_curve,
+        prec_values,
+        unique_classes,
+        nt[unique_classes],
+        x,
+        plot=plot,
+        on_plot=on_plot,
+        save_dir=save_dir,
+        names=names,
+        eps=eps,
+        prefix=prefix,
+    )
 
 
 class Metric(SimpleClass):
@@ -1012,6 +1150,7 @@ class DetMetrics(SimpleClass, DataExportMixin):
         task (str): The task type, set to 'detect'.
         stats (dict[str, list]): A dictionary containing lists for true positives, confidence scores, predicted classes,
             target classes, and target images.
+        bins (int): Number of confidence bins for streaming histogram mAP, or 0 to keep all predictions for exact mAP.
         nt_per_class: Number of targets per class.
         nt_per_image: Number of targets per image.
 
@@ -1031,13 +1170,16 @@ class DetMetrics(SimpleClass, DataExportMixin):
         summary: Generate a summarized representation of per-class detection metrics as a list of dictionaries.
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize a DetMetrics instance with a save directory, plot flag, and class names.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Number of confidence bins for streaming histogram mAP with bounded memory. If 0, all
+                predictions are kept for exact mAP.
         """
         self.names = names
+        self.bins = bins
         self.box = Metric()
         self.speed = {"preprocess": 0.0, "inference": 0.0, "loss": 0.0, "postprocess": 0.0}
         self.task = "detect"
@@ -1048,12 +1190,55 @@ class DetMetrics(SimpleClass, DataExportMixin):
     def update_stats(self, stat: dict[str, Any]) -> None:
         """Update statistics by appending new values to existing stat collections.
 
+        In histogram mode (`bins > 0`) each stats list instead holds a single count array that new values are added to:
+        (nc, bins, T) true positives per class and confidence bin for 'tp' keys, (nc, bins) detections for 'conf' and
+        (nc,) class counts for the other keys.
+
         Args:
             stat (dict[str, any]): Dictionary containing new statistical values to append. Keys should match existing
                 keys in self.stats.
         """
-        for k in self.stats.keys():
-            self.stats[k].append(stat[k])
+        if not self.bins:
+            for k in self.stats.keys():
+                self.stats[k].append(stat[k])
+            return
+
+        cls = {k: stat[k].astype(int) for k in ("pred_cls", "target_cls", "target_img")}
+        nc = max([len(self.names)] + [int(v.max()) + 1 for v in cls.values() if len(v)])
+        b = np.clip((stat["conf"] * self.bins).astype(int), 0, self.bins - 1)  # confidence bin
+        for k, v in self.stats.items():
+            shape = (self.bins, *stat[k].shape[1:]) if k.startswith("tp") else (self.bins,) if k == "conf" else ()
+            if not v or v[0].shape[0] < nc:
+                self.stats[k] = v = [self._hist_sum(v + [np.zeros((nc, *shape))])]
+            if k in cls:
+                np.add.at(v[0], cls[k], 1)
+            else:
+                np.add.at(v[0], (cls["pred_cls"], b), stat[k] if k.startswith("tp") else 1)
+
+    @staticmethod
+    def _hist_sum(hists: list[np.ndarray]) -> np.ndarray:
+        """Sum count histograms whose first (class) dimension may differ in length."""
+        out = np.zeros((max(h.shape[0] for h in hists), *hists[0].shape[1:]))
+        for h in hists:
+            out[: h.shape[0]] += h
+        return out
+
+    def _ap_per_class(self, stats: dict[str, np.ndarray], key: str, **kwargs) -> tuple:
+        """Compute per-class AP for the true positives in `stats[key]` exactly or from histograms.
+
+        Args:
+            stats (dict[str, np.ndarray]): Statistics returned by `process()`.
+            key (str): True positive key, e.g. 'tp' for boxes or 'tp_m' for masks.
+            **kwargs (Any): Additional keyword arguments for `ap_per_class()` or `ap_per_class_hist()`.
+
+        Returns:
+            (tuple): The results of `ap_per_class()`.
+        """
+        if self.bins:
+            return ap_per_class_hist(stats[key], stats["conf"], stats["target_cls"], names=self.names, **kwargs)
+        return ap_per_class(
+            stats[key], stats["conf"], stats["pred_cls"], stats["target_cls"], names=self.names, **kwargs
+        )
 
     def process(self, save_dir: Path = Path("."), plot: bool = False, on_plot=None) -> dict[str, np.ndarray]:
         """Process predicted results for object detection and update metrics.
@@ -1066,24 +1251,22 @@ class DetMetrics(SimpleClass, DataExportMixin):
         Returns:
             (dict[str, np.ndarray]): Dictionary containing concatenated statistics arrays.
         """
-        stats = {k: np.concatenate(v, 0) for k, v in self.stats.items()}  # to numpy
+        if self.bins:  # sum per-rank histograms, padded to all classes
+            nc = len(self.names)
+            stats = {k: self._hist_sum(v + [np.zeros((nc, *v[0].shape[1:]))]) for k, v in self.stats.items() if v}
+        else:
+            stats = {k: np.concatenate(v, 0) for k, v in self.stats.items()}  # to numpy
         if not stats:
             return stats
-        results = ap_per_class(
-            stats["tp"],
-            stats["conf"],
-            stats["pred_cls"],
-            stats["target_cls"],
-            plot=plot,
-            save_dir=save_dir,
-            names=self.names,
-            on_plot=on_plot,
-            prefix="Box",
-        )[2:]
+        results = self._ap_per_class(stats, "tp", plot=plot, save_dir=save_dir, on_plot=on_plot, prefix="Box")[2:]
         self.box.nc = len(self.names)
         self.box.update(results)
-        self.nt_per_class = np.bincount(stats["target_cls"].astype(int), minlength=len(self.names))
-        self.nt_per_image = np.bincount(stats["target_img"].astype(int), minlength=len(self.names))
+        if self.bins:
+            self.nt_per_class = stats["target_cls"].astype(int)
+            self.nt_per_image = stats["target_img"].astype(int)
+        else:
+            self.nt_per_class = np.bincount(stats["target_cls"].astype(int), minlength=len(self.names))
+            self.nt_per_image = np.bincount(stats["target_img"].astype(int), minlength=len(self.names))
         return stats
 
     def clear_stats(self):
@@ -1197,13 +1380,14 @@ class SegmentMetrics(DetMetrics):
         summary: Generate a summarized representation of per-class segmentation metrics as a list of dictionaries.
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize a SegmentMetrics instance with a save directory, plot flag, and class names.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Number of confidence bins for streaming histogram mAP, or 0 for exact mAP.
         """
-        DetMetrics.__init__(self, names)
+        DetMetrics.__init__(self, names, bins)
         self.seg = Metric()
         self.task = "segment"
         self.stats["tp_m"] = []  # add additional stats for masks
@@ -1220,16 +1404,8 @@ class SegmentMetrics(DetMetrics):
             (dict[str, np.ndarray]): Dictionary containing concatenated statistics arrays.
         """
         stats = DetMetrics.process(self, save_dir, plot, on_plot=on_plot)  # process box stats
-        results_mask = ap_per_class(
-            stats["tp_m"],
-            stats["conf"],
-            stats["pred_cls"],
-            stats["target_cls"],
-            plot=plot,
-            on_plot=on_plot,
-            save_dir=save_dir,
-            names=self.names,
-            prefix="Mask",
+        results_mask = self._ap_per_class(
+            stats, "tp_m", plot=plot, on_plot=on_plot, save_dir=save_dir, prefix="Mask"
         )[2:]
         self.seg.nc = len(self.names)
         self.seg.update(results_mask)
@@ -1335,13 +1511,14 @@ class PoseMetrics(DetMetrics):
         summary: Generate a summarized representation of per-class pose metrics as a list of dictionaries.
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize the PoseMetrics class with directory path, class names, and plotting options.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Number of confidence bins for streaming histogram mAP, or 0 for exact mAP.
         """
-        super().__init__(names)
+        super().__init__(names, bins)
         self.pose = Metric()
         self.task = "pose"
         self.stats["tp_p"] = []  # add additional stats for pose
@@ -1358,16 +1535,8 @@ class PoseMetrics(DetMetrics):
             (dict[str, np.ndarray]): Dictionary containing concatenated statistics arrays.
         """
         stats = DetMetrics.process(self, save_dir, plot, on_plot=on_plot)  # process box stats
-        results_pose = ap_per_class(
-            stats["tp_p"],
-            stats["conf"],
-            stats["pred_cls"],
-            stats["target_cls"],
-            plot=plot,
-            on_plot=on_plot,
-            save_dir=save_dir,
-            names=self.names,
-            prefix="Pose",
+        results_pose = self._ap_per_class(
+            stats, "tp_p", plot=plot, on_plot=on_plot, save_dir=save_dir, prefix="Pose"
         )[2:]
         self.pose.nc = len(self.names)
         self.pose.update(results_pose)
@@ -1548,12 +1717,13 @@ class OBBMetrics(DetMetrics):
         https://arxiv.org/pdf/2106.06072.pdf
     """
 
-    def __init__(self, names: dict[int, str] = {}) -> None:
+    def __init__(self, names: dict[int, str] = {}, bins: int = 0) -> None:
         """Initialize an OBBMetrics instance with directory, plotting, and class names.
 
         Args:
             names (dict[int, str], optional): Dictionary of class names.
+            bins (int, optional): Number of confidence bins for streaming histogram mAP, or 0 for exact mAP.
         """
-        DetMetrics.__init__(self, names)
+        DetMetrics.__init__(self, names, bins)
         # TODO: probably remove task as well
         self.task = "obb"
@@ -1,5 +1,7 @@
 # Ultralytics 🚀 AGPL-3.0 License - https://ultralytics.com/license
 
+from __future__ import annotations
+
 import sys
 import time
 
@@ -26,6 +28,7 @@ def non_max_suppression(
     rotated: bool = False,
     end2end: bool = False,
     return_idxs: bool = False,
+    use_fast_nms: bool = False,
 ):
     """Perform non-maximum suppression (NMS) on prediction results.
 
@@ -49,6 +52,8 @@ def non_max_suppression(
         rotated (bool): Whether to handle Oriented Bounding Boxes (OBB).
         end2end (bool): Whether the model is end-to-end and doesn't require NMS.
         return_idxs (bool): Whether to return the indices of kept detections.
+        use_fast_nms (bool): Whether to use the loop-free matrix Fast-NMS kernel instead of exact iterative NMS. It needs
+            no torchvision and may suppress slightly more boxes.
 
     Returns:
         output (list[torch.Tensor]): List of detections per image with shape (num_boxes, 6 + num_masks) containing (x1,
@@ -85,6 +90,47 @@ def non_max_suppression(
     if not rotated:
         prediction[..., :4] = xywh2xyxy(prediction[..., :4])  # xywh to xyxy
 
+    if not rotated and not labels:  # whole batch in one NMS call, boxes kept apart by image and class offsets
+        bi, xk = xc.nonzero(as_tuple=True)  # image and prediction index of each candidate
+        box, cls, mask = prediction[bi, xk].split((4, nc, extra), 1)
+        if multi_label:
+            i, j = torch.where(cls > conf_thres)
+            x = torch.cat((box[i], cls[i, j, None], j[:, None].float(), mask[i]), 1)
+        else:  # best class only
+            conf, j = cls.max(1, keepdim=True)
+            i = torch.where(conf.view(-1) > conf_thres)[0]
+            x = torch.cat((box[i], conf[i], j[i].float(), mask[i]), 1)
+        bi, xk = bi[i], xk[i]
+
+        if classes is not None:
+            filt = (x[:, 5:6] == classes).any(1)
+            x, bi, xk = x[filt], bi[filt], xk[filt]
+        if x.shape[0] > max_nms:  # an image may have excess boxes, keep the max_nms most confident of each image
+            filt = rank_per_group(x[:, 4], bi, bs) < max_nms
+            x, bi, xk = x[filt], bi[filt], xk[filt]
+
+        scores = x[:, 4]
+        groups = bi if agnostic else bi * nc + x[:, 5].long()
+        if use_fast_nms:
+            i = TorchNMS.fast_nms(x[:, :4], scores, iou_thres, idxs=groups)
+        else:
+            boxes = x[:, :4] if bs * nc * max_wh < 2**20 else x[:, :4].double()  # float32 step <= 1/16 px
+            boxes = boxes + groups[:, None].to(boxes) * max_wh  # boxes (offset by image and class)
+            if "torchvision" in sys.modules:
+                import torchvision  # scope as slow import
+
+                i = torchvision.ops.nms(boxes, scores.to(boxes), iou_thres)
+            else:
+                i = TorchNMS.nms(boxes, scores, iou_thres)
+        i = i[rank_per_group(scores[i], bi[i], bs) < max_det]  # limit detections per image
+        i = i[bi[i].sort(stable=True)[1]]  # group by image, keeping descending confidence within each image
+        counts = torch.bincount(bi[i], minlength=bs).tolist()
+        output = list(x[i].split(counts))
+        if return_idxs:
+            keepi = [k if len(k) else k.view(0, 1) for k in xk[i].split(counts)]  # (0, 1) when empty like the loop
+            return output, keepi
+        return output
+
     t = time.time()
     output = [torch.zeros((0, 6 + extra), device=prediction.device)] * bs
     keepi = [torch.zeros((0, 1), device=prediction.device)] * bs  # to store the kept idxs
@@ -166,6 +212,30 @@ def non_max_suppression(
     return (output, keepi) if return_idxs else output
 
 
+def rank_per_group(scores: torch.Tensor, groups: torch.Tensor, n: int) -> torch.Tensor:
+    """Rank each element by descending score within its group.
+
+    Args:
+        scores (torch.Tensor): Scores with shape (N,).
+        groups (torch.Tensor): Group indices in [0, n) with shape (N,), e.g. the image index of each box.
+        n (int): Number of groups.
+
+    Returns:
+        (torch.Tensor): Rank of each element within its group with shape (N,), 0 for the highest score.
+
+    Examples:
+        >>> rank_per_group(torch.tensor([0.2, 0.9, 0.5]), torch.tensor([0, 0, 1]), 2)
+        tensor([1, 0, 0])
+    """
+    order = scores.argsort(descending=True)
+    order = order[groups[order].sort(stable=True)[1]]  # grouped, descending score within each group
+    counts = torch.bincount(groups, minlength=n)
+    starts = counts.cumsum(0) - counts
+    rank = torch.empty_like(order)
+    rank[order] = torch.arange(len(order), device=order.device) - starts[groups[order]]
+    return rank
+
+
 class TorchNMS:
     """Ultralytics custom NMS implementation optimized for YOLO.
 
@@ -191,6 +261,7 @@ class TorchNMS:
         use_triu: bool = True,
         iou_func=box_iou,
         exit_early: bool = True,
+        idxs: torch.Tensor | None = None,
     ) -> torch.Tensor:
         """Fast-NMS implementation from https://arxiv.org/pdf/1904.02689 using upper triangular matrix operations.
 
@@ -201,6 +272,8 @@ class TorchNMS:
             use_triu (bool): Whether to use torch.triu operator for upper triangular matrix operations.
             iou_func (callable): Function to compute IoU between boxes.
             exit_early (bool): Whether to exit early if there are no boxes.
+            idxs (torch.Tensor, optional): Group indices with shape (N,), e.g. image or class. Boxes in different
+                groups never suppress each other, without offsetting coordinates.
 
         Returns:
             (torch.Tensor): Indices of boxes to keep after NMS.
@@ -217,6 +290,9 @@ class TorchNMS:
         sorted_idx = torch.argsort(scores, descending=True)
         boxes = boxes[sorted_idx]
         ious = iou_func(boxes, boxes)
+        if idxs is not None:
+            idxs = idxs[sorted_idx]
+            ious = ious * (idxs[:, None] == idxs[None])
         if use_triu:
             ious = ious.triu_(diagonal=1)
             # NOTE: handle the case when len(boxes) hence exportable by eliminating if-else condition
@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 import warnings
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -359,6 +360,73 @@ class Annotator:
                     lineType=cv2.LINE_AA,
                 )
 
+    def box_labels(self, boxes, labels: list, colors: list, txt_color: tuple = (255, 255, 255)):
+        """Draw many labelled bounding boxes at once, all boxes first and then all labels on top of them.
+
+        With cv2, all boxes of one color are drawn by a single `cv2.polylines` call and each label is pasted from a
+        cached bitmap by array slicing instead of being rendered again. Unlike calling `box_label` per box, a later box
+        never covers the label of an earlier one; labels still overlap each other in order. PIL falls back to
+        `box_label` per box.
+
+        Args:
+            boxes (np.ndarray): Boxes with shape (N, 4) in xyxy format or polygons with shape (N, 4, 2).
+            labels (list[str | None]): Label text per box, None or empty for no label.
+            colors (list[tuple]): Box color per box (B, G, R).
+            txt_color (tuple, optional): The color of the text (R, G, B).
+
+        Examples:
+            >>> annotator = Annotator(cv2.imread("test.png"))
+            >>> boxes = np.array([[10, 20, 30, 40], [50, 60, 90, 100]])
+            >>> annotator.box_labels(boxes, ["person 0.91", "car 0.65"], [(255, 0, 0), (0, 0, 255)])
+        """
+        boxes = np.asarray(boxes)
+        if self.pil:
+            for box, label, color in zip(boxes.tolist(), labels, colors):
+                self.box_label(box, label, color, txt_color)
+            return
+        if boxes.ndim == 2:  # xyxy to corner polygons
+            boxes = boxes[:, [[0, 1], [2, 1], [2, 3], [0, 3]]]
+        polygons = np.round(boxes).astype(np.int32)
+        groups = {}
+        for polygon, color in zip(polygons, colors):
+            groups.setdefault(color, []).append(polygon)
+        for color, group in groups.items():
+            cv2.polylines(self.im, group, True, color, self.lw, cv2.LINE_AA)
+        ih, iw = self.im.shape[:2]
+        for polygon, label, color in zip(polygons, labels, colors):
+            if not label:
+                continue
+            bitmap = self.label_bitmap(label, color, self.get_txt_color(color, txt_color), self.sf, self.tf)
+            h, w = bitmap.shape[:2]
+            x, y = min(int(polygon[0, 0]), iw - w), int(polygon[0, 1])
+            y = y - h if y >= h else y  # label above the box if it fits, else inside
+            x1, y1, x2, y2 = max(x, 0), max(y, 0), min(x + w, iw), min(y + h, ih)
+            if x2 > x1 and y2 > y1:
+                self.im[y1:y2, x1:x2] = bitmap[y1 - y : y2 - y, x1 - x : x2 - x]
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def label_bitmap(label: str, color: tuple, txt_color: tuple, sf: float, tf: int) -> np.ndarray:
+        """Render a filled label box with text once and cache it for reuse across boxes and frames.
+
+        Args:
+            label (str): The text label.
+            color (tuple): The background color (B, G, R).
+            txt_color (tuple): The color of the text.
+            sf (float): Font scale.
+            tf (int): Font thickness.
+
+        Returns:
+            (np.ndarray): The label image with shape (h, w, 3). Do not modify, it is shared.
+        """
+        w, h = cv2.getTextSize(label, 0, fontScale=sf, thickness=tf)[0]  # text width, height
+        h += 3  # add pixels to pad text
+        bitmap = np.empty((h, w, 3), dtype=np.uint8)
+        bitmap[:] = color
+        cv2.putText(bitmap, label, (0, h - 2), 0, sf, txt_color, thickness=tf, lineType=cv2.LINE_AA)
+        bitmap.flags.writeable = False
+        return bitmap
+
     def masks(self, masks, colors, im_gpu: torch.Tensor = None, alpha: float = 0.5, retina_masks: bool = False):
         """Plot masks on image.
 
@@ -904,6 +904,71 @@ class EarlyStopping:
         return stop
 
 
+class ActivationCapture:
+    """Context manager that records the outputs of selected modules during forward passes.
+
+    Forward hooks are registered on entry and removed on exit, so a single `predict()` call inside the context returns
+    both the usual Results and the intermediate activations of the hooked layers, with no second forward pass. Outputs
+    can be reduced over channels and downsampled inside the hook, on the model device, so only the small result is kept.
+
+    Attributes:
+        modules (dict[Any, nn.Module]): Modules to hook, keyed by the name used in `activations`.
+        reduce (str | callable | None): Channel reduction applied in the hook, "mean", "max" or a callable.
+        size (int | tuple[int, int] | None): Spatial size to average-pool captured outputs down to.
+        activations (dict[Any, torch.Tensor]): Detached output of each hooked module from the latest forward pass.
+
+    Examples:
+        >>> model = YOLO("yolo11n.pt")
+        >>> with model.capture_activations([9]) as capture:
+        ...     results = model.predict("bus.jpg")
+        >>> capture.activations[9].shape
+        torch.Size([1, 256, 20, 15])
+    """
+
+    def __init__(self, modules: dict[Any, nn.Module], reduce: str | callable | None = None, size=None):
+        """Initialize the capture with the modules to hook.
+
+        Args:
+            modules (dict[Any, nn.Module]): Mapping of capture name to module.
+            reduce (str | callable, optional): "mean" or "max" over the channel dimension, or a callable applied to the
+                output tensor.
+            size (int | tuple[int, int], optional): Output spatial size for adaptive average pooling.
+        """
+        assert reduce is None or callable(reduce) or reduce in {"mean", "max"}, f"invalid reduce='{reduce}'"
+        self.modules = modules
+        self.reduce = reduce
+        self.size = size
+        self.activations = {}
+        self._handles = []
+
+    def __enter__(self):
+        """Register forward hooks on all modules."""
+        self.activations = {}
+        for key, m in self.modules.items():
+            self._handles.append(m.register_forward_hook(functools.partial(self._hook, key)))
+        return self
+
+    def __exit__(self, *args):
+        """Remove all registered forward hooks."""
+        for h in self._handles:
+            h.remove()
+        self._handles.clear()
+
+    def _hook(self, key, module, input, output):
+        """Store the detached, optionally reduced and resized output of a hooked module."""
+        if isinstance(output, torch.Tensor):
+            output = output.detach()
+            if self.reduce == "mean":
+                output = output.mean(1, keepdim=True)
+            elif self.reduce == "max":
+                output = output.amax(1, keepdim=True)
+            elif self.reduce is not None:
+                output = self.reduce(output)
+            if self.size is not None:
+                output = F.adaptive_avg_pool2d(output, self.size)
+        self.activations[key] = output
+
+
 def attempt_compile(
     model: torch.nn.Module,
     device: torch.device,
@@ -1,4 +1,3 @@
-import torch
 import cv2
 import numpy as np
 from ultralytics import YOLO
@@ -11,17 +10,9 @@ BASELINE_WEIGHTS = r"Pothole_Baseline_Project/exp_baseline/weights/best.pt"
 CBAM_WEIGHTS = r"Pothole_CBAM_Project/exp_cbam/weights/best.pt"
 OUTPUT_PATH = "cbam_attention_comparison.jpg"
 
-class ActivationHook:
-    def __init__(self):
-        self.activation = None
-
-    def hook_fn(self, module, input, output):
-        self.activation = output.detach()
-
 def generate_heatmap(activation, img_size):
-    # activation: (1, C, H, W)
-    # Simple Mean Activation Mapping
-    heatmap = torch.mean(activation, dim=1).squeeze().cpu().numpy()
+    # activation: (1, H, W) channel-mean map, reduced on-device by the feature tap
+    heatmap = activation.squeeze().cpu().numpy()
     
     # Normalize to [0, 255]
     heatmap = np.maximum(heatmap, 0)
@@ -51,7 +42,6 @@ def main():
     # --- Process Baseline ---
     print("Loading Baseline Model...")
     model_baseline = YOLO(BASELINE_WEIGHTS)
-    hook_baseline = ActivationHook()
     
     # Baseline SPPF is typically Layer 9
     # We target the SPPF module directly to be safe
@@ -62,11 +52,11 @@ def main():
             break
             
     if target_layer_baseline:
-        handle_baseline = target_layer_baseline.register_forward_hook(hook_baseline.hook_fn)
-        model_baseline(IMAGE_PATH, verbose=False)
-        handle_baseline.remove()
+        # Simple Mean Activation Mapping, computed inside the hook
+        model_baseline.add_feature_tap("sppf", target_layer_baseline, reduce="mean")
+        result = model_baseline(IMAGE_PATH, verbose=False)[0]
         
-        heatmap_baseline = generate_heatmap(hook_baseline.activation, (img_w, img_h))
+        heatmap_baseline = generate_heatmap(result.features["sppf"], (img_w, img_h))
         vis_baseline = overlay_heatmap(img, heatmap_baseline)
     else:
         print("Warning: SPPF layer not found in Baseline model.")
@@ -75,7 +65,6 @@ def main():
     # --- Process CBAM ---
     print("Loading CBAM Model...")
     model_cbam = YOLO(CBAM_WEIGHTS)
-    hook_cbam = ActivationHook()
     
     # CBAM Model has CBAM at Layer 9 and SPPF at Layer 10
     # We want to see the effect AFTER CBAM and SPPF (input to head)
@@ -86,11 +75,10 @@ def main():
             break
             
     if target_layer_cbam:
-        handle_cbam = target_layer_cbam.register_forward_hook(hook_cbam.hook_fn)
-        model_cbam(IMAGE_PATH, verbose=False)
-        handle_cbam.remove()
+        model_cbam.add_feature_tap("sppf", target_layer_cbam, reduce="mean")
+        result = model_cbam(IMAGE_PATH, verbose=False)[0]
         
-        heatmap_cbam = generate_heatmap(hook_cbam.activation, (img_w, img_h))
+        heatmap_cbam = generate_heatmap(result.features["sppf"], (img_w, img_h))
         vis_cbam = overlay_heatmap(img, heatmap_cbam)
     else:
         print("Warning: SPPF layer not found in CBAM model.")
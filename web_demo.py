@@ -21,157 +21,96 @@ from PIL import Image
 import numpy as np
 import subprocess
 import shutil
+import tempfile
+import glob
 
-# ================= 热力图工具类 =================
-class ActivationHook:
-    def __init__(self):
-        self.activation = None
+from compare_engine import HEATMAP_TAP, DualModelComparator, HeatmapRenderer, register_heatmap_tap
+from model_registry import ModelRegistry
+from ultralytics.engine.batcher import MicroBatcher
 
-    def hook_fn(self, module, input, output):
-        self.activation = output.detach()
+# ================= 热力图工具 =================
+heatmap_renderer = HeatmapRenderer(alpha=0.4)
 
-def generate_heatmap(activation, img_size):
-    # activation: (1, C, H, W)
-    if activation is None:
-        print("⚠️ Heatmap Error: Activation is None")
-        return None
-        
-    if activation.numel() == 0:
-        print("⚠️ Heatmap Error: Activation is empty")
-        return None
-
-    # Debug activation stats
-    # print(f"DEBUG: Activation shape: {activation.shape}, Range: [{activation.min():.4f}, {activation.max():.4f}]")
-
-    # 1. Pre-process: Clamp negative values to 0 (SiLU/ReLU outputs)
-    # This prevents negative activations from cancelling out positive ones during averaging
-    activation = activation.clamp(min=0)
-
-    # 2. Aggregation: Use Mean of activations (or could use Max)
-    heatmap = torch.mean(activation, dim=1).squeeze()
-    
-    # 3. Move to CPU
-    heatmap = heatmap.cpu().numpy()
-    
-    # 4. Normalization
-    max_val = np.max(heatmap)
-    min_val = np.min(heatmap)
-    
-    # Check if we have a valid range
-    if max_val <= 0:
-        # This implies no positive activation at all in the entire layer
-        # print(f"⚠️ Heatmap Warning: No positive activation (Max={max_val}).")
-        return None
-        
-    if max_val - min_val == 0:
-        heatmap = np.zeros_like(heatmap)
-    else:
-        heatmap = (heatmap - min_val) / (max_val - min_val)
-        
-    heatmap = (heatmap * 255).astype(np.uint8)
-    heatmap = cv2.resize(heatmap, img_size)
-    heatmap_color = cv2.applyColorMap(heatmap, cv2.COLORMAP_JET)
-    return heatmap_color
-
-def get_heatmap_for_model(model, pil_img):
+def predict_with_heatmap(batcher, pil_img):
+    """
+    单次前向推理，同时得到检测结果与热力图 (热力图由模型上注册的特征抽头随 Results 返回)
+    :param batcher: 对应模型的 MicroBatcher (并发请求合批推理)
+    :param pil_img: 输入图片 (PIL.Image)
+    :return: (Results, 热力图叠加图 RGB)
+    """
     # Ensure consistent input format (Numpy BGR)
-    img_rgb = np.array(pil_img)
+    img_rgb = np.array(pil_img.convert("RGB"))
     img_bgr = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR)
-    img_h, img_w = img_rgb.shape[:2]
-    
-    hook = ActivationHook()
-    target_layer = None
-    layer_name = "Unknown"
-    
-    # --- Robust Layer Finding (Index Based) ---
-    try:
-        if hasattr(model.model, 'model'):
-            model_layers = model.model.model
-            
-            # Check for CBAM model heuristic
-            is_cbam_model = False
-            for m in model_layers:
-                if 'CBAM' in m.__class__.__name__:
-                    is_cbam_model = True
-                    break
-            
-            if is_cbam_model:
-                # CBAM Model: Layer 9 is CBAM. We want to hook CBAM layer.
-                if len(model_layers) > 9:
-                    target_layer = model_layers[9]
-                    layer_name = f"Layer 9 ({target_layer.__class__.__name__})"
-                elif len(model_layers) > 10:
-                    # Fallback to SPPF if Layer 9 is somehow not right (unlikely based on yaml)
-                    target_layer = model_layers[10]
-                    layer_name = f"Layer 10 ({target_layer.__class__.__name__})"
-            else:
-                # Baseline Model: Layer 9 is SPPF.
-                if len(model_layers) > 9:
-                    target_layer = model_layers[9]
-                    layer_name = f"Layer 9 ({target_layer.__class__.__name__})"
-                    
-    except Exception as e:
-        print(f"Error accessing model layers: {e}")
-
-    # Fallback: Search by name
-    if target_layer is None:
-        for m in model.model.modules():
-            if m.__class__.__name__ == 'SPPF':
-                target_layer = m
-                layer_name = "SPPF (Module Search)"
-                break
-
-    # Refine target for CBAM: If it has spatial_attention, hook that for a cleaner heatmap
-    if target_layer and hasattr(target_layer, 'spatial_attention'):
-        target_layer = target_layer.spatial_attention
-        layer_name += " (SpatialAttention)"
-
     heatmap_overlay = img_rgb # Default to original image
     
-    if target_layer:
-        # print(f"DEBUG: Hooking {layer_name}")
-        handle = target_layer.register_forward_hook(hook.hook_fn)
-        
-        try:
-            # Use BGR numpy array for inference
-            model.predict(img_bgr, verbose=False, conf=0.25)
-        except Exception as e:
-            print(f"Inference failed: {e}")
-            
-        handle.remove()
-        
-        if hook.activation is not None:
-            heatmap_color = generate_heatmap(hook.activation, (img_w, img_h))
-            if heatmap_color is not None:
-                # heatmap_color is BGR. Convert to RGB for display
-                heatmap_rgb = cv2.cvtColor(heatmap_color, cv2.COLOR_BGR2RGB)
-                heatmap_overlay = cv2.addWeighted(img_rgb, 0.6, heatmap_rgb, 0.4, 0)
-            else:
-                print(f"DEBUG: Heatmap generation returned None for {layer_name}")
-        else:
-            print(f"DEBUG: No activation captured for {layer_name}")
+    # 检测与特征捕获共用同一次前向传播
+    result = batcher(img_bgr)
+    
+    activation = result.features.get(HEATMAP_TAP)
+    if activation is not None:
+        # 渲染结果为 BGR，转为 RGB 显示
+        heatmap_overlay = heatmap_renderer(activation[None], [img_bgr])[0][..., ::-1]
     else:
-        print("DEBUG: No target layer found for heatmap")
+        print("DEBUG: No activation captured for heatmap")
         
-    return heatmap_overlay
+    return result, heatmap_overlay
 
 # ================= 配置 =================
 # 权重路径
 MODEL_PATH_BASELINE = "Pothole_Baseline_Project/exp_baseline/weights/best.pt"
 MODEL_PATH_CBAM = "Pothole_CBAM_Project/exp_cbam/weights/best.pt"
+# 视频对比时每个模型单次前向处理的帧数
+VIDEO_BATCH_SIZE = 8
+# 视频对比时每个坑洼的去重记录 (最佳帧截图、最高置信度、面积统计、出现帧范围)，每个请求写入各自的临时目录
+# .npz 按块写入 <名称>_00000.npz、<名称>_00001.npz ...
+RECORD_FILES = ("records_baseline.npz", "records_cbam.npz")
+
+# 每个模型的实例数 (同一模型可同时处理的请求数)
+POOL_SIZE = 2
+# 图片检测微批处理: 并发请求最多等待 BATCH_WAIT 秒凑成一批，每批最多 MAX_BATCH 张，一次前向完成
+MAX_BATCH = 8
+BATCH_WAIT = 0.005
+# 允许同时处理的图片请求数 (Gradio 默认每个事件同一时刻只处理 1 个请求，无法合批)
+CONCURRENCY_LIMIT = MAX_BATCH * POOL_SIZE
 
 print(f"⏳ 正在加载模型...")
+# 模型注册表: 加载 + 融合 + 注册热力图特征抽头 + 预热只做一次，best.pt 更新后自动热重载
+registry = ModelRegistry(pool_size=POOL_SIZE, setup=register_heatmap_tap)
 try:
     print(f"   - 加载基线模型: {MODEL_PATH_BASELINE}")
-    model_baseline = YOLO(MODEL_PATH_BASELINE)
+    registry.register("baseline", MODEL_PATH_BASELINE)
     print(f"   - 加载改进模型 (CBAM): {MODEL_PATH_CBAM}")
-    model_cbam = YOLO(MODEL_PATH_CBAM)
+    registry.register("cbam", MODEL_PATH_CBAM)
     print("✅ 模型加载成功！")
 except Exception as e:
     print(f"❌ 模型加载失败: {e}")
     print("请检查路径是否正确，或者是否已经运行了 train_pothole.py 进行训练。")
     sys.exit(1)
 
+class RegistryModel:
+    """将注册表中的模型包装为 MicroBatcher 可用的对象: 每批推理时借出一个实例，热重载后自动使用新模型"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def predict(self, *args, **kwargs):
+        with registry.acquire(self.name) as model:
+            return model.predict(*args, **kwargs)
+
+# 每个模型一个微批处理器，POOL_SIZE 个工作线程各借用池中的一个实例，多个批次可同时推理
+batchers = {name: MicroBatcher(RegistryModel(name), max_batch=MAX_BATCH, max_wait=BATCH_WAIT, workers=POOL_SIZE,
+                               conf=0.25)
+            for name in ("baseline", "cbam")}
+
+def reload_models():
+    """手动热重载全部模型，返回状态信息"""
+    for name in list(registry.entries):
+        try:
+            registry.reload(name)
+        except Exception as e:
+            return f"❌ {name} 重载失败: {e}\n{registry.status()}"
+    return f"✅ 重载完成\n{registry.status()}"
+
 def detect_pothole(image):
     """
     执行路面坑洼检测 (对比模式)
@@ -181,26 +120,18 @@ def detect_pothole(image):
     if image is None:
         return None, None, None, None, "请先上传图片"
 
-    # 1. 基线模型推理
-    results_baseline = model_baseline.predict(image, conf=0.25)
-    res_base = results_baseline[0]
+    # 1. 基线模型推理 (检测 + 热力图，单次前向)
+    res_base, heatmap_base = predict_with_heatmap(batchers["baseline"], image)
     plot_base_bgr = res_base.plot()
     plot_base_rgb = plot_base_bgr[..., ::-1] # BGR to RGB
     count_base = len(res_base.boxes)
-    
-    # 生成基线热力图
-    heatmap_base = get_heatmap_for_model(model_baseline, image)
 
-    # 2. 改进模型推理
-    results_cbam = model_cbam.predict(image, conf=0.25)
-    res_cbam = results_cbam[0]
+    # 2. 改进模型推理 (检测 + 热力图，单次前向)
+    res_cbam, heatmap_cbam = predict_with_heatmap(batchers["cbam"], image)
     plot_cbam_bgr = res_cbam.plot()
     plot_cbam_rgb = plot_cbam_bgr[..., ::-1] # BGR to RGB
     count_cbam = len(res_cbam.boxes)
     
-    # 生成改进热力图
-    heatmap_cbam = get_heatmap_for_model(model_cbam, image)
-    
     info = (f"✅ 检测完成！\n"
             f"🔹 基线模型检测到: {count_base} 个目标\n"
             f"🔸 改进模型检测到: {count_cbam} 个目标")
@@ -213,147 +144,25 @@ def detect_video(video_path):
     """
     if video_path is None:
         return None, "请上传视频"
-        
-    cap = cv2.VideoCapture(video_path)
-    
-    # 临时文件路径
-    temp_raw_combined = "temp_raw_combined.mp4"
-    output_path_combined = "output_video_combined.mp4"
-    
-    fps = int(cap.get(cv2.CAP_PROP_FPS))
-    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    # 临时文件路径 (每个请求独立目录，POOL_SIZE > 1 时并发的视频请求不会互相覆盖)
+    work_dir = tempfile.mkdtemp(prefix="pothole_video_")
+    temp_raw_combined = os.path.join(work_dir, "temp_raw_combined.mp4")
+    output_path_combined = os.path.join(work_dir, "output_video_combined.mp4")
+    record_files = tuple(os.path.join(work_dir, f) for f in RECORD_FILES)
     
     # 输出视频布局: 2x2 网格
     # Top Left: Baseline Detection | Top Right: CBAM Detection
     # Bot Left: Baseline Heatmap   | Bot Right: CBAM Heatmap
-    new_width = width * 2
-    new_height = height * 2
-    
-    # OpenCV 写入临时文件
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(temp_raw_combined, fourcc, fps, (new_width, new_height))
-    
-    frame_count = 0
-    total_detections_base = 0
-    total_detections_cbam = 0
-    
-    # 准备 Hook
-    hook_base = ActivationHook()
-    hook_cbam = ActivationHook()
-    
-    layer_base = None
-    layer_cbam = None
-    
-    # Try to hook Layer 9 (SPPF for Base, CBAM for CBAM-Model)
-    target_index = 9
-    
-    try:
-        if hasattr(model_baseline.model, 'model'):
-            # Baseline: Layer 9 is SPPF
-            if len(model_baseline.model.model) > target_index:
-                layer_base = model_baseline.model.model[target_index]
-        
-        if hasattr(model_cbam.model, 'model'):
-             # CBAM Model: Layer 9 is CBAM
-             if len(model_cbam.model.model) > target_index:
-                layer_cbam = model_cbam.model.model[target_index]
-    except:
-        pass
-
-    # Fallback search if index failed
-    if layer_base is None:
-        for m in model_baseline.model.modules():
-            if m.__class__.__name__ == 'SPPF': # Fallback to SPPF
-                layer_base = m
-                break
-            
-    if layer_cbam is None:
-        for m in model_cbam.model.modules():
-            if m.__class__.__name__ == 'SPPF':
-                layer_cbam = m
-                break
-            
-    # 注册 Hook
-    handle_base = None
-    if layer_base:
-        if hasattr(layer_base, 'spatial_attention'):
-             layer_base = layer_base.spatial_attention
-        handle_base = layer_base.register_forward_hook(hook_base.hook_fn)
-        
-    handle_cbam = None
-    if layer_cbam:
-        if hasattr(layer_cbam, 'spatial_attention'):
-             layer_cbam = layer_cbam.spatial_attention
-        handle_cbam = layer_cbam.register_forward_hook(hook_cbam.hook_fn)
-    
-    print("🔄 正在逐帧处理视频 (合并模式 + 热力图)...")
-    try:
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            # 1. Baseline Inference
-            # frame is BGR
-            results_base = model_baseline.predict(frame, conf=0.25, verbose=False)
-            annotated_frame_base = results_base[0].plot()
-            total_detections_base += len(results_base[0].boxes)
-            
-            # Generate Baseline Heatmap
-            heatmap_vis_base = frame.copy() # fallback
-            if hook_base.activation is not None:
-                heatmap = generate_heatmap(hook_base.activation, (width, height))
-                if heatmap is not None:
-                    # heatmap is BGR, frame is BGR
-                    heatmap_vis_base = cv2.addWeighted(frame, 0.5, heatmap, 0.5, 0)
-
-            # 添加标签
-            cv2.putText(annotated_frame_base, "Baseline Det", (30, 50), cv2.FONT_HERSHEY_SIMPLEX, 
-                        1.2, (0, 0, 255), 3, cv2.LINE_AA)
-            cv2.putText(heatmap_vis_base, "Baseline Feature", (30, 50), cv2.FONT_HERSHEY_SIMPLEX, 
-                        1.2, (0, 0, 255), 3, cv2.LINE_AA)
-
-            # 2. CBAM Inference
-            results_cbam = model_cbam.predict(frame, conf=0.25, verbose=False)
-            annotated_frame_cbam = results_cbam[0].plot()
-            total_detections_cbam += len(results_cbam[0].boxes)
-            
-            # Generate CBAM Heatmap
-            heatmap_vis_cbam = frame.copy() # fallback
-            if hook_cbam.activation is not None:
-                heatmap = generate_heatmap(hook_cbam.activation, (width, height))
-                if heatmap is not None:
-                    heatmap_vis_cbam = cv2.addWeighted(frame, 0.5, heatmap, 0.5, 0)
-            
-            # 添加标签
-            cv2.putText(annotated_frame_cbam, "CBAM Det", (30, 50), cv2.FONT_HERSHEY_SIMPLEX, 
-                        1.2, (0, 255, 0), 3, cv2.LINE_AA)
-            cv2.putText(heatmap_vis_cbam, "CBAM Attention", (30, 50), cv2.FONT_HERSHEY_SIMPLEX, 
-                        1.2, (0, 255, 0), 3, cv2.LINE_AA)
-            
-            # 3. 合并画面 (2x2 Grid)
-            # Top Row
-            top_row = np.hstack((annotated_frame_base, annotated_frame_cbam))
-            # Bottom Row
-            bot_row = np.hstack((heatmap_vis_base, heatmap_vis_cbam))
-            # Full Grid
-            combined_frame = np.vstack((top_row, bot_row))
-            
-            out.write(combined_frame)
-            
-            frame_count += 1
-            if frame_count % 10 == 0:
-                print(f"   已处理 {frame_count} 帧...", end="\r")
-    finally:
-        # 清理 Hook
-        if handle_base:
-            handle_base.remove()
-        if handle_cbam:
-            handle_cbam.remove()
-        
-    cap.release()
-    out.release()
+    # 视频只解码一次，每个模型按批次推理，写入在后台线程完成
+    print("🔄 正在批量处理视频 (合并模式 + 热力图)...")
+    with registry.acquire("baseline") as model_baseline, registry.acquire("cbam") as model_cbam:
+        comparator = DualModelComparator(model_baseline, model_cbam, batch_size=VIDEO_BATCH_SIZE, conf=0.25,
+                                         track=True)
+        stats = comparator.run(video_path, temp_raw_combined, record_files=record_files)
+    frame_count = stats["frames"]
+    total_detections_base, total_detections_cbam = stats["detections"]
+    unique_base, unique_cbam = stats["tracks"]
     print(f"\n✅ 视频推理完成，共 {frame_count} 帧。")
     
     # 转码函数
@@ -384,10 +193,12 @@ def detect_video(video_path):
     if not shutil.which("ffmpeg"):
          msg_status = "未安装FFmpeg，无法预览，请下载观看"
 
+    record_chunks = sorted(glob.glob(os.path.join(work_dir, "records_*_*.npz")))  # 实际写入的记录分块
     info = (f"✅ 视频处理完成！\n"
             f"共处理 {frame_count} 帧。\n"
-            f"🔹 基线模型累计检测: {total_detections_base} 次\n"
-            f"🔸 改进模型累计检测: {total_detections_cbam} 次\n"
+            f"🔹 基线模型: {unique_base} 个坑洼 (逐帧累计检测 {total_detections_base} 次)\n"
+            f"🔸 改进模型: {unique_cbam} 个坑洼 (逐帧累计检测 {total_detections_cbam} 次)\n"
+            f"📁 坑洼记录: {', '.join(record_chunks) or '无'}\n"
             f"ℹ️ 状态: {msg_status}")
 
     return final_video, info
@@ -411,13 +222,15 @@ def detect_webcam(image):
     start_time = time.time()
     
     # 1. 基线模型推理
-    results_base = model_baseline.predict(image, conf=0.25, verbose=False)
+    with registry.acquire("baseline") as model_baseline:
+        results_base = model_baseline.predict(image, conf=0.25, verbose=False)
     res_base = results_base[0]
     plot_base_bgr = res_base.plot()
     count_base = len(res_base.boxes)
     
     # 2. 改进模型推理
-    results_cbam = model_cbam.predict(image, conf=0.25, verbose=False)
+    with registry.acquire("cbam") as model_cbam:
+        results_cbam = model_cbam.predict(image, conf=0.25, verbose=False)
     res_cbam = results_cbam[0]
     plot_cbam_bgr = res_cbam.plot()
     count_cbam = len(res_cbam.boxes)
@@ -472,7 +285,14 @@ with gr.Blocks(title="路面坑洼检测模型对比系统") as demo:
 
                     output_text = gr.Textbox(label="检测统计信息")
                     
-            run_btn.click(fn=detect_pothole, inputs=input_img, outputs=[output_base, output_cbam, heatmap_base, heatmap_cbam, output_text])
+            # Gradio 4.x 支持按事件设置并发数 concurrency_limit
+            try:
+                run_btn.click(fn=detect_pothole, inputs=input_img, outputs=[output_base, output_cbam, heatmap_base, heatmap_cbam, output_text],
+                              concurrency_limit=CONCURRENCY_LIMIT)
+            except TypeError:
+                # Fallback for older Gradio versions (通过队列的全局并发数实现)
+                run_btn.click(fn=detect_pothole, inputs=input_img, outputs=[output_base, output_cbam, heatmap_base, heatmap_cbam, output_text])
+                demo.queue(concurrency_count=CONCURRENCY_LIMIT)
             
             gr.Examples(
                 examples=["datasets/New_pothole_detection.v2i.yolov8/test/images/1_jpg.rf.a9cc87ae30331b83ba2e75fddcf1ebd5.jpg"],
@@ -536,6 +356,12 @@ with gr.Blocks(title="路面坑洼检测模型对比系统") as demo:
                 # Fallback for older Gradio versions
                 input_webcam.change(fn=detect_webcam, inputs=input_webcam, outputs=[output_webcam, webcam_info], show_progress="hidden")
 
+        with gr.TabItem("⚙️ 模型管理"):
+            gr.Markdown("模型在启动时加载并预热；`best.pt` 更新后会在下一次请求时自动后台重载，也可以手动重载。")
+            model_status = gr.Textbox(label="模型状态", value=registry.status(), lines=4)
+            reload_btn = gr.Button("重新加载模型")
+            reload_btn.click(fn=reload_models, inputs=None, outputs=model_status)
+
 if __name__ == "__main__":
     print("🚀 启动 Web 服务...")
     # launch(inbrowser=True) 会自动打开浏览器